@@ -3,7 +3,9 @@ import base_struct as bs
 import glm
 import model
 import moderngl as mgl
+import os
 import pygame as pg
+import vbo_constructor as vc
 
 class Advanced_Struct:
     """Class representing all the advanced struct in the game
@@ -12,19 +14,22 @@ class Advanced_Struct:
     def __init__(self, base_struct: bs.Base_Struct) -> None:
         """Create an advanced struct class
         """
+        self.all_lods = {}
+        self.all_programs = {}
         self.all_textures = {}
+        self.all_vaos = {}
         self.all_vbos = {}
         self.base_struct = base_struct
         self.camera = bs.Camera(self.get_base_struct())
         self.graphic = {"chair": "cube", "cercle": "triangle", "cube": "cube", "cylinder": "cube", "plan": "triangle", "square": "triangle", "table": "cube"}
 
-        cercle_vbo = model.Loaded_VBO(self.get_base_struct(), "vbos/polygon20.vbo")
-        chair_vbo = model.Loaded_VBO(self.get_base_struct(), "vbos/chair.vbo")
+        cercle_vbo = self.load_file_vbo("vbos/polygon20.vbo")
+        chair_vbo = self.load_file_vbo("vbos/chair.vbo")
         cube_vbo = model.Cube_VBO(self.get_base_struct())
-        cylinder_vbo = model.Loaded_VBO(self.get_base_struct(), "vbos/polygon_3d20.vbo")
+        cylinder_vbo = self.load_file_vbo("vbos/polygon_3d20.vbo")
         plan_vbo = model.Triangle_VBO(self.get_base_struct())
         square_vbo = model.Square_VBO(self.get_base_struct())
-        table_vbo = model.Loaded_VBO(self.get_base_struct(), "vbos/table.vbo")
+        table_vbo = self.load_file_vbo("vbos/table.vbo")
 
         self.all_vbos["cercle"] = cercle_vbo
         self.all_vbos["chair"] = chair_vbo
@@ -34,6 +39,49 @@ class Advanced_Struct:
         self.all_vbos["square"] = square_vbo
         self.all_vbos["table"] = table_vbo
 
+        # Less detailed meshes generated for the far polygons
+        self.register_lod("cercle", [cercle_vbo, vc.polygon_constructor(1, 10).get_vbo(self.get_base_struct()), vc.polygon_constructor(1, 6).get_vbo(self.get_base_struct())], [12, 30])
+        self.register_lod("cylinder", [cylinder_vbo, vc.polygon_3d_constructor(1, 10).get_vbo(self.get_base_struct()), vc.polygon_3d_constructor(1, 6).get_vbo(self.get_base_struct())], [12, 30])
+
+        self.program_references = {}
+        self.vao_references = {}
+
+    def destroy(self) -> None:
+        """Destroy every VAO, program, texture and VBO of the advanced struct
+        """
+        for vao in list(self.get_all_vaos().values()):
+            vao.destroy()
+        for program in list(self.get_all_programs().values()):
+            program.destroy()
+        for texture in list(self.get_all_textures().values()):
+            texture.destroy()
+        for vbo in list(self.get_all_vbos().values()):
+            vbo.destroy()
+        self.get_all_lods().clear()
+        self.get_all_vaos().clear()
+        self.get_all_programs().clear()
+        self.get_all_textures().clear()
+        self.get_all_vbos().clear()
+        self.get_base_struct().get_texture_loader().destroy()
+        self.program_references.clear()
+        self.vao_references.clear()
+
+    def get_all_lods(self) -> dict:
+        """Return a dict of all the level of detail chains, by VBO name
+
+        Returns:
+            dict: all the level of detail chains
+        """
+        return self.all_lods
+
+    def get_all_programs(self) -> dict:
+        """Return a dict of alls the shared programs, by path and defines
+
+        Returns:
+            dict: dict of alls the shared programs
+        """
+        return self.all_programs
+
     def get_all_textures(self) -> dict:
         """Return a dict of alls the textures
 
@@ -42,6 +90,14 @@ class Advanced_Struct:
         """
         return self.all_textures
 
+    def get_all_vaos(self) -> dict:
+        """Return a dict of alls the shared VAOs, by VBO and program
+
+        Returns:
+            dict: dict of alls the shared VAOs
+        """
+        return self.all_vaos
+
     def get_all_vbos(self) -> dict:
         """Return a dict of alls the VBOs
 
@@ -72,4 +128,158 @@ class Advanced_Struct:
         Returns:
             list: graphic type by type
         """
-        return self.graphic
\ No newline at end of file
+        return self.graphic
+    
+    def get_memory_report(self) -> dict:
+        """Return the GPU memory used by each VBO of the advanced struct with and without its index buffer
+
+        Returns:
+            dict: memory report (see VBO.get_memory_report) of each VBO, by name
+        """
+        report = {}
+        for name in self.get_all_vbos():
+            report[name] = self.get_all_vbos()[name].get_memory_report()
+        return report
+
+    def get_program_references(self, program: model.Shader_Program) -> int:
+        """Return the number of users of a shared program
+
+        Args:
+            program (model.Shader_Program): shared program
+
+        Returns:
+            int: number of users of the program
+        """
+        return self.program_references.get(program.get_key(), 0)
+    
+    def get_vao_references(self, vao: model.VAO) -> int:
+        """Return the number of users of a shared VAO
+
+        Args:
+            vao (model.VAO): shared VAO
+
+        Returns:
+            int: number of users of the VAO
+        """
+        return self.vao_references.get((vao.get_vbo(), vao.get_program().get_key()), 0)
+
+    def load_cube_vbo(self, hidden_faces: list) -> str:
+        """Return the type of the cubes without some faces, creating its VBO only the first time
+
+        Args:
+            hidden_faces (list): faces not emitted (see model.Cube_VBO)
+
+        Returns:
+            str: type of the cubes without these faces ("cube" if no face is hidden)
+        """
+        if len(hidden_faces) <= 0: return "cube"
+        type = "cube_hidden_" + "".join([str(face) for face in sorted(hidden_faces)])
+        if list(self.get_all_vbos().keys()).count(type) <= 0:
+            self.all_vbos[type] = model.Cube_VBO(self.get_base_struct(), sorted(hidden_faces))
+            self.graphic[type] = "cube"
+        return type
+
+    def load_file_vbo(self, path: str) -> model.VBO:
+        """Load the VBO of a vbo file, from its binary mesh file if it exists and was converted from the current text file (see vbo_constructor.convert_vbos)
+
+        Args:
+            path (str): path of the vbo text file
+
+        Returns:
+            model.VBO: VBO of the file
+        """
+        binary_path = os.path.splitext(path)[0] + model.Binary_VBO.EXTENSION
+        if bs.file_exists(binary_path):
+            if not bs.file_exists(path) or model.Binary_VBO.is_up_to_date(binary_path, path): return model.Binary_VBO(self.get_base_struct(), binary_path)
+            print("Matix advanced struct : Warning !! The binary mesh file \"" + binary_path + "\" was not converted from the current \"" + path + "\", the text file is loaded instead (see vbo_constructor.convert_vbos).")
+        return model.Loaded_VBO(self.get_base_struct(), path)
+
+    def load_program(self, path: str, defines: dict = None) -> model.Shader_Program:
+        """Return the shared program for a path and defines, compiling it only the first time
+
+        Args:
+            path (str): path of the program
+            defines (dict, optional): defines of the program, or None for no define. Defaults to None.
+
+        Returns:
+            model.Shader_Program: shared program
+        """
+        if defines is None: defines = {}
+        key = model.Shader_Program.get_program_key(path, defines)
+        if list(self.get_all_programs().keys()).count(key) <= 0:
+            self.get_all_programs()[key] = model.Shader_Program(self.get_base_struct(), path, defines)
+            self.program_references[key] = 0
+        self.program_references[key] += 1
+        return self.get_all_programs()[key]
+
+    def load_vao(self, vbo: model.VBO, shader_path: str, defines: dict = None) -> model.VAO:
+        """Return the shared VAO for a VBO and a program, creating it only the first time
+
+        Args:
+            vbo (model.VBO): VBO of the VAO
+            shader_path (str): path of the program of the VAO
+            defines (dict, optional): defines of the program, or None for no define. Defaults to None.
+
+        Returns:
+            model.VAO: shared VAO
+        """
+        if defines is None: defines = {}
+        key = (vbo, model.Shader_Program.get_program_key(shader_path, defines))
+        if list(self.get_all_vaos().keys()).count(key) <= 0:
+            program = self.load_program(shader_path, defines)
+            self.get_all_vaos()[key] = model.VAO(vbo, self.get_base_struct(), shader_path, program)
+            self.vao_references[key] = 0
+        self.vao_references[key] += 1
+        return self.get_all_vaos()[key]
+
+    def register_lod(self, name: str, vbos: list, distances: list, hysteresis: float = 0.1) -> model.LOD_Chain:
+        """Register a chain of meshes used by the objects of a type depending on their distance from the camera, and return it
+
+        Args:
+            name (str): name of the type (the first VBO becomes its VBO, the others are named name_lodN)
+            vbos (list): VBOs of each level, from the most to the least detailed
+            distances (list): distance from the camera where each level is replaced by the next one
+            hysteresis (float, optional): part of a distance to go past before switching again. Defaults to 0.1.
+
+        Returns:
+            model.LOD_Chain: chain of level of detail registered
+        """
+        if len(distances) != len(vbos) - 1:
+            print("Matix advanced struct : Warning !! The level of detail \"" + name + "\" needs one switch distance less than meshes.")
+            return None
+        self.all_vbos[name] = vbos[0]
+        for v in range(1, len(vbos)):
+            self.all_vbos[name + "_lod" + str(v)] = vbos[v]
+        self.all_lods[name] = model.LOD_Chain(vbos, distances, hysteresis)
+        return self.all_lods[name]
+
+    def release_program(self, program: model.Shader_Program) -> None:
+        """Release a user of a shared program, and destroy it if nobody use it anymore
+
+        Args:
+            program (model.Shader_Program): shared program to release
+        """
+        key = program.get_key()
+        if list(self.program_references.keys()).count(key) <= 0:
+            print("Matix advanced struct : Warning !! The program \"" + program.get_program_path() + "\" you want to release is not loaded.")
+            return
+        self.program_references[key] -= 1
+        if self.program_references[key] <= 0:
+            self.get_all_programs().pop(key).destroy()
+            self.program_references.pop(key)
+
+    def release_vao(self, vao: model.VAO) -> None:
+        """Release a user of a shared VAO, and destroy it (and release its program) if nobody use it anymore
+
+        Args:
+            vao (model.VAO): shared VAO to release
+        """
+        key = (vao.get_vbo(), vao.get_program().get_key())
+        if list(self.vao_references.keys()).count(key) <= 0:
+            print("Matix advanced struct : Warning !! The VAO you want to release is not loaded.")
+            return
+        self.vao_references[key] -= 1
+        if self.vao_references[key] <= 0:
+            self.get_all_vaos().pop(key).destroy()
+            self.vao_references.pop(key)
+            self.release_program(vao.get_program())
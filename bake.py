@@ -0,0 +1,199 @@
+# bake.py
+# File used to bake the assets of the game offline (binary meshes, decoded textures and potentially visible sets of the maps) on a process pool, then pack them
+
+# Import librairies
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import model
+import os
+import scene as sc
+import sys
+import time
+import vbo_constructor as vc
+
+BAKE_VERSION = 1
+
+def bake(manifest_path: str = ".cache/bake_manifest.json", texture_cache_path: str = ".cache/textures", worker_count: int = None, force: bool = False, pack_path: str = "assets.pack") -> list:
+    """Bake every source asset whose inputs changed since the last bake, on a process pool, print the time of each asset, then build the asset pack
+
+    Args:
+        manifest_path (str, optional): path of the manifest with the content hash of the inputs of each baked asset. Defaults to ".cache/bake_manifest.json".
+        texture_cache_path (str, optional): directory of the texture cache of the game. Defaults to ".cache/textures".
+        worker_count (int, optional): number of processes, or None for the number of processors. Defaults to None.
+        force (bool, optional): bake every asset, even the unchanged ones. Defaults to False.
+        pack_path (str, optional): path of the asset pack built from the sources and the baked assets (see vbo_constructor.build_pack), or "" to not build it. Defaults to "assets.pack".
+
+    Returns:
+        list: name, kind, outputs, baking time and error ("" if baked) of each asset baked
+    """
+    start = time.perf_counter()
+    manifest = load_manifest(manifest_path)
+    jobs = get_jobs(texture_cache_path)
+
+    # Only bake the assets whose inputs changed or whose outputs are missing
+    pending = []
+    for job in jobs:
+        entry = manifest.get(job["name"])
+        unchanged = entry is not None and entry["hash"] == job["hash"] and all([os.path.exists(output) for output in job["outputs"]])
+        if force or not unchanged: pending.append(job)
+
+    results = []
+    if len(pending) > 0:
+        if worker_count is None: worker_count = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers = min(worker_count, len(pending))) as executor:
+            results = list(executor.map(bake_job, pending))
+    for result in results: # The failed assets stay out of the manifest, to be baked again
+        if result["error"] == "": manifest[result["name"]] = {"hash": result["hash"], "outputs": result["outputs"]}
+    # Assets whose sources were removed are forgotten
+    names = [job["name"] for job in jobs]
+    manifest = dict([(name, manifest[name]) for name in manifest if names.count(name) > 0])
+    save_manifest(manifest_path, manifest)
+
+    # The pack is built last, from the baked assets
+    if pack_path != "":
+        pack_start = time.perf_counter()
+        vc.build_pack(pack_path)
+        results.append({"error": "", "kind": "pack", "name": pack_path, "time": time.perf_counter() - pack_start})
+
+    failed = [result for result in results if result["error"] != ""]
+    for result in sorted(results, key = lambda result: -result["time"]):
+        line = "Matix bake : " + result["kind"].ljust(8) + " " + result["name"].ljust(40) + " " + str(round(result["time"] * 1000, 1)) + " ms"
+        if result["error"] != "": line += " failed, " + result["error"]
+        print(line)
+    print("Matix bake : " + str(len(pending) - len(failed)) + " baked, " + str(len(failed)) + " failed, " + str(len(jobs) - len(pending)) + " unchanged, in " + str(round(time.perf_counter() - start, 3)) + " s")
+    return results
+
+def bake_job(job: dict) -> dict:
+    """Bake one asset, into a process of the pool
+
+    Args:
+        job (dict): asset to bake, returned by get_jobs
+
+    Returns:
+        dict: job with the baking time of the asset and the error which stopped it ("" if baked)
+    """
+    start = time.perf_counter()
+    result = dict(job)
+    result["error"] = ""
+    try:
+        for output in job["outputs"]: # The caches would be read instead of rebuilt
+            if os.path.exists(output): os.remove(output)
+        if job["kind"] == "mesh":
+            model.Binary_VBO.convert(job["source"])
+        elif job["kind"] == "texture":
+            model.Texture.create_baker().decode(job["source"], job["cache"])
+        elif job["kind"] == "array":
+            model.Texture_Array.create_baker().decode(job["source"], job["cache"])
+        elif job["kind"] == "map":
+            get_scene_2d(job["source"]).load_pvs(job["solid_parts"], job["chunk_size"])
+    except Exception as error: # One broken asset does not stop the others
+        result["error"] = type(error).__name__ + ": " + str(error)
+    result["time"] = time.perf_counter() - start
+    return result
+
+def get_content_hash(paths: list, parameters: tuple = ()) -> str:
+    """Return the hash of the content of files and of the parameters of their bake
+
+    Args:
+        paths (list): paths of the files
+        parameters (tuple, optional): parameters of the bake. Defaults to ().
+
+    Returns:
+        str: hash of the inputs
+    """
+    hash = hashlib.sha1(repr((BAKE_VERSION, paths, parameters)).encode())
+    for path in paths:
+        with open(path, "rb") as file:
+            hash.update(file.read())
+    return hash.hexdigest()
+
+def get_jobs(texture_cache_path: str = ".cache/textures", map_directory: str = "maps", solid_parts: list = None, chunk_size: int = 4, texture_directory: str = "textures", vbo_directory: str = "vbos") -> list:
+    """Return every source asset to bake, with the hash of its inputs and the outputs it produces
+
+    Args:
+        texture_cache_path (str, optional): directory of the texture cache of the game. Defaults to ".cache/textures".
+        map_directory (str, optional): directory of the maps. Defaults to "maps".
+        solid_parts (list, optional): parts of the maps which block the view, or None for every part except "0". Defaults to None.
+        chunk_size (int, optional): size of a chunk of the potentially visible sets in cells. Defaults to 4.
+        texture_directory (str, optional): directory of the textures. Defaults to "textures".
+        vbo_directory (str, optional): directory of the vbo text files. Defaults to "vbos".
+
+    Returns:
+        list: assets to bake
+    """
+    jobs = []
+    for file in sorted(os.listdir(vbo_directory)):
+        if os.path.splitext(file)[1] == ".vbo":
+            path = vbo_directory + "/" + file
+            outputs = [os.path.splitext(path)[0] + model.Binary_VBO.EXTENSION]
+            jobs.append({"hash": get_content_hash([path], (model.Binary_VBO.VERSION,)), "kind": "mesh", "name": path, "outputs": outputs, "source": path})
+
+    # Images are decoded alone (planes and models) and each directory as a texture array (cubes)
+    for directory in [texture_directory] + [texture_directory + "/" + p for p in sorted(os.listdir(texture_directory)) if os.path.isdir(texture_directory + "/" + p)]:
+        for file in sorted(os.listdir(directory)):
+            if ["jpg", "jpeg", "png"].count(str.lower(file.split(".")[-1])) > 0:
+                path = directory + "/" + file
+                outputs = [model.Texture.create_baker().get_cache_path(path, texture_cache_path)]
+                jobs.append({"cache": texture_cache_path, "hash": get_content_hash([path]), "kind": "texture", "name": path, "outputs": outputs, "source": path})
+        if directory != texture_directory:
+            baker = model.Texture_Array.create_baker()
+            paths = baker.get_layer_paths(directory)
+            outputs = [baker.get_cache_path(directory, texture_cache_path)]
+            jobs.append({"cache": texture_cache_path, "hash": get_content_hash(paths), "kind": "array", "name": directory, "outputs": outputs, "source": directory})
+
+    for file in sorted(os.listdir(map_directory)):
+        if os.path.splitext(file)[1] == ".wad":
+            path = map_directory + "/" + file
+            parts = solid_parts
+            if parts is None: parts = sorted(set([str(part) for line in get_scene_2d(path).map for part in line]) - set(["0"]))
+            hash = get_content_hash([path], (sc.Scene_2D.PVS_VERSION, parts, chunk_size))
+            jobs.append({"chunk_size": chunk_size, "hash": hash, "kind": "map", "name": path, "outputs": [path + ".pvs"], "solid_parts": parts, "source": path})
+    return jobs
+
+def get_scene_2d(path: str) -> sc.Scene_2D:
+    """Return the 2d scene of a map, with the size written into the map
+
+    Args:
+        path (str): path of the map
+
+    Returns:
+        sc.Scene_2D: 2d scene of the map
+    """
+    with open(path) as file:
+        size = file.readline().split(" ")
+    scene_2d = sc.Scene_2D((int(size[2]), int(size[3])))
+    scene_2d.load_map(path)
+    return scene_2d
+
+def load_manifest(path: str) -> dict:
+    """Return the manifest of the last bake, or an empty one
+
+    Args:
+        path (str): path of the manifest
+
+    Returns:
+        dict: hash of the inputs and outputs of each baked asset
+    """
+    if os.path.exists(path):
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            print("Matix bake : Warning !! The manifest \"" + path + "\" can't be read, every asset will be baked.")
+    return {}
+
+def save_manifest(path: str, manifest: dict) -> None:
+    """Write the manifest of the bake
+
+    Args:
+        path (str): path of the manifest
+        manifest (dict): hash of the inputs and outputs of each baked asset
+    """
+    if os.path.dirname(path) != "": os.makedirs(os.path.dirname(path), exist_ok = True)
+    with open(path, "w") as file:
+        json.dump(manifest, file, indent = 1, sort_keys = True)
+
+if __name__ == "__main__":
+    results = bake(force = sys.argv.count("--force") > 0)
+    if len([result for result in results if result["error"] != ""]) > 0: sys.exit(1)
@@ -1,8 +1,26 @@
 # Import librairies
+from concurrent.futures import ThreadPoolExecutor
 import glm
+import hashlib
 import moderngl as mgl
+import numpy as np
 import os
 import pygame as png
+import queue
+import time
+
+def file_exists(path: str) -> bool:
+    """Return if a file or a directory exists into the mounted asset pack or on the disk
+
+    Args:
+        path (str): path of the file
+
+    Returns:
+        bool: if the file exists
+    """
+    pack = Asset_Pack.get_mounted()
+    if pack is not None and (pack.contains(path) or pack.is_directory(path)): return True
+    return os.path.exists(path)
 
 def get_all_files(path: str) -> list:
     """Return a list of file into a directory
@@ -14,7 +32,7 @@ def get_all_files(path: str) -> list:
         list: list of file into the directory
     """
     all_paths = []
-    sub_paths = os.listdir(path)
+    sub_paths = list_directory(path)
     for p in sub_paths:
         if len(p.split(".")) <= 1:
             for pa in get_all_files(path + "/" + p):
@@ -25,6 +43,372 @@ def get_all_files(path: str) -> list:
                 all_paths.append((path + "/" + p, p, extension))
     return all_paths
 
+def is_directory(path: str) -> bool:
+    """Return if a path is a directory into the mounted asset pack or on the disk
+
+    Args:
+        path (str): path of the directory
+
+    Returns:
+        bool: if the path is a directory
+    """
+    pack = Asset_Pack.get_mounted()
+    if pack is not None and pack.is_directory(path): return True
+    return os.path.isdir(path)
+
+def list_directory(path: str) -> list:
+    """Return the sorted names of the files and directories into a directory, from the mounted asset pack or the disk
+
+    Args:
+        path (str): path of the directory
+
+    Returns:
+        list: names into the directory
+    """
+    pack = Asset_Pack.get_mounted()
+    if pack is None or not pack.is_directory(path): return sorted(os.listdir(path))
+    if not os.path.isdir(path): return pack.list_directory(path)
+    return sorted(set(pack.list_directory(path)) | set(os.listdir(path))) # Files added on the disk since the pack was built
+
+def map_file(path: str) -> np.ndarray:
+    """Return the bytes of a file without copying them, as a view into the mounted asset pack or a memory-map of the file on the disk
+
+    Args:
+        path (str): path of the file
+
+    Returns:
+        np.ndarray: bytes of the file
+    """
+    pack = Asset_Pack.get_mounted()
+    if pack is not None and pack.contains(path): return pack.get_view(path)
+    if os.path.getsize(path) <= 0: return np.zeros(0, dtype="u1")
+    return np.memmap(path, dtype="u1", mode="r")
+
+def read_file(path: str) -> bytes:
+    """Return the content of a file, from the mounted asset pack or the disk
+
+    Args:
+        path (str): path of the file
+
+    Returns:
+        bytes: content of the file
+    """
+    pack = Asset_Pack.get_mounted()
+    if pack is not None and pack.contains(path): return bytes(pack.get_view(path))
+    with open(path, "rb") as file:
+        return file.read()
+
+class Asset_Pack:
+    """Class representing a pack of assets: an index table of logical paths followed by aligned blobs, memory-mapped once and read without copy
+
+    Each entry keeps the modification time of its source when the pack was built: a source edited on the disk since then is read from the disk.
+    """
+
+    ALIGNMENT = 64
+    ENTRY = np.dtype([("offset", "<u8"), ("size", "<u8"), ("path_offset", "<u4"), ("path_size", "<u4"), ("source_stamp", "<f8")])
+    HEADER = np.dtype([("magic", "S8"), ("version", "<u4"), ("entry_count", "<u4"), ("paths_size", "<u8")])
+    MAGIC = b"MATIXPAK"
+    VERSION = 2
+
+    mounted = None
+
+    def __init__(self, path: str) -> None:
+        """Open a pack of assets
+
+        Args:
+            path (str): path of the pack
+        """
+        self.directories = {}
+        self.entries = {}
+        self.path = path
+        self.stale_paths = []
+        self.data = np.memmap(path, dtype="u1", mode="r") if os.path.getsize(path) > 0 else np.zeros(0, dtype="u1")
+
+        header = None
+        if len(self.data) >= Asset_Pack.HEADER.itemsize:
+            header = np.frombuffer(self.data, dtype=Asset_Pack.HEADER, count=1)[0]
+        if header is None or header["magic"] != Asset_Pack.MAGIC or header["version"] != Asset_Pack.VERSION:
+            print("Matix asset pack : Warning !! The file \"" + path + "\" is not an asset pack of version " + str(Asset_Pack.VERSION) + ".")
+            return
+
+        offset = Asset_Pack.HEADER.itemsize
+        entries = np.frombuffer(self.data, dtype=Asset_Pack.ENTRY, count=int(header["entry_count"]), offset=offset)
+        offset += entries.nbytes
+        paths = bytes(self.data[offset:offset + int(header["paths_size"])])
+        for entry in entries:
+            logical_path = paths[int(entry["path_offset"]):int(entry["path_offset"]) + int(entry["path_size"])].decode("utf-8")
+            if os.path.exists(logical_path) and os.path.getmtime(logical_path) > float(entry["source_stamp"]):
+                self.stale_paths.append(logical_path)
+            else:
+                self.entries[logical_path] = (int(entry["offset"]), int(entry["size"]))
+
+            # Register the file into each of its parent directories
+            parts = logical_path.split("/")
+            for i in range(len(parts)):
+                directory = "/".join(parts[:i]) if i > 0 else "."
+                if list(self.directories.keys()).count(directory) <= 0: self.directories[directory] = set()
+                self.directories[directory].add(parts[i])
+        if len(self.stale_paths) > 0:
+            print("Matix asset pack : Warning !! " + str(len(self.stale_paths)) + " files of the pack \"" + path + "\" were edited since it was built (\"" + self.stale_paths[0] + "\"...), they are read from the disk. Rebuild the pack with vbo_constructor.build_pack.")
+
+    @staticmethod
+    def build(path: str, sources: list, root: str = ".", excluded_extensions: tuple = ()) -> int:
+        """Write a pack of assets with every file into the sources, at their path from the root
+
+        Args:
+            path (str): path of the pack
+            sources (list): files and directories to pack
+            root (str, optional): directory the logical paths start from. Defaults to ".".
+            excluded_extensions (tuple, optional): extensions of the files not packed from the directories (".pvs"...). Defaults to ().
+
+        Returns:
+            int: number of packed files
+        """
+        files = []
+        for source in sources:
+            if os.path.isdir(source):
+                for directory, directories, names in os.walk(source):
+                    directories.sort()
+                    for name in sorted(names):
+                        if excluded_extensions.count(os.path.splitext(name)[1]) <= 0: files.append(os.path.join(directory, name))
+            elif os.path.exists(source): files.append(source)
+            else: print("Matix asset pack : Warning !! The file \"" + source + "\" to pack does not exist.")
+        logical_paths = [Asset_Pack.get_logical_path(os.path.relpath(file, root)) for file in files]
+
+        # Index table, then the paths, then each blob aligned to ALIGNMENT bytes
+        entries = np.zeros(len(files), dtype=Asset_Pack.ENTRY)
+        paths = b""
+        for i in range(len(files)):
+            encoded = logical_paths[i].encode("utf-8")
+            entries[i]["path_offset"] = len(paths)
+            entries[i]["path_size"] = len(encoded)
+            paths += encoded
+        offset = Asset_Pack.HEADER.itemsize + entries.nbytes + len(paths)
+        for i in range(len(files)):
+            offset = (offset + Asset_Pack.ALIGNMENT - 1) // Asset_Pack.ALIGNMENT * Asset_Pack.ALIGNMENT
+            entries[i]["offset"] = offset
+            entries[i]["size"] = os.path.getsize(files[i])
+            entries[i]["source_stamp"] = os.path.getmtime(files[i])
+            offset += int(entries[i]["size"])
+
+        header = np.zeros(1, dtype=Asset_Pack.HEADER)
+        header["magic"] = Asset_Pack.MAGIC
+        header["version"] = Asset_Pack.VERSION
+        header["entry_count"] = len(files)
+        header["paths_size"] = len(paths)
+        with open(path, "wb") as file:
+            file.write(header.tobytes())
+            file.write(entries.tobytes())
+            file.write(paths)
+            for i in range(len(files)):
+                file.write(b"\0" * (int(entries[i]["offset"]) - file.tell()))
+                with open(files[i], "rb") as source:
+                    file.write(source.read())
+        return len(files)
+
+    def contains(self, path: str) -> bool:
+        """Return if a file is into the pack
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            bool: if the file is into the pack
+        """
+        return list(self.entries.keys()).count(Asset_Pack.get_logical_path(path)) > 0
+
+    def get_entries(self) -> dict:
+        """Return the offset and size of each file into the pack, by logical path
+
+        Returns:
+            dict: offset and size of each file
+        """
+        return self.entries
+
+    @staticmethod
+    def get_logical_path(path: str) -> str:
+        """Return the logical path of a file into a pack, relative and separated by "/"
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            str: logical path of the file
+        """
+        return os.path.normpath(path).replace(os.sep, "/")
+
+    @staticmethod
+    def get_mounted():
+        """Return the pack read by the file functions of this module before the disk, or None
+
+        Returns:
+            Asset_Pack: mounted pack
+        """
+        return Asset_Pack.mounted
+
+    def get_path(self) -> str:
+        """Return the path of the pack
+
+        Returns:
+            str: path of the pack
+        """
+        return self.path
+
+    def get_stale_paths(self) -> list:
+        """Return the files of the pack edited on the disk since it was built, read from the disk
+
+        Returns:
+            list: logical paths of the stale files
+        """
+        return self.stale_paths
+
+    def get_view(self, path: str) -> np.ndarray:
+        """Return the bytes of a file into the pack, as a view into the memory-map
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            np.ndarray: bytes of the file
+        """
+        offset, size = self.entries[Asset_Pack.get_logical_path(path)]
+        return self.data[offset:offset + size]
+
+    def is_directory(self, path: str) -> bool:
+        """Return if a path is a directory into the pack
+
+        Args:
+            path (str): path of the directory
+
+        Returns:
+            bool: if the path is a directory
+        """
+        return list(self.directories.keys()).count(Asset_Pack.get_logical_path(path)) > 0
+
+    def list_directory(self, path: str) -> list:
+        """Return the sorted names of the files and directories into a directory of the pack
+
+        Args:
+            path (str): path of the directory
+
+        Returns:
+            list: names into the directory
+        """
+        return sorted(self.directories[Asset_Pack.get_logical_path(path)])
+
+    @staticmethod
+    def mount(path: str):
+        """Open a pack and read the assets from it before the disk, or stop reading from a pack if the path is empty
+
+        Args:
+            path (str): path of the pack, or ""
+
+        Returns:
+            Asset_Pack: mounted pack, or None
+        """
+        Asset_Pack.mounted = Asset_Pack(path) if path != "" else None
+        return Asset_Pack.mounted
+
+class Asset_Registry:
+    """Class representing the GPU objects of the assets, shared by every asset with the same content whatever its path
+    """
+
+    def __init__(self) -> None:
+        """Create an asset registry
+        """
+        self.assets = {}
+        self.keys = {}
+        self.requested_sizes = {}
+
+    def acquire(self, kind: str, content_hash: str, size: int, create, requested_size: int = -1):
+        """Return the GPU object holding a content, creating it only if no other asset has the same content
+
+        Args:
+            kind (str): kind of the asset, for the report ("texture" or "mesh")
+            content_hash (str): hash of the content, returned by get_content_hash
+            size (int): size in bytes of the GPU object
+            create (function): function creating the GPU object, called without argument
+            requested_size (int, optional): size in bytes the asset would use without any deduplication, or -1 for size. Defaults to -1.
+
+        Returns:
+            GPU object holding the content
+        """
+        if requested_size < 0: requested_size = size
+        key = (kind, content_hash)
+        if list(self.assets.keys()).count(key) <= 0:
+            gpu_object = create()
+            self.assets[key] = [gpu_object, 0, size]
+            self.keys[gpu_object] = key
+        self.assets[key][1] += 1
+        self.requested_sizes[kind] = self.requested_sizes.get(kind, 0) + requested_size
+        return self.assets[key][0]
+
+    @staticmethod
+    def get_content_hash(*contents) -> str:
+        """Return the hash of contents (bytes, numpy arrays, or any other value hashed from its representation)
+
+        Returns:
+            str: hash of the contents
+        """
+        content_hash = hashlib.sha1()
+        for content in contents:
+            if isinstance(content, np.ndarray): content = np.ascontiguousarray(content).data
+            elif not isinstance(content, (bytes, bytearray, memoryview)): content = repr(content).encode()
+            content_hash.update(content)
+        return content_hash.hexdigest()
+
+    def get_references(self, gpu_object) -> int:
+        """Return the number of assets using a GPU object
+
+        Args:
+            gpu_object: GPU object of the registry
+
+        Returns:
+            int: number of assets using the GPU object
+        """
+        if not gpu_object in self.keys: return 0
+        return self.assets[self.keys[gpu_object]][1]
+
+    def get_report(self) -> dict:
+        """Return the GPU memory used and saved by the deduplication, by kind of asset
+
+        Returns:
+            dict: "objects" and "references" count, "size" in bytes of the GPU objects and "saved" bytes, by kind
+        """
+        report = {}
+        for kind in self.requested_sizes:
+            report[kind] = {"objects": 0, "references": 0, "saved": 0, "size": 0}
+        for key in self.assets:
+            asset = self.assets[key]
+            report[key[0]]["objects"] += 1
+            report[key[0]]["references"] += asset[1]
+            report[key[0]]["size"] += asset[2]
+        for kind in report:
+            report[kind]["saved"] = self.requested_sizes[kind] - report[kind]["size"]
+        return report
+
+    def release(self, gpu_object, requested_size: int) -> bool:
+        """Release a user of a GPU object, and release it if nobody use it anymore
+
+        Args:
+            gpu_object: GPU object returned by acquire
+            requested_size (int): size in bytes given to acquire (or the size if it was -1)
+
+        Returns:
+            bool: if the GPU object was released
+        """
+        if not gpu_object in self.keys:
+            print("Matix asset registry : Warning !! The GPU object you want to release is not registered.")
+            return False
+        key = self.keys[gpu_object]
+        self.assets[key][1] -= 1
+        self.requested_sizes[key[0]] -= requested_size
+        if self.assets[key][1] > 0: return False
+        self.assets.pop(key)
+        self.keys.pop(gpu_object)
+        gpu_object.release()
+        return True
+
 class Camera_Value:
     """Class representing the value of the camera
     """
@@ -47,6 +431,13 @@ class Camera_Value:
         self.right = glm.vec3(1, 0, 0)
         self.forward = glm.vec3(0, 0, -1)
 
+        # Matrices are recomputed only when the values they are made of change
+        self.projection = None
+        self.projection_key = None
+        self.version = 0
+        self.view = None
+        self.view_key = None
+
     def get_aspect_ratio(self) -> float:
         """Return the aspect ratio of the screen
 
@@ -79,6 +470,16 @@ class Camera_Value:
         """
         return self.FOV
     
+    def get_frustum_planes(self) -> list:
+        """Return the 6 planes (a, b, c, d) of the view frustum in world space, a point being inside a plane if ax + by + cz + d >= 0
+
+        Returns:
+            list: left, right, bottom, top, near and far planes of the view frustum
+        """
+        matrix = self.get_projection() * self.get_view()
+        rows = [glm.row(matrix, 0), glm.row(matrix, 1), glm.row(matrix, 2), glm.row(matrix, 3)]
+        return [rows[3] + rows[0], rows[3] - rows[0], rows[3] + rows[1], rows[3] - rows[1], rows[3] + rows[2], rows[3] - rows[2]]
+    
     def get_NEAR(self) -> float:
         """Return near to the camera
 
@@ -104,12 +505,17 @@ class Camera_Value:
         return self.position
     
     def get_projection(self) -> glm.mat4:
-        """Return the projection of the camera
+        """Return the projection of the camera, recomputed only if the FOV, aspect ratio, near or far changed
 
         Returns:
             glm.mat4: projection of the camera
         """
-        return glm.perspective(glm.radians(self.get_FOV()), self.get_aspect_ratio(), self.get_NEAR(), self.get_FAR())
+        key = (self.get_FOV(), self.get_aspect_ratio(), self.get_NEAR(), self.get_FAR())
+        if key != self.projection_key:
+            self.projection = glm.perspective(glm.radians(self.get_FOV()), self.get_aspect_ratio(), self.get_NEAR(), self.get_FAR())
+            self.projection_key = key
+            self.version += 1
+        return self.projection
     
     def get_right(self) -> glm.vec3:
         """Return the right vector
@@ -143,13 +549,26 @@ class Camera_Value:
         """
         return self.up
     
+    def get_version(self) -> int:
+        """Return a number incremented each time the view or the projection matrix changes
+
+        Returns:
+            int: version of the matrices of the camera
+        """
+        return self.version
+    
     def get_view(self) -> glm.mat4x4:
-        """Return the view matrix
+        """Return the view matrix, recomputed only if the position, forward or up vector changed
 
         Returns:
             glm.mat4x4: view matrix
         """
-        return glm.lookAt(self.get_position(), self.get_position() + self.get_forward(), self.get_up())
+        key = (tuple(self.get_position()), tuple(self.get_forward()), tuple(self.get_up()))
+        if key != self.view_key:
+            self.view = glm.lookAt(self.get_position(), self.get_position() + self.get_forward(), self.get_up())
+            self.view_key = key
+            self.version += 1
+        return self.view
     
     def get_yaw(self) -> float:
         """Return the yaw of the camera
@@ -159,6 +578,14 @@ class Camera_Value:
         """
         return self.yaw
     
+    def set_forward(self, forward: glm.vec3) -> None:
+        """Change the forward vector of the camera
+
+        Args:
+            forward (glm.vec3): new forward vector
+        """
+        self.forward = forward
+
     def set_position(self, position: glm.vec3) -> None:
         """Change the position of the camera
 
@@ -167,6 +594,22 @@ class Camera_Value:
         """
         self.position = position
 
+    def set_right(self, right: glm.vec3) -> None:
+        """Change the right vector of the camera
+
+        Args:
+            right (glm.vec3): new right vector
+        """
+        self.right = right
+
+    def set_up(self, up: glm.vec3) -> None:
+        """Change the up vector of the camera
+
+        Args:
+            up (glm.vec3): new up vector
+        """
+        self.up = up
+
     def set_pitch(self, pitch: float) -> None:
         """Change the pitch of the camera
 
@@ -183,26 +626,574 @@ class Camera_Value:
         """
         self.yaw = yaw
 
+class Profiler:
+    """Class representing a frame profiler, keeping the last CPU times of each phase and GPU times of each render pass into ring buffers
+    """
+
+    GPU_LATENCY = 3 # GPU times are read some frames later, so reading them does not wait for the GPU
+
+    def __init__(self, context: mgl.Context, capacity: int = 256) -> None:
+        """Create a profiler, disabled by default
+
+        Args:
+            context (mgl.Context): context used to create the GPU timer queries
+            capacity (int, optional): number of frames kept into the ring buffers. Defaults to 256.
+        """
+        self.capacity = capacity
+        self.context = context
+        self.enabled = False
+        self.frame = 0
+        self.frame_start = None
+        self.gpu_pending = {}
+        self.gpu_queries = {}
+        self.samples = {}
+        self.starts = {}
+
+    def begin(self, name: str, gpu: bool = False) -> None:
+        """Start to time a phase of the frame
+
+        Args:
+            name (str): name of the phase
+            gpu (bool, optional): also time the GPU commands of the phase (the GPU phases can't overlap). Defaults to False.
+        """
+        if not self.enabled: return
+        slot = None
+        if gpu:
+            if not name in self.gpu_queries:
+                self.gpu_queries[name] = [self.context.query(time = True) for _ in range(Profiler.GPU_LATENCY)]
+                self.gpu_pending[name] = [False] * Profiler.GPU_LATENCY
+            slot = self.frame % Profiler.GPU_LATENCY
+            if self.gpu_pending[name][slot]: self.record("gpu:" + name, self.gpu_queries[name][slot].elapsed / 1000000.0)
+            self.begin_query(name, slot)
+        self.starts[name] = (time.perf_counter(), slot)
+
+    def begin_frame(self) -> None:
+        """Start to time a frame
+        """
+        if not self.enabled: return
+        self.frame_start = time.perf_counter()
+
+    def begin_query(self, name: str, slot: int) -> None:
+        """Start the GPU timer query of a phase, with the explicit begin of the moderngl query (the phase may end in another call)
+
+        Args:
+            name (str): name of the phase
+            slot (int): slot of the query into the ring of queries of the phase
+        """
+        self.gpu_queries[name][slot].mglo.begin()
+
+    def end(self, name: str) -> None:
+        """Stop to time a phase of the frame
+
+        Args:
+            name (str): name of the phase
+        """
+        if not self.enabled or not name in self.starts: return
+        start, slot = self.starts.pop(name)
+        self.record("cpu:" + name, (time.perf_counter() - start) * 1000.0)
+        if slot != None:
+            self.end_query(name, slot)
+            self.gpu_pending[name][slot] = True
+
+    def end_frame(self) -> None:
+        """Stop to time a frame
+        """
+        if not self.enabled or self.frame_start == None: return
+        self.record("frame", (time.perf_counter() - self.frame_start) * 1000.0)
+        self.frame_start = None
+        self.frame += 1
+
+    def end_query(self, name: str, slot: int) -> None:
+        """Stop the GPU timer query of a phase
+
+        Args:
+            name (str): name of the phase
+            slot (int): slot of the query into the ring of queries of the phase
+        """
+        self.gpu_queries[name][slot].mglo.end()
+
+    def get_capacity(self) -> int:
+        """Return the number of frames kept into the ring buffers
+
+        Returns:
+            int: number of frames kept into the ring buffers
+        """
+        return self.capacity
+
+    def get_percentiles(self, name: str, percentiles: tuple = (50, 95, 99)) -> tuple:
+        """Return percentiles of the times recorded for a measure ("frame", "cpu:phase" or "gpu:phase"), in milliseconds
+
+        Args:
+            name (str): name of the measure
+            percentiles (tuple, optional): percentiles to compute. Defaults to (50, 95, 99).
+
+        Returns:
+            tuple: percentiles of the times recorded, or an empty tuple if nothing was recorded
+        """
+        if not name in self.samples or self.samples[name][1] <= 0: return ()
+        values = self.samples[name][0][:min(self.samples[name][1], self.get_capacity())]
+        return tuple(np.percentile(values, percentiles))
+
+    def get_report(self) -> dict:
+        """Return the p50, p95 and p99 times of every measure, in milliseconds
+
+        Returns:
+            dict: "p50", "p95" and "p99" times of each measure
+        """
+        report = {}
+        for name in sorted(self.samples):
+            percentiles = self.get_percentiles(name)
+            report[name] = {"p50": float(percentiles[0]), "p95": float(percentiles[1]), "p99": float(percentiles[2])}
+        return report
+
+    def is_enabled(self) -> bool:
+        """Return if the profiler records the frames
+
+        Returns:
+            bool: if the profiler records the frames
+        """
+        return self.enabled
+
+    def record(self, name: str, value: float) -> None:
+        """Add a time into the ring buffer of a measure
+
+        Args:
+            name (str): name of the measure
+            value (float): time in milliseconds
+        """
+        if not name in self.samples:
+            self.samples[name] = [np.zeros(self.get_capacity(), dtype="f8"), 0]
+        sample = self.samples[name]
+        sample[0][sample[1] % self.get_capacity()] = value
+        sample[1] += 1
+
+    def reset(self) -> None:
+        """Forget every time recorded
+        """
+        self.samples.clear()
+        for name in self.gpu_pending:
+            self.gpu_pending[name] = [False] * Profiler.GPU_LATENCY
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Change if the profiler records the frames
+
+        Args:
+            enabled (bool): if the profiler records the frames
+        """
+        for name in self.starts: # Close the GPU timers still running
+            if self.starts[name][1] != None: self.end_query(name, self.starts[name][1])
+        self.enabled = enabled
+        self.frame_start = None
+        self.starts.clear()
+
+class Texture_Loader:
+    """Class representing a pool of threads decoding textures, whose results are uploaded to the GPU by the main thread
+    """
+
+    def __init__(self, worker_count: int = 4, uploads_per_frame: int = 8) -> None:
+        """Create a texture loader
+
+        Args:
+            worker_count (int, optional): number of decoding threads. Defaults to 4.
+            uploads_per_frame (int, optional): maximum number of decoded textures uploaded by update. Defaults to 8.
+        """
+        self.completed = queue.Queue()
+        self.executor = None
+        self.pending = 0
+        self.placeholders = {}
+        self.uploads_per_frame = uploads_per_frame
+        self.worker_count = worker_count
+
+    def destroy(self) -> None:
+        """Stop the decoding threads and release the placeholder textures
+        """
+        if self.executor != None:
+            self.executor.shutdown(wait = True, cancel_futures = True)
+            self.executor = None
+        self.completed = queue.Queue()
+        self.pending = 0
+        for placeholder in self.placeholders.values():
+            placeholder.release()
+        self.placeholders.clear()
+
+    def get_pending(self) -> int:
+        """Return the number of textures decoding or waiting for their upload
+
+        Returns:
+            int: number of textures decoding or waiting for their upload
+        """
+        return self.pending
+
+    def get_placeholders(self) -> dict:
+        """Return the textures shown while the real ones are loading, by key
+
+        Returns:
+            dict: textures shown while the real ones are loading
+        """
+        return self.placeholders
+
+    def get_uploads_per_frame(self) -> int:
+        """Return the maximum number of decoded textures uploaded by update
+
+        Returns:
+            int: maximum number of decoded textures uploaded by update
+        """
+        return self.uploads_per_frame
+
+    def process(self, item: tuple) -> None:
+        """Give a decoded texture to its callback, on the main thread
+
+        Args:
+            item (tuple): name, callback, result and error of the decoding
+        """
+        self.pending -= 1
+        name, callback, result, error = item
+        if error != None:
+            print("Matix texture loader : Warning !! The texture \"" + name + "\" can't be loaded (" + str(error) + ").")
+            return
+        callback(result)
+
+    def submit(self, name: str, function, callback, *args) -> None:
+        """Decode a texture on a thread of the pool, the callback will receive the result on the main thread
+
+        Args:
+            name (str): name of the texture, for the warnings
+            function (function): decoding function, called with args on a thread of the pool
+            callback (function): function called with the result of the decoding by update
+        """
+        if self.executor == None:
+            self.executor = ThreadPoolExecutor(max_workers = self.worker_count, thread_name_prefix = "matix_texture")
+        self.pending += 1
+        self.executor.submit(self.run, name, function, callback, args)
+
+    def run(self, name: str, function, callback, args: tuple) -> None:
+        """Decode a texture and put the result into the completion queue, on a thread of the pool
+
+        Args:
+            name (str): name of the texture
+            function (function): decoding function
+            callback (function): function called with the result of the decoding
+            args (tuple): arguments of the decoding function
+        """
+        try:
+            self.completed.put((name, callback, function(*args), None))
+        except Exception as error:
+            self.completed.put((name, callback, None, error))
+
+    def update(self) -> int:
+        """Upload the textures decoded since the last call, at most uploads_per_frame of them, and return how many were uploaded
+
+        Returns:
+            int: number of textures uploaded
+        """
+        uploaded = 0
+        while uploaded < self.get_uploads_per_frame():
+            try:
+                item = self.completed.get_nowait()
+            except queue.Empty:
+                break
+            self.process(item)
+            uploaded += 1
+        return uploaded
+
+    def wait(self) -> None:
+        """Wait until every texture is decoded and uploaded
+        """
+        while self.get_pending() > 0:
+            self.process(self.completed.get())
+
+class Texture_Residency_Manager:
+    """Class representing a budget of GPU memory for the textures, evicting the least recently drawn ones when it is exceeded
+    """
+
+    def __init__(self, budget: int = 1024 ** 3) -> None:
+        """Create a texture residency manager
+
+        Args:
+            budget (int, optional): maximum size in bytes of the resident textures (with their mipmaps), or 0 for no limit. Defaults to 1024 ** 3.
+        """
+        self.budget = budget
+        self.evictions = 0
+        self.frame = 0
+        self.textures = {}
+        self.usage = 0
+
+    def add(self, texture) -> None:
+        """Make a texture resident, evicting the least recently drawn textures if the budget is exceeded
+
+        Args:
+            texture (model.Texture): texture whose moderngl texture was just uploaded
+        """
+        gpu_texture = texture.get_texture()
+        if not gpu_texture in self.textures:
+            size = Texture_Residency_Manager.get_texture_size(gpu_texture)
+            self.textures[gpu_texture] = [size, [], self.frame]
+            self.usage += size
+        if self.textures[gpu_texture][1].count(texture) <= 0: self.textures[gpu_texture][1].append(texture)
+        self.use(texture)
+        self.evict()
+
+    def evict(self) -> int:
+        """Evict the least recently drawn textures until the budget is respected (the textures drawn during this frame or the last one are kept), and return how many were evicted
+
+        Returns:
+            int: number of moderngl textures evicted
+        """
+        evicted = 0
+        while self.get_budget() > 0 and self.get_usage() > self.get_budget() and len(self.textures) > 0:
+            gpu_texture = next(iter(self.textures))
+            if self.textures[gpu_texture][2] >= self.frame - 1: break
+            size, textures, _ = self.textures.pop(gpu_texture)
+            self.usage -= size
+            for texture in textures:
+                texture.evict()
+            evicted += 1
+        self.evictions += evicted
+        return evicted
+
+    def get_budget(self) -> int:
+        """Return the maximum size in bytes of the resident textures, or 0 for no limit
+
+        Returns:
+            int: maximum size in bytes of the resident textures
+        """
+        return self.budget
+
+    def get_evictions(self) -> int:
+        """Return the number of moderngl textures evicted since the creation of the manager
+
+        Returns:
+            int: number of moderngl textures evicted
+        """
+        return self.evictions
+
+    def get_resident_count(self) -> int:
+        """Return the number of resident moderngl textures
+
+        Returns:
+            int: number of resident moderngl textures
+        """
+        return len(self.textures)
+
+    @staticmethod
+    def get_texture_size(gpu_texture) -> int:
+        """Return the size in bytes of a RGBA moderngl texture (or texture array) with its mipmaps
+
+        Args:
+            gpu_texture (mgl.Texture): moderngl texture
+
+        Returns:
+            int: size in bytes of the texture with its mipmaps
+        """
+        width, height = gpu_texture.size[0], gpu_texture.size[1]
+        layers = 1
+        if len(gpu_texture.size) > 2: layers = gpu_texture.size[2]
+        size = width * height
+        while width > 1 or height > 1:
+            width, height = max(1, width // 2), max(1, height // 2)
+            size += width * height
+        return size * layers * 4
+
+    def get_usage(self) -> int:
+        """Return the size in bytes of the resident textures
+
+        Returns:
+            int: size in bytes of the resident textures
+        """
+        return self.usage
+
+    def new_frame(self) -> None:
+        """Start a new frame, evicting the textures not drawn during the last frame if the budget is exceeded
+        """
+        self.frame += 1
+        self.evict()
+
+    def remove(self, texture) -> None:
+        """Forget a texture which is destroyed, its moderngl texture stops counting when no other texture use it
+
+        Args:
+            texture (model.Texture): texture destroyed
+        """
+        gpu_texture = texture.get_texture()
+        if not gpu_texture in self.textures: return
+        textures = self.textures[gpu_texture][1]
+        if textures.count(texture) > 0: textures.remove(texture)
+        if len(textures) <= 0:
+            self.usage -= self.textures.pop(gpu_texture)[0]
+
+    def set_budget(self, budget: int) -> None:
+        """Change the maximum size in bytes of the resident textures, evicting textures if needed
+
+        Args:
+            budget (int): maximum size in bytes of the resident textures, or 0 for no limit
+        """
+        self.budget = budget
+        self.evict()
+
+    def use(self, texture) -> None:
+        """Mark a texture as drawn during this frame
+
+        Args:
+            texture (model.Texture): texture drawn
+        """
+        gpu_texture = texture.get_texture()
+        if not gpu_texture in self.textures: return
+        entry = self.textures.pop(gpu_texture) # Put the texture at the end, as the most recently drawn
+        entry[2] = self.frame
+        self.textures[gpu_texture] = entry
+
+class Texture_Unit_Manager:
+    """Class representing a fixed pool of texture units, bound at draw time and reused from the least recently used one
+    """
+
+    def __init__(self, unit_count: int, first_unit: int = 0) -> None:
+        """Create a texture unit manager
+
+        Args:
+            unit_count (int): number of units into the pool
+            first_unit (int, optional): first unit of the pool. Defaults to 0.
+        """
+        self.binds = 0
+        self.first_unit = first_unit
+        self.last_frame_binds = 0
+        self.unit_count = unit_count
+        self.units = {}
+
+    def bind(self, texture) -> int:
+        """Bind a moderngl texture to a unit if it is not already bound, and return the unit
+
+        Args:
+            texture (mgl.Texture): texture (or texture array) to bind
+
+        Returns:
+            int: unit holding the texture
+        """
+        if texture in self.units:
+            unit = self.units.pop(texture) # Put the texture at the end, as the most recently used
+            self.units[texture] = unit
+            return unit
+
+        if len(self.units) < self.get_unit_count():
+            used_units = set(self.units.values())
+            unit = self.get_first_unit()
+            while unit in used_units: unit += 1
+        else:
+            unit = self.units.pop(next(iter(self.units))) # Reuse the unit of the least recently used texture
+        texture.use(unit)
+        self.units[texture] = unit
+        self.binds += 1
+        return unit
+
+    def get_binds(self) -> int:
+        """Return the number of binds done since the start of the frame
+
+        Returns:
+            int: number of binds done since the start of the frame
+        """
+        return self.binds
+
+    def get_first_unit(self) -> int:
+        """Return the first unit of the pool
+
+        Returns:
+            int: first unit of the pool
+        """
+        return self.first_unit
+
+    def get_last_frame_binds(self) -> int:
+        """Return the number of binds done during the last frame
+
+        Returns:
+            int: number of binds done during the last frame
+        """
+        return self.last_frame_binds
+
+    def get_unit_count(self) -> int:
+        """Return the number of units into the pool
+
+        Returns:
+            int: number of units into the pool
+        """
+        return self.unit_count
+
+    def new_frame(self) -> None:
+        """Start a new frame for the bind counter
+        """
+        self.last_frame_binds = self.binds
+        self.binds = 0
+
+    def release(self, texture) -> None:
+        """Forget a texture which is released, freeing its unit
+
+        Args:
+            texture (mgl.Texture): texture released
+        """
+        if texture in self.units: self.units.pop(texture)
+
 class Base_Struct:
     """Class representing all the base struct in the game
     """
 
-    def __init__(self, context: mgl.Context, window_size: tuple) -> None:
+    CAMERA_BINDING = 0
+
+    def __init__(self, context: mgl.Context, window_size: tuple, asset_pack_path: str = "assets.pack") -> None:
         """Create a base struct in the game
+
+        Args:
+            context (mgl.Context): context of the game
+            window_size (tuple): size of the window
+            asset_pack_path (str, optional): pack of assets read before the disk, if it exists. Defaults to "assets.pack".
         """
+        self.asset_pack = Asset_Pack.mount(asset_pack_path) if os.path.exists(asset_pack_path) else Asset_Pack.get_mounted()
+        self.asset_registry = Asset_Registry()
         self.context = context
         self.context.enable(flags=mgl.DEPTH_TEST | mgl.CULL_FACE | mgl.BLEND)
         self.delta_time = 0
         self.face_order = {"cube": [0, 1, 2, 3, 4, 5]}
         self.mouse_rel_pos = (0, 0)
+        self.profiler = Profiler(self.context)
+        self.texture_cache_path = ".cache/textures"
+        self.texture_loader = Texture_Loader()
+        self.texture_residency_manager = Texture_Residency_Manager()
         self.transform_multiplier = 2
         self.window_size = window_size
 
         self.camera_value = Camera_Value(self.get_window_size()[0] / self.get_window_size()[1])
 
+        # Projection and view matrices shared by every program through the std140 "Camera" uniform block
+        self.camera_buffer = self.get_context().buffer(reserve = 128)
+        self.camera_buffer.bind_to_uniform_block(Base_Struct.CAMERA_BINDING)
+        self.camera_buffer_version = -1
+
         self.gravity_force = -9.81 * 0
 
-        self.texture_count = 50
+        # The last unit is kept free for moderngl, which uses it to create textures
+        texture_units = self.get_context().info["GL_MAX_TEXTURE_IMAGE_UNITS"]
+        self.texture_unit_manager = Texture_Unit_Manager(min(16, texture_units - 1))
+
+    def get_asset_pack(self) -> Asset_Pack:
+        """Return the pack of assets read before the disk, or None
+
+        Returns:
+            Asset_Pack: pack of assets
+        """
+        return self.asset_pack
+
+    def get_asset_registry(self) -> Asset_Registry:
+        """Return the registry sharing the GPU objects of the assets with the same content
+
+        Returns:
+            Asset_Registry: registry of the GPU objects of the assets
+        """
+        return self.asset_registry
+
+    def get_camera_buffer(self) -> mgl.Buffer:
+        """Return the uniform buffer holding the projection and view matrices
+
+        Returns:
+            mgl.Buffer: uniform buffer of the camera
+        """
+        return self.camera_buffer
 
     def get_camera_value(self) -> Camera_Value:
         """Return the camera value
@@ -252,13 +1243,45 @@ class Base_Struct:
         """
         return self.mouse_rel_pos
     
-    def get_texture_count(self) -> int:
-        """Return the number of texture into the game
+    def get_profiler(self) -> Profiler:
+        """Return the frame profiler of the game
 
         Returns:
-            int: number of texture into the game
+            Profiler: frame profiler of the game
         """
-        return self.texture_count
+        return self.profiler
+    
+    def get_texture_cache_path(self) -> str:
+        """Return the directory where the decoded textures are cached, or "" if the cache is disabled
+
+        Returns:
+            str: directory where the decoded textures are cached
+        """
+        return self.texture_cache_path
+    
+    def get_texture_loader(self) -> Texture_Loader:
+        """Return the loader decoding the textures on a pool of threads
+
+        Returns:
+            Texture_Loader: loader of the textures
+        """
+        return self.texture_loader
+    
+    def get_texture_residency_manager(self) -> Texture_Residency_Manager:
+        """Return the manager keeping the textures into the GPU memory budget
+
+        Returns:
+            Texture_Residency_Manager: manager of the resident textures
+        """
+        return self.texture_residency_manager
+
+    def get_texture_unit_manager(self) -> Texture_Unit_Manager:
+        """Return the manager of the texture units
+
+        Returns:
+            Texture_Unit_Manager: manager of the texture units
+        """
+        return self.texture_unit_manager
     
     def get_transform_multiplier(self) -> float:
         """Return the multiplier for a transformation
@@ -292,13 +1315,22 @@ class Base_Struct:
         """
         self.mouse_rel_pos = mouse_rel_pos
 
-    def set_texture_count(self, texture_count: int) -> None:
-        """Change the texture count into the game
+    def set_texture_cache_path(self, texture_cache_path: str) -> None:
+        """Change the directory where the decoded textures are cached
 
         Args:
-            texture_count (int): texture count into the game
+            texture_cache_path (str): directory where the decoded textures are cached, or "" to disable the cache
         """
-        self.texture_count = texture_count
+        self.texture_cache_path = texture_cache_path
+
+    def update_camera_buffer(self) -> None:
+        """Upload the projection and view matrices into the camera uniform buffer if the camera changed
+        """
+        projection = self.get_camera_value().get_projection()
+        view = self.get_camera_value().get_view()
+        if self.get_camera_value().get_version() != self.camera_buffer_version:
+            self.get_camera_buffer().write(projection.to_bytes() + view.to_bytes())
+            self.camera_buffer_version = self.get_camera_value().get_version()
 
 class Transform_Object:
     """Class representing an object which can be transformed
@@ -313,13 +1345,24 @@ class Transform_Object:
             scale (tuple, optional): scale of the plan. Defaults to (0, 0, 0).
         """
         self.base_struct = base_struct
+        self.children = []
         self.fixed_position = (False, False, False)
         self.movement = (0, 0, 0)
-        self.parent = parent
+        self.parent = None
         self.position = (0, 0, 0)
         self.rotation = (0, 0, 0)
         self.scale = (1, 1, 1)
 
+        # Values depending on the parents, recomputed only after an invalidation
+        self.absolute_positions = {}
+        self.absolute_rotation = None
+        self.absolute_scale = None
+        self.model_matrix = None
+        self.subtree_dirty = True
+        self.world_dirty = True
+        self.world_version = 0
+
+        self.set_parent(parent)
         self.set_position(position)
         self.set_rotation(rotation)
         self.set_scale(scale)
@@ -329,39 +1372,50 @@ class Transform_Object:
         self.up = glm.vec3(0, 1, 0)
 
     def get_absolute_position(self, scaled: bool = False, transform: bool = True) -> tuple:
-        """Return the absolute position of the object into the scene
+        """Return the absolute position of the object into the scene (cached until the object or a parent changes)
 
         Returns:
             tuple: absolute position of the object into the scene
         """
-        position = self.get_position(scaled, transform)
-        if self.get_parent() != None:
-            parent = self.get_parent().get_absolute_position(scaled, transform)
-            position = (position[0] + parent[0], position[1] + parent[1], position[2] + parent[2])
-        return position
+        self.validate_world()
+        key = (scaled, transform)
+        if key not in self.absolute_positions:
+            position = self.get_position(scaled, transform)
+            if self.get_parent() != None:
+                parent = self.get_parent().get_absolute_position(scaled, transform)
+                position = (position[0] + parent[0], position[1] + parent[1], position[2] + parent[2])
+            self.absolute_positions[key] = position
+        return self.absolute_positions[key]
     
     def get_absolute_rotation(self) -> tuple:
-        """Return the absolute rotation of the object into the scene
+        """Return the absolute rotation of the object into the scene (cached until the object or a parent changes)
 
         Returns:
             tuple: absolute rotation of the object into the scene
         """
-        rotation = self.get_rotation()
-        if self.get_parent() != None:
-            rotation = (rotation[0] + self.get_parent().get_absolute_rotation()[0], rotation[1] + self.get_parent().get_absolute_rotation()[1], rotation[2] + self.get_parent().get_absolute_rotation()[2])
-        return rotation
+        self.validate_world()
+        if self.absolute_rotation == None:
+            rotation = self.get_rotation()
+            if self.get_parent() != None:
+                parent_rotation = self.get_parent().get_absolute_rotation()
+                rotation = (rotation[0] + parent_rotation[0], rotation[1] + parent_rotation[1], rotation[2] + parent_rotation[2])
+            self.absolute_rotation = rotation
+        return self.absolute_rotation
     
     def get_absolute_scale(self) -> tuple:
-        """Return the absolute scale of the object into the scene
+        """Return the absolute scale of the object into the scene (cached until the object or a parent changes)
 
         Returns:
             tuple: absolute scale of the object into the scene
         """
-        scale = self.get_scale()
-        if self.get_parent() != None:
-            parent_scale = self.get_parent().get_absolute_scale()
-            scale = (scale[0] * parent_scale[0], scale[1] * parent_scale[1], scale[2] * parent_scale[2])
-        return scale
+        self.validate_world()
+        if self.absolute_scale == None:
+            scale = self.get_scale()
+            if self.get_parent() != None:
+                parent_scale = self.get_parent().get_absolute_scale()
+                scale = (scale[0] * parent_scale[0], scale[1] * parent_scale[1], scale[2] * parent_scale[2])
+            self.absolute_scale = scale
+        return self.absolute_scale
 
     def get_base_struct(self) -> Base_Struct:
         """Return the base struct of the game
@@ -371,6 +1425,14 @@ class Transform_Object:
         """
         return self.base_struct
     
+    def get_children(self) -> list:
+        """Return the objects whose parent is this object
+
+        Returns:
+            list: children of the object
+        """
+        return self.children
+    
     def get_fixed_position(self) -> tuple:
         """Return the fixed position into the object
 
@@ -388,10 +1450,21 @@ class Transform_Object:
         return self.forward
 
     def get_model_matrix(self) -> glm.mat4x4:
-        """Return the model of the matrix
+        """Return the model matrix of the object (cached until the object or a parent changes)
+
+        Returns:
+            glm.mat4x4: model matrix of the object
+        """
+        self.validate_world()
+        if self.model_matrix == None:
+            self.model_matrix = self.compute_model_matrix()
+        return self.model_matrix
+
+    def compute_model_matrix(self) -> glm.mat4x4:
+        """Compute the model matrix of the object
 
         Returns:
-            glm.mat4x4: _description_
+            glm.mat4x4: model matrix of the object
         """
 
         # Translation
@@ -466,6 +1539,30 @@ class Transform_Object:
         """
         return self.up
     
+    def get_world_version(self) -> int:
+        """Return a number incremented each time the world values (model matrix, absolute position...) of the object are invalidated
+
+        Returns:
+            int: version of the world values of the object
+        """
+        return self.world_version
+
+    def invalidate(self) -> None:
+        """Invalidate the cached world values of the object and of all its children
+        """
+        self.world_dirty = True
+        self.world_version += 1
+        for child in self.get_children():
+            if not child.world_dirty: child.invalidate() # A dirty child already has dirty children
+            else: child.world_version += 1
+
+        # Mark the path to the root so the world pass can reach this subtree
+        self.subtree_dirty = True
+        parent = self.get_parent()
+        while parent != None and not parent.subtree_dirty:
+            parent.subtree_dirty = True
+            parent = parent.get_parent()
+    
     def move(self, translation: tuple) -> None:
         """Move the object
 
@@ -507,7 +1604,11 @@ class Transform_Object:
         Args:
             parent (Transform_Object): new parent of the object
         """
+        if self.parent != None and self.parent.get_children().count(self) > 0:
+            self.parent.get_children().remove(self)
         self.parent = parent
+        if parent != None: parent.get_children().append(self)
+        self.invalidate()
 
     def set_position(self, position: tuple, transformed: bool = True) -> None:
         """Change the position of the object
@@ -516,7 +1617,9 @@ class Transform_Object:
             position (tuple): new position of the object
         """
         if transformed: position = (position[0] * self.get_base_struct().get_transform_multiplier(), position[1] * self.get_base_struct().get_transform_multiplier(), position[2] * self.get_base_struct().get_transform_multiplier())
-        self.position = position
+        if tuple(position) != tuple(self.position):
+            self.position = position
+            self.invalidate()
 
     def set_rotation(self, rotation: tuple) -> None:
         """Change the rotation of the object
@@ -524,7 +1627,9 @@ class Transform_Object:
         Args:
             rotation (tuple): rotation of the object
         """
-        self.rotation = rotation
+        if tuple(rotation) != tuple(self.rotation):
+            self.rotation = rotation
+            self.invalidate()
 
     def set_scale(self, scale: tuple):
         """Change the scale of the object
@@ -532,18 +1637,43 @@ class Transform_Object:
         Args:
             scale (tuple): scale of the object
         """
-        self.scale = scale
+        if tuple(scale) != tuple(self.scale):
+            self.scale = scale
+            self.invalidate()
     
     def soft_reset(self) -> None:
         """Reset the one-frame long object attributes values
         """
-        self.set_position((self.get_position()[0] + self.get_movement()[0], self.get_position()[1] + self.get_movement()[1], self.get_position()[2] + self.get_movement()[2]))
+        if tuple(self.get_movement()) != (0, 0, 0):
+            self.set_position((self.get_position()[0] + self.get_movement()[0], self.get_position()[1] + self.get_movement()[1], self.get_position()[2] + self.get_movement()[2]))
         self.movement = (0, 0, 0)
 
     def update(self) -> None:
         """Update the object
         """
 
+    def update_world(self) -> None:
+        """Compute the world values of the dirty objects of the hierarchy from this object, parents first, visiting only the dirty subtrees
+        """
+        if self.world_dirty:
+            # The parent is already computed, so this does not go up the hierarchy
+            self.get_model_matrix()
+            self.get_absolute_rotation()
+        if self.subtree_dirty:
+            for child in self.get_children():
+                if child.subtree_dirty or child.world_dirty: child.update_world()
+            self.subtree_dirty = False
+
+    def validate_world(self) -> None:
+        """Clear the cached world values if they were invalidated
+        """
+        if self.world_dirty:
+            self.absolute_positions = {}
+            self.absolute_rotation = None
+            self.absolute_scale = None
+            self.model_matrix = None
+            self.world_dirty = False
+
     def update_vectors(self):
         x, y, z = glm.radians(self.get_absolute_rotation()[0]), glm.radians(self.get_absolute_rotation()[1]), glm.radians(self.get_absolute_rotation()[2])
 
@@ -595,9 +1725,9 @@ class Camera(Transform_Object):
     def handle_camera_vectors(self):
         """Handle the vectors of the camera
         """
-        self.get_camera_value().forward = self.get_forward()
-        self.get_camera_value().right = self.get_right()
-        self.get_camera_value().up = self.get_up()
+        self.get_camera_value().set_forward(self.get_forward())
+        self.get_camera_value().set_right(self.get_right())
+        self.get_camera_value().set_up(self.get_up())
 
     def update(self):
         self.handle_camera_move()
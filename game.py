@@ -3,6 +3,7 @@ import advanced_struct as ad
 import base_struct as bs
 import model
 import moderngl as mgl
+import numpy as np
 import os
 import player as pl
 import pygame as pg
@@ -13,23 +14,39 @@ class Game:
     """Class representing the main game
     """
 
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False, window_size: tuple = (1600, 900), backend: str = None) -> None:
         """Create a main game
-        """
-
-        # Initialize pygame OpenGL context
-        WINDOW_SIZE = (1600, 900)
-        pg.init()
 
-        pg.display.gl_set_attribute(pg.GL_CONTEXT_MAJOR_VERSION, 3)
-        pg.display.gl_set_attribute(pg.GL_CONTEXT_MINOR_VERSION, 3)
-        pg.display.gl_set_attribute(pg.GL_CONTEXT_PROFILE_MASK, pg.GL_CONTEXT_PROFILE_COMPATIBILITY)
-        self.window = pg.display.set_mode(WINDOW_SIZE, flags=pg.OPENGL | pg.DOUBLEBUF)
-        pg.event.set_grab(True)
-        pg.mouse.set_visible(False)
+        Args:
+            headless (bool, optional): render into an offscreen framebuffer of a standalone context, without any window. Defaults to False.
+            window_size (tuple, optional): size of the window, or of the offscreen framebuffer. Defaults to (1600, 900).
+            backend (str, optional): backend of the standalone context in headless mode ("egl"...), or None to try EGL then the default one. Defaults to None.
+        """
+        self.framebuffer = None
+        self.headless = headless
+        self.window = None
+
+        if self.is_headless():
+            # Initialize a standalone OpenGL context rendering into an offscreen framebuffer
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pg.init()
+            context = self.create_headless_context(backend)
+            self.framebuffer = context.simple_framebuffer(window_size)
+            self.framebuffer.use()
+        else:
+            # Initialize pygame OpenGL context
+            pg.init()
+
+            pg.display.gl_set_attribute(pg.GL_CONTEXT_MAJOR_VERSION, 3)
+            pg.display.gl_set_attribute(pg.GL_CONTEXT_MINOR_VERSION, 3)
+            pg.display.gl_set_attribute(pg.GL_CONTEXT_PROFILE_MASK, pg.GL_CONTEXT_PROFILE_COMPATIBILITY)
+            self.window = pg.display.set_mode(window_size, flags=pg.OPENGL | pg.DOUBLEBUF)
+            pg.event.set_grab(True)
+            pg.mouse.set_visible(False)
+            context = mgl.create_context()
 
         # Initialize games structures
-        self.base_struct = bs.Base_Struct(mgl.create_context(), WINDOW_SIZE)
+        self.base_struct = bs.Base_Struct(context, window_size)
         self.clock = pg.time.Clock()
 
     def add_physic_scene(self, name: str, scene: sc.Physic_Scene) -> None:
@@ -72,11 +89,29 @@ class Game:
         print("Matrix game : Warning !! The name \"" + name + " \" you try to assign for a part already exist.")
         return
 
+    def create_headless_context(self, backend: str = None) -> mgl.Context:
+        """Create a standalone OpenGL context, without any window (set LIBGL_ALWAYS_SOFTWARE=1 to use the llvmpipe software renderer)
+
+        Args:
+            backend (str, optional): backend of the context ("egl"...), or None to try EGL then the default one. Defaults to None.
+
+        Returns:
+            mgl.Context: standalone OpenGL context
+        """
+        if backend != None:
+            return mgl.create_standalone_context(require = 330, backend = backend)
+        try:
+            return mgl.create_standalone_context(require = 330, backend = "egl")
+        except Exception:
+            return mgl.create_standalone_context(require = 330)
+
     def destroy(self) -> None:
         """Destroy and end the game
         """
         for scene in list(self.get_scenes().values()):
             scene.destroy()
+        self.get_advanced_struct().destroy()
+        if self.get_framebuffer() != None: self.get_framebuffer().release()
         pg.quit()
         sys.exit()
 
@@ -112,6 +147,14 @@ class Game:
         """
         return self.clock
     
+    def get_framebuffer(self) -> mgl.Framebuffer:
+        """Return the offscreen framebuffer of the game in headless mode, or None
+
+        Returns:
+            mgl.Framebuffer: offscreen framebuffer of the game, or None
+        """
+        return self.framebuffer
+    
     def get_current_scene(self) -> str:
         """Return the current scene of the game
 
@@ -147,10 +190,20 @@ class Game:
     def handle_events(self) -> None:
         """Handle all the events
         """
-        self.get_base_struct().set_mouse_rel_pos(pg.mouse.get_rel())
+        if not self.is_headless(): self.get_base_struct().set_mouse_rel_pos(pg.mouse.get_rel())
         for event in pg.event.get():
             if event.type == pg.QUIT: #If the user wants to leave the game
                 self.destroy()
+            elif event.type == pg.KEYDOWN and event.key == pg.K_F3: # Toggle the frame profiler
+                self.get_base_struct().get_profiler().set_enabled(not self.get_base_struct().get_profiler().is_enabled())
+    
+    def is_headless(self) -> bool:
+        """Return if the game renders into an offscreen framebuffer, without any window
+
+        Returns:
+            bool: if the game renders into an offscreen framebuffer
+        """
+        return self.headless
     
     def load_advanced_struct(self) -> None:
         """Start the game
@@ -167,23 +220,24 @@ class Game:
         #self.player.set_fixed_position((True, False, True))
         self.scenes = {}
 
-    def new_scene(self, name: str, map_path: str = "") -> sc.Scene:
+    def new_scene(self, name: str, map_path: str = "", instanced: bool = False) -> sc.Scene:
         """Create a new scene and return the scene
 
         Args:
             name (str): name of the scene into the game
             map_path (str, optional): path of the map into the scene. Defaults to "".
+            instanced (bool, optional): render the scene with instanced draw calls. Defaults to False.
 
         Returns:
             (sc.Scene, Object): new scene created and an object which help the creation
         """
         if list(self.scenes.keys()).count(name) <= 0: # If the name does not exist
-            scene = sc.Scene(self.get_advanced_struct(), name)
+            scene = sc.Scene(self.get_advanced_struct(), name, instanced = instanced)
             scene2D = None
             self.add_scene(name, scene)
 
             if map_path != "": # Load the map into the scene
-                if os.path.exists(map_path):
+                if bs.file_exists(map_path):
                     map_extension = map_path.split(".")[-1]
                     if map_extension == "wad":
                         scene2D = sc.Scene_2D((25, 25))
@@ -196,14 +250,38 @@ class Game:
         print("Matrix game : Warning !! The name \"" + name + " \" for the scene you want to create is already used.") # If the name already exists
         return None
 
-    def run(self) -> None:
+    def read_frame(self, components: int = 3) -> np.ndarray:
+        """Read back the last frame rendered, the first row being the top of the frame
+
+        Args:
+            components (int, optional): number of components of each pixel (3 for RGB, 4 for RGBA). Defaults to 3.
+
+        Returns:
+            np.ndarray: pixels of the frame, of shape (height, width, components)
+        """
+        framebuffer = self.get_framebuffer()
+        if framebuffer == None: framebuffer = self.get_base_struct().get_context().screen
+        size = framebuffer.size
+        data = np.frombuffer(framebuffer.read(components = components), dtype="u1")
+        return data.reshape(size[1], size[0], components)[::-1]
+
+    def run(self, frame_count: int = -1) -> None:
         """Run the game
+
+        Args:
+            frame_count (int, optional): number of frames to run before returning, or -1 to run until the game is destroyed. Defaults to -1.
         """
-        while True:
+        profiler = self.get_base_struct().get_profiler()
+        while frame_count != 0:
+            profiler.begin_frame()
+            profiler.begin("handle_events")
             self.handle_events()
+            profiler.end("handle_events")
             self.update()
+            profiler.end_frame()
             delta_time = self.get_clock().tick(5000) * 0.001
             self.get_base_struct().set_delta_time(delta_time)
+            if frame_count > 0: frame_count -= 1
 
     def set_current_scene(self, scene: str) -> None:
         """Change the current scene
@@ -224,9 +302,15 @@ class Game:
         """Update the screen
         """
         self.get_base_struct().get_context().clear(255, 255, 255)
+        self.get_base_struct().get_texture_unit_manager().new_frame()
+        self.get_base_struct().get_texture_residency_manager().new_frame()
+        self.get_base_struct().get_texture_loader().update()
         if list(self.get_scenes().keys()).count(self.get_current_scene()) > 0:
             self.get_scenes()[self.get_current_scene()].update()
+        if self.is_headless(): return
         surface = pg.Surface((100, 100))
         surface.fill((0, 0, 0))
         self.window.blit(surface, (50, 50))
-        pg.display.flip()
\ No newline at end of file
+        self.get_base_struct().get_profiler().begin("display_flip")
+        pg.display.flip()
+        self.get_base_struct().get_profiler().end("display_flip")
\ No newline at end of file
@@ -1,24 +1,30 @@
 # Import librairies
 import base_struct as bs
 import glm
+import hashlib
+import io
+import math
 import moderngl as mgl
 import numpy as np
 import os
 import pygame as pg
 import sys
+import threading
 
 class Shader_Program:
     """Class representing a shader program
     """
 
-    def __init__(self, base_struct: bs.Base_Struct, path: str) -> None:
+    def __init__(self, base_struct: bs.Base_Struct, path: str, defines: dict = None) -> None:
         """Create a shader program
 
         Args:
             base_struct (bs.Base_Struct): base struct in the game
             path (str): path of the program
+            defines (dict, optional): defines added at the top of each shader, or None for no define. Defaults to None.
         """
         self.base_struct = base_struct
+        self.defines = defines if defines is not None else {}
         self.program = self.load_program(path)
         self.program_path = path
 
@@ -35,6 +41,22 @@ class Shader_Program:
         """
         return self.base_struct
     
+    def get_defines(self) -> dict:
+        """Return the defines added into the shaders
+
+        Returns:
+            dict: defines added into the shaders
+        """
+        return self.defines
+    
+    def get_key(self) -> tuple:
+        """Return the key of the program into the program registry
+
+        Returns:
+            tuple: key of the program into the program registry
+        """
+        return Shader_Program.get_program_key(self.get_program_path(), self.get_defines())
+    
     def get_program(self) -> mgl.Program:
         """Return the program into the shader program
 
@@ -51,16 +73,49 @@ class Shader_Program:
         """
         return self.program_path
     
-    def load_program(self, path) -> mgl.Program:
-        vertex_shader = ""
-        with open(path + ".vert") as file:
-            vertex_shader = file.read()
+    @staticmethod
+    def get_program_key(path: str, defines: dict = None) -> tuple:
+        """Return the key of a program with its path and defines
+
+        Args:
+            path (str): path of the program
+            defines (dict, optional): defines of the program, or None for no define. Defaults to None.
+
+        Returns:
+            tuple: key of the program
+        """
+        if defines is None: defines = {}
+        return (path, tuple(sorted((str(define[0]), str(define[1])) for define in defines.items())))
+    
+    def insert_defines(self, shader: str) -> str:
+        """Insert the defines of the program just after the "#version" line of a shader
+
+        Args:
+            shader (str): source of the shader
 
-        fragment_shader = ""
-        with open(path + ".frag") as file:
-            fragment_shader = file.read()
+        Returns:
+            str: source of the shader with the defines
+        """
+        if len(self.get_defines()) <= 0:
+            return shader
+        
+        defines = ""
+        for define in self.get_defines().items():
+            defines += "#define " + str(define[0]) + " " + str(define[1]) + "\n"
+        lines = shader.split("\n")
+        for l in range(len(lines)):
+            if lines[l].strip().startswith("#version"):
+                lines[l] += "\n" + defines[:-1]
+                return "\n".join(lines)
+        return defines + shader
+    
+    def load_program(self, path) -> mgl.Program:
+        vertex_shader = self.insert_defines(bs.read_file(path + ".vert").decode("utf-8"))
+        fragment_shader = self.insert_defines(bs.read_file(path + ".frag").decode("utf-8"))
 
-        return self.get_base_struct().get_context().program(vertex_shader, fragment_shader)
+        program = self.get_base_struct().get_context().program(vertex_shader, fragment_shader)
+        if "Camera" in program: program["Camera"].binding = bs.Base_Struct.CAMERA_BINDING
+        return program
 
 class VBO:
     """Class representing a base of vertex buffer objects
@@ -74,14 +129,21 @@ class VBO:
         """
         self.attributes = []
         self.base_struct = base_struct
+        self.bounds = None
         self.face_content = []
         self.format = ""
-        self.vbo = self.get_base_struct().get_context().buffer(self.get_vertex_data())
+        self.vertices, self.indices = self.load_indexed_data()
+
+        # Meshes with the same data share their buffers, whatever their path
+        registry = self.get_base_struct().get_asset_registry()
+        self.ibo = registry.acquire("mesh", registry.get_content_hash(self.indices), self.indices.nbytes, lambda: self.get_base_struct().get_context().buffer(self.indices))
+        self.vbo = registry.acquire("mesh", registry.get_content_hash(self.vertices), self.vertices.nbytes, lambda: self.get_base_struct().get_context().buffer(self.vertices))
 
     def destroy(self) -> None:
-        """Destroy the buffer
+        """Release the buffers, destroyed when no other VBO share them
         """
-        self.vbo.release()
+        self.get_base_struct().get_asset_registry().release(self.ibo, self.indices.nbytes)
+        self.get_base_struct().get_asset_registry().release(self.vbo, self.vertices.nbytes)
 
     def get_attributes(self) -> list:
         """Return the attributes of the VBO
@@ -99,6 +161,20 @@ class VBO:
         """
         return self.base_struct
     
+    def get_bounds(self) -> tuple:
+        """Return the minimum and maximum corners of the vertices of the VBO, computed once from the vertex data
+
+        Returns:
+            tuple: minimum and maximum corners of the vertices, or an empty tuple if the VBO has no position
+        """
+        if self.bounds == None:
+            self.bounds = ()
+            offsets = self.get_format_offsets()
+            if list(offsets.keys()).count("in_position") > 0:
+                position = self.get_indexed_data()[0][:, offsets["in_position"]:offsets["in_position"] + 3]
+                if len(position) > 0: self.bounds = (position.min(axis = 0), position.max(axis = 0))
+        return self.bounds
+    
     @staticmethod
     def get_data(vertices, indices):
         """Return the vertices arrange for the data
@@ -128,6 +204,56 @@ class VBO:
             str: format of the VBO
         """
         return self.format
+    
+    def get_format_offsets(self) -> dict:
+        """Return the column of the first value of each attribute into the vertex data
+
+        Returns:
+            dict: column of each attribute into the vertex data
+        """
+        offsets = {}
+        offset = 0
+        format = self.get_format().split(" ")
+        for a in range(len(self.get_attributes())):
+            offsets[self.get_attributes()[a]] = offset
+            size = format[a][:-1]
+            if size == "": size = "1"
+            offset += int(size)
+        return offsets
+
+    def get_ibo(self) -> mgl.Buffer:
+        """Return the buffer for the indices of the vertices
+
+        Returns:
+            mgl.Buffer: buffer for the indices of the vertices
+        """
+        return self.ibo
+    
+    def get_index_element_size(self) -> int:
+        """Return the size in bytes of an index
+
+        Returns:
+            int: size in bytes of an index
+        """
+        return self.indices.itemsize
+    
+    def get_indexed_data(self) -> tuple:
+        """Return the unique vertices of the VBO and the indices of the vertices of each triangle
+
+        Returns:
+            tuple: unique vertices (np.ndarray) and indices (np.ndarray) of the VBO
+        """
+        return (self.vertices, self.indices)
+    
+    def get_memory_report(self) -> dict:
+        """Return the GPU memory used by the VBO with and without the index buffer
+
+        Returns:
+            dict: "expanded" and "indexed" size in bytes of the data, "saved" bytes and "vertices" / "indices" count
+        """
+        expanded = len(self.indices) * self.vertices.shape[1] * self.vertices.itemsize
+        indexed = self.vertices.nbytes + self.indices.nbytes
+        return {"expanded": expanded, "indexed": indexed, "indices": len(self.indices), "saved": expanded - indexed, "vertices": len(self.vertices)}
 
     def get_vbo(self) -> mgl.Buffer:
         """Return the buffers for the vertices
@@ -139,6 +265,34 @@ class VBO:
     
     def get_vertex_data(self): ...
 
+    @staticmethod
+    def index_vertex_data(vertex_data) -> tuple:
+        """Merge the identical vertices of a triangle list, keeping the order of their first use
+
+        Args:
+            vertex_data (np.ndarray): vertex data of each vertex of each triangle
+
+        Returns:
+            tuple: unique vertices (np.ndarray) and indices (np.ndarray) of the triangles
+        """
+        vertex_data = np.array(vertex_data, dtype="f4")
+        if len(vertex_data) <= 0: return (vertex_data, np.zeros(0, dtype="u2"))
+        vertices, first, inverse = np.unique(vertex_data, axis = 0, return_index = True, return_inverse = True)
+        order = np.argsort(first)
+        rank = np.empty(len(order), dtype=int)
+        rank[order] = np.arange(len(order))
+        index_type = "u2"
+        if len(vertices) > 65535: index_type = "u4"
+        return (np.ascontiguousarray(vertices[order]), rank[inverse.reshape(-1)].astype(index_type))
+
+    def load_indexed_data(self) -> tuple:
+        """Merge the identical vertices returned by get_vertex_data, keeping the order of their first use
+
+        Returns:
+            tuple: unique vertices (np.ndarray) and indices (np.ndarray) of the VBO
+        """
+        return VBO.index_vertex_data(self.get_vertex_data())
+
 class Triangle_VBO(VBO):
     """Class representing a 2D triangle VBO heritating from VBO
     """
@@ -200,13 +354,15 @@ class Cube_VBO(VBO):
     """Class representing a VBO of a cube, heritating from VBO
     """
 
-    def __init__(self, base_struct: bs.Base_Struct) -> None:
+    def __init__(self, base_struct: bs.Base_Struct, hidden_faces: list = None) -> None:
         """Create a cube vertex buffer object
 
         Args:
             base_struct (bs.Base_Struct): base struct in the game
+            hidden_faces (list, optional): faces not emitted (0 : +z, 1 : +x, 2 : -z, 3 : -x, 4 : +y, 5 : -y), the face content stays the 6 faces, or None for none. Defaults to None.
         """
         self.face_order = base_struct.get_face_order()["cube"]
+        self.hidden_faces = list(hidden_faces) if hidden_faces is not None else []
         super().__init__(base_struct)
 
         self.attributes = ["in_texcoord_0", "in_position", "in_face"]
@@ -219,9 +375,17 @@ class Cube_VBO(VBO):
             list: order of the face
         """
         return self.face_order
+
+    def get_hidden_faces(self) -> list:
+        """Return the faces not emitted into the VBO
+
+        Returns:
+            list: faces not emitted into the VBO
+        """
+        return self.hidden_faces
     
     def get_vertex_data(self):
-        """Return the data with the vertex
+        """Return the data with the vertex (without the hidden faces)
         """
         vertices = [(-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
                     (-1, 1, -1), (-1, -1, -1), (1, -1, -1), (1, 1, -1)]
@@ -252,33 +416,115 @@ class Cube_VBO(VBO):
 
         vertex_data = np.hstack([vertex_data, face])
         vertex_data = np.hstack([tex_coord_data, vertex_data])
+        if len(self.get_hidden_faces()) > 0:
+            vertex_data = vertex_data[np.repeat([self.get_hidden_faces().count(f) <= 0 for f in range(6)], 6)]
         return vertex_data
 
+class Baked_VBO(VBO):
+    """Class representating a VBO made from already computed vertex data, heritating from VBO
+    """
+
+    def __init__(self, base_struct: bs.Base_Struct, vertex_data: np.ndarray, attributes: list, format: str, face_content: list = None, indices: np.ndarray = None) -> None:
+        """Create a baked vertex buffer object
+
+        Args:
+            base_struct (bs.Base_Struct): base struct in the game
+            vertex_data (np.ndarray): vertex data of the VBO
+            attributes (list): attributes of the vertex data
+            format (str): format of the vertex data
+            face_content (list, optional): faces into the VBO, or None for none. Defaults to None.
+            indices (np.ndarray, optional): indices of the vertices of each triangle, or None if vertex_data is a triangle list. Defaults to None.
+        """
+        self.baked_indices = indices
+        self.vertex_data = vertex_data
+        super().__init__(base_struct)
+
+        self.attributes = attributes
+        self.face_content = face_content if face_content is not None else []
+        self.format = format
+
+    def get_face_order(self) -> list:
+        """Return the order of the face
+
+        Returns:
+            list: order of the face
+        """
+        return self.get_face_content()
+
+    def get_vertex_data(self):
+        """Return the data with the vertex
+        """
+        if self.baked_indices is None: return self.vertex_data
+        return self.vertex_data[self.baked_indices]
+
+    def load_indexed_data(self) -> tuple:
+        """Return the baked vertices and indices, or merge the identical vertices if no indices were given
+
+        Returns:
+            tuple: unique vertices (np.ndarray) and indices (np.ndarray) of the VBO
+        """
+        if self.baked_indices is None: return super().load_indexed_data()
+        index_type = "u2"
+        if len(self.vertex_data) > 65535: index_type = "u4"
+        return (np.ascontiguousarray(self.vertex_data, dtype="f4"), np.array(self.baked_indices).astype(index_type))
+
 class Loaded_VBO(VBO):
     """Class representating a VBO loaded from a file
     """
 
-    def __init__(self, base_struct: bs.Base_Struct, path: str) -> None:
+    def __init__(self, base_struct: bs.Base_Struct, path: str, lines: list = None, content: tuple = None) -> None:
         """Create a VBO from a file
 
         Args:
             base_struct (bs.Base_Struct): base structure of the game
+            path (str): path of the file
+            lines (list, optional): lines of an already generated file (see vbo_constructor.VBO_Constructor.get_lines), used instead of the path. Defaults to None.
+            content (tuple, optional): attributes, format, vertex data and faces of a mesh built in memory (see vbo_constructor.VBO_Constructor.get_content), used instead of the path and the lines. Defaults to None.
         """
+        self.content = content
         self.face_content = []
         self.lines = []
-        if os.path.exists(path):
-            file = open(path, "r")
-            self.lines = file.readlines()
-            for line in range(len(self.lines) - 1):
-                self.lines[line] = self.lines[line][:-1]
-            file.close()
+        if content != None:
+            pass
+        elif lines != None:
+            self.lines = list(lines)
+        else:
+            self.lines = Loaded_VBO.read_lines(path)
 
         super().__init__(base_struct)
 
-        if len(self.lines) > 0:
+        if content != None:
+            self.attributes = list(content[0])
+            self.format = content[1]
+        elif len(self.lines) > 0:
             self.attributes = self.lines[0].split(" ")
             self.format = self.lines[1]
 
+    @staticmethod
+    def expand(vertices: np.ndarray, indices: np.ndarray, vertices_texture: np.ndarray, indices_texture: np.ndarray, faces: np.ndarray = None) -> tuple:
+        """Return the vertex data of each vertex of each triangle of a mesh, and its faces
+
+        Args:
+            vertices (np.ndarray): positions, of shape (count, 3)
+            indices (np.ndarray): indices of the positions of each triangle, of shape (triangles, 3)
+            vertices_texture (np.ndarray): texture coordinates, of shape (count, 2)
+            indices_texture (np.ndarray): indices of the texture coordinates of each triangle, of shape (triangles, 3)
+            faces (np.ndarray, optional): face of each vertex of each triangle, or None. Defaults to None.
+
+        Returns:
+            tuple: vertex data (np.ndarray) and faces (list, in the order of their first use) of the mesh
+        """
+        vertex_data = np.asarray(vertices).astype("f4")[np.asarray(indices).reshape(-1)]
+        coord_data = np.asarray(vertices_texture).astype("f4")[np.asarray(indices_texture).reshape(-1)]
+
+        face_content = []
+        if faces is not None:
+            values, first = np.unique(faces, return_index = True)
+            face_content = values[np.argsort(first)].tolist()
+            vertex_data = np.hstack([vertex_data, np.asarray(faces).astype("f4").reshape(-1, 1)])
+        vertex_data = np.hstack([coord_data, vertex_data])
+        return (vertex_data, face_content)
+
     def get_face_order(self) -> list:
         """Return a list of the face order
 
@@ -293,70 +539,325 @@ class Loaded_VBO(VBO):
         Returns:
             np.Array: vertex data of the VBO
         """
-        indices = []
-        vertices = []
-        indices_temp = self.lines[3].split(" ")
-        vertices_temp = self.lines[2].split(" ")
-        for v in range(int(len(vertices_temp))):
-            vertices_temp[v] = float(vertices_temp[v])
-        for v in range(int(len(vertices_temp) / 3)):
-            vertices.append((vertices_temp[v * 3], vertices_temp[v * 3 + 1], vertices_temp[v * 3 + 2]))
-
-        for i in range(int(len(indices_temp))):
-            indices_temp[i] = int(indices_temp[i])
-        for v in range(int(len(indices_temp) / 3)):
-            indices.append((indices_temp[v * 3], indices_temp[v * 3 + 1], indices_temp[v * 3 + 2]))
-        vertex_data = self.get_data(vertices, indices)
-
-        indices_coord = []
-        vertices_coord = []
-        indices_coord_temp = self.lines[5].split(" ")
-        vertices_coord_temp = self.lines[4].split(" ")
-        for v in range(len(vertices_coord_temp)):
-            vertices_coord_temp[v] = float(vertices_coord_temp[v])
-        for v in range(int(len(vertices_coord_temp) / 2)):
-            vertices_coord.append((vertices_coord_temp[v * 2], vertices_coord_temp[v * 2 + 1]))
-
-        for i in range(len(indices_coord_temp)):
-            indices_coord_temp[i] = int(indices_coord_temp[i])
-        for i in range(int(len(indices_coord_temp) / 3)):
-            indices_coord.append((indices_coord_temp[i * 3], indices_coord_temp[i * 3 + 1], indices_coord_temp[i * 3 + 2]))
-        coord_data = self.get_data(vertices_coord, indices_coord)
-
-        if len(self.lines) > 6:
-            face = self.lines[6].split(" ")
-            self.face_content = []
-            for f in range(len(face)):
-                if self.face_content.count(int(face[f])) <= 0: self.face_content.append(int(face[f]))
-                face[f] = (int(face[f]),)
-            face = np.array(face, dtype="f4")
-
-            vertex_data = np.hstack([vertex_data, face])
-        vertex_data = np.hstack([coord_data, vertex_data])
+        if self.content != None:
+            self.face_content = list(self.content[3])
+            return self.content[2]
+        vertex_data, self.face_content = Loaded_VBO.parse_lines(self.lines)
         return vertex_data
 
+    @staticmethod
+    def parse_lines(lines: list) -> tuple:
+        """Return the vertex data and the faces of the lines of a vbo file, each line being tokenized at once and the indices expanded with fancy indexing
+
+        Args:
+            lines (list): lines of the vbo file, without the line breaks
+
+        Returns:
+            tuple: vertex data (np.ndarray) and faces (list) of the file
+        """
+        faces = None
+        if len(lines) > 6: faces = np.fromstring(lines[6], dtype="i8", sep=" ")
+        return Loaded_VBO.expand(Loaded_VBO.parse_numbers(lines[2], "f8", 3), Loaded_VBO.parse_numbers(lines[3], "i8", 3), Loaded_VBO.parse_numbers(lines[4], "f8", 2), Loaded_VBO.parse_numbers(lines[5], "i8", 3), faces)
+
+    @staticmethod
+    def parse_numbers(line: str, dtype: str, size: int) -> np.ndarray:
+        """Return the numbers of a line of a vbo file grouped by size (the last incomplete group is ignored)
+
+        Args:
+            line (str): line of numbers separated by spaces
+            dtype (str): type of the numbers
+            size (int): size of a group
+
+        Returns:
+            np.ndarray: numbers of the line, of shape (groups, size)
+        """
+        numbers = np.fromstring(line, dtype=dtype, sep=" ")
+        return numbers[:len(numbers) // size * size].reshape(-1, size)
+
+    @staticmethod
+    def read_lines(path: str) -> list:
+        """Return the lines of a vbo file without the line breaks, or an empty list if the file does not exist
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            list: lines of the file
+        """
+        lines = []
+        if bs.file_exists(path):
+            lines = bs.read_file(path).decode("utf-8").replace("\r\n", "\n").splitlines(True)
+            for line in range(len(lines) - 1):
+                lines[line] = lines[line][:-1]
+        return lines
+
+class Binary_VBO(VBO):
+    """Class representating a VBO loaded from a binary mesh file, memory-mapped and given to the GPU without any parsing, heritating from VBO
+
+    The file is a header (see HEADER), the attributes and the format separated by a line break (padded to 4 bytes),
+    the faces (i4), the unique vertices (f4, vertex_count x vertex_size) then the indices (u2 or u4), all little-endian.
+    The header keeps the hash of the vbo text file it was converted from, to know when the binary file is stale.
+    """
+
+    EXTENSION = ".vbob"
+    HEADER = np.dtype([("magic", "S8"), ("version", "<u4"), ("vertex_count", "<u4"), ("vertex_size", "<u4"), ("index_count", "<u4"), ("index_size", "<u4"), ("face_count", "<u4"), ("text_size", "<u4"), ("source_hash", "S40")])
+    MAGIC = b"MATIXVBO"
+    VERSION = 2
+
+    def __init__(self, base_struct: bs.Base_Struct, path: str) -> None:
+        """Create a VBO from a binary mesh file
+
+        Args:
+            base_struct (bs.Base_Struct): base structure of the game
+            path (str): path of the file
+        """
+        self.content = Binary_VBO.read(path)
+        self.path = path
+        super().__init__(base_struct)
+
+        self.attributes = self.content[0]
+        self.face_content = self.content[4]
+        self.format = self.content[1]
+
+    @staticmethod
+    def convert(path: str, binary_path: str = "") -> str:
+        """Convert a vbo text file into a binary mesh file, and return the path of the binary file
+
+        Args:
+            path (str): path of the vbo text file
+            binary_path (str, optional): path of the binary file, or "" for the path of the text file with the binary extension. Defaults to "".
+
+        Returns:
+            str: path of the binary file
+        """
+        if binary_path == "": binary_path = os.path.splitext(path)[0] + Binary_VBO.EXTENSION
+        lines = Loaded_VBO.read_lines(path)
+        vertex_data, face_content = Loaded_VBO.parse_lines(lines)
+        vertices, indices = VBO.index_vertex_data(vertex_data)
+        Binary_VBO.save(binary_path, lines[0].split(" "), lines[1], vertices, indices, face_content, Binary_VBO.get_source_hash(path))
+        return binary_path
+
+    def get_face_order(self) -> list:
+        """Return a list of the face order
+
+        Returns:
+            list: list of the face order
+        """
+        return [0, 1, 2, 3, 4, 5]
+
+    def get_path(self) -> str:
+        """Return the path of the binary mesh file
+
+        Returns:
+            str: path of the binary mesh file
+        """
+        return self.path
+
+    @staticmethod
+    def get_source_hash(path: str) -> str:
+        """Return the hash of a vbo text file, kept into the binary mesh files converted from it
+
+        Args:
+            path (str): path of the vbo text file
+
+        Returns:
+            str: hash of the file
+        """
+        return hashlib.sha1(bs.map_file(path)).hexdigest()
+
+    def get_vertex_data(self):
+        """Return the vertex data of each vertex of each triangle
+
+        Returns:
+            np.Array: vertex data of the VBO
+        """
+        return self.content[2][self.content[3]]
+
+    @staticmethod
+    def is_up_to_date(path: str, source_path: str) -> bool:
+        """Return if a binary mesh file was converted from the current content of a vbo text file, with the current version
+
+        Args:
+            path (str): path of the binary mesh file
+            source_path (str): path of the vbo text file
+
+        Returns:
+            bool: if the binary mesh file is up to date
+        """
+        header = Binary_VBO.read_header(path)[1]
+        return header is not None and header["source_hash"].decode("ascii") == Binary_VBO.get_source_hash(source_path)
+
+    def load_indexed_data(self) -> tuple:
+        """Return the memory-mapped vertices and indices of the file
+
+        Returns:
+            tuple: unique vertices (np.ndarray) and indices (np.ndarray) of the VBO
+        """
+        return (self.content[2], self.content[3])
+
+    @staticmethod
+    def read(path: str) -> tuple:
+        """Memory-map a binary mesh file
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            tuple: attributes (list), format (str), unique vertices (np.ndarray), indices (np.ndarray) and faces (list) of the file
+        """
+        empty = ([], "", np.zeros((0, 0), dtype="f4"), np.zeros(0, dtype="u2"), [])
+        if not bs.file_exists(path):
+            print("Matix binary VBO : Warning !! The file \"" + path + "\" does not exist.")
+            return empty
+        data, header = Binary_VBO.read_header(path)
+        if header is None:
+            print("Matix binary VBO : Warning !! The file \"" + path + "\" is not a binary mesh file of version " + str(Binary_VBO.VERSION) + ".")
+            return empty
+
+        offset = Binary_VBO.HEADER.itemsize
+        text = bytes(data[offset:offset + int(header["text_size"])]).decode("utf-8").split("\n")
+        offset += (int(header["text_size"]) + 3) // 4 * 4
+        faces = np.frombuffer(data, dtype="<i4", count=int(header["face_count"]), offset=offset)
+        offset += faces.nbytes
+        vertices = np.frombuffer(data, dtype="<f4", count=int(header["vertex_count"] * header["vertex_size"]), offset=offset).reshape(int(header["vertex_count"]), int(header["vertex_size"]))
+        offset += vertices.nbytes
+        indices = np.frombuffer(data, dtype="<u" + str(int(header["index_size"])), count=int(header["index_count"]), offset=offset)
+        return (text[0].split(" "), text[1], vertices, indices, faces.tolist())
+
+    @staticmethod
+    def read_header(path: str) -> tuple:
+        """Memory-map a binary mesh file and read its header
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            tuple: bytes of the file (np.ndarray) and header, or None if the file is not a binary mesh file of this version
+        """
+        data = bs.map_file(path)
+        if len(data) < Binary_VBO.HEADER.itemsize: return (data, None)
+        header = np.frombuffer(data, dtype=Binary_VBO.HEADER, count=1)[0]
+        if header["magic"] != Binary_VBO.MAGIC or header["version"] != Binary_VBO.VERSION: return (data, None)
+        return (data, header)
+
+    @staticmethod
+    def save(path: str, attributes: list, format: str, vertices: np.ndarray, indices: np.ndarray, face_content: list, source_hash: str = "") -> None:
+        """Save a mesh into a binary mesh file
+
+        Args:
+            path (str): path of the file
+            attributes (list): attributes of the vertices
+            format (str): format of the vertices
+            vertices (np.ndarray): unique vertices
+            indices (np.ndarray): indices of the vertices of each triangle (u2 or u4)
+            face_content (list): faces into the mesh
+            source_hash (str, optional): hash of the vbo text file the mesh comes from (see get_source_hash), or "". Defaults to "".
+        """
+        vertices = np.ascontiguousarray(vertices, dtype="<f4")
+        indices = np.ascontiguousarray(indices, dtype="<u" + str(indices.itemsize))
+        text = (" ".join(attributes) + "\n" + format).encode("utf-8")
+        header = np.zeros(1, dtype=Binary_VBO.HEADER)
+        header["magic"] = Binary_VBO.MAGIC
+        header["version"] = Binary_VBO.VERSION
+        header["vertex_count"], header["vertex_size"] = vertices.shape[0], vertices.shape[1] if vertices.ndim > 1 else 0
+        header["index_count"], header["index_size"] = len(indices), indices.itemsize
+        header["face_count"] = len(face_content)
+        header["text_size"] = len(text)
+        header["source_hash"] = source_hash.encode("ascii")
+
+        file = open(path, "wb")
+        file.write(header.tobytes())
+        file.write(text + b"\0" * ((4 - len(text) % 4) % 4))
+        file.write(np.array(face_content, dtype="<i4").tobytes())
+        file.write(vertices.tobytes())
+        file.write(indices.tobytes())
+        file.close()
+
+class LOD_Chain:
+    """Class representating the meshes of an object from the most to the least detailed, with the camera distances where they are switched
+    """
+
+    def __init__(self, vbos: list, distances: list, hysteresis: float = 0.1) -> None:
+        """Create a chain of level of detail
+
+        Args:
+            vbos (list): VBOs of each level, from the most to the least detailed
+            distances (list): distance from the camera where each level is replaced by the next one (one less than the VBOs)
+            hysteresis (float, optional): part of a distance to go past before switching again, to avoid popping. Defaults to 0.1.
+        """
+        self.distances = distances
+        self.hysteresis = hysteresis
+        self.vbos = vbos
+
+    def get_distances(self) -> list:
+        """Return the distance from the camera where each level is replaced by the next one
+
+        Returns:
+            list: distance from the camera where each level is replaced by the next one
+        """
+        return self.distances
+    
+    def get_hysteresis(self) -> float:
+        """Return the part of a distance to go past before switching again
+
+        Returns:
+            float: part of a distance to go past before switching again
+        """
+        return self.hysteresis
+
+    def get_level(self, distance: float, level: int = 0) -> int:
+        """Return the level to use at a distance from the camera, knowing the level currently used
+
+        Args:
+            distance (float): distance from the camera
+            level (int, optional): level currently used. Defaults to 0.
+
+        Returns:
+            int: level to use
+        """
+        while level < len(self.get_distances()) and distance > self.get_distances()[level] * (1 + self.get_hysteresis()):
+            level += 1
+        while level > 0 and distance < self.get_distances()[level - 1] * (1 - self.get_hysteresis()):
+            level -= 1
+        return level
+    
+    def get_vbos(self) -> list:
+        """Return the VBOs of each level, from the most to the least detailed
+
+        Returns:
+            list: VBOs of each level
+        """
+        return self.vbos
+
 class VAO:
     """Class representing a vertex array object
     """
 
-    def __init__(self, vbo: VBO, base_struct: bs.Base_Struct, shader_path = "shaders/triangle") -> None:
+    def __init__(self, vbo: VBO, base_struct: bs.Base_Struct, shader_path = "shaders/triangle", program: Shader_Program = None, instance_content: tuple = None) -> None:
         """Create a vertex array object
 
         Args:
             vbo (VBO): vbo for this VAO
             base_struct (bs.Base_Struct): base struct in the game
+            shader_path (str, optional): path of the program to compile if no program is given. Defaults to "shaders/triangle".
+            program (Shader_Program, optional): shared program used by the VAO, not destroyed with it. Defaults to None.
+            instance_content (tuple, optional): (buffer, format, *attributes) of the per-instance data. Defaults to None.
         """
         self.vbo = vbo
         self.base_struct = base_struct
-        self.program = Shader_Program(self.get_base_struct(), shader_path)
-
-        self.vao = self.get_base_struct().get_context().vertex_array(self.get_program().get_program(), [(vbo.get_vbo(), vbo.get_format(), *vbo.get_attributes())])
+        self.program = program
+        self.shared_program = program != None
+        if not self.has_shared_program():
+            self.program = Shader_Program(self.get_base_struct(), shader_path)
+
+        content = [(vbo.get_vbo(), vbo.get_format(), *vbo.get_attributes())]
+        if instance_content != None: content.append(instance_content)
+        self.vao = self.get_base_struct().get_context().vertex_array(self.get_program().get_program(), content, index_buffer = vbo.get_ibo(), index_element_size = vbo.get_index_element_size())
     
     def destroy(self) -> None:
-        """Destroy the VAO
+        """Destroy the VAO (the VBO and a shared program are owned by the advanced struct)
         """
-        self.vbo.destroy()
-        self.get_program().destroy()
+        if not self.has_shared_program(): self.get_program().destroy()
         self.get_vao().release()
     
     def get_base_struct(self) -> bs.Base_Struct:
@@ -391,58 +892,278 @@ class VAO:
         """
         return self.program
     
-    def render(self) -> None:
+    def has_shared_program(self) -> bool:
+        """Return if the program of the VAO is shared with other VAOs
+
+        Returns:
+            bool: if the program of the VAO is shared with other VAOs
+        """
+        return self.shared_program
+    
+    def render(self, instances: int = 1) -> None:
         """Render the VAO
+
+        Args:
+            instances (int, optional): number of instances to render. Defaults to 1.
         """
-        self.get_vao().render()
+        self.get_vao().render(instances = instances)
 
 class Texture:
     """Class representating a texture
     """
 
-    def __init__(self, base_struct: bs.Base_Struct, texture_path: str, flip: tuple = (False, True)) -> None:
+    PLACEHOLDER_PATH = "textures/unknow.png"
+    placeholder_image = None # Decoded once, for every placeholder
+
+    def __init__(self, base_struct: bs.Base_Struct, texture_path: str, flip: tuple = (False, True), asynchronous: bool = False) -> None:
         """Create a texture object
+
+        Args:
+            base_struct (bs.Base_Struct): base struct in the game
+            texture_path (str): path of the image
+            flip (tuple, optional): if the x and y textures should flip. Defaults to (False, True).
+            asynchronous (bool, optional): decode the image on the texture loader of the base struct, showing a placeholder until it is uploaded. Defaults to False.
         """
+        self.asynchronous = asynchronous
         self.base_struct = base_struct
+        self.destroyed = False
+        self.evicted = False
         self.flip = flip
+        self.layers_version = 0
+        self.loaded = False
         self.number_binded = 0
+        self.requested_size = 0
+        self.texture = None
         self.texture_path = texture_path
 
-        self.texture = self.load_texture(texture_path)
+        self.load()
 
-    def get_base_struct(self) -> bs.Base_Struct:
-        """Return the base struct of the game
+    @classmethod
+    def create_baker(cls, flip: tuple = (False, True)):
+        """Return a texture without base struct nor OpenGL texture, only able to decode images into a texture cache (see bake.py)
 
-        Returns:
-            bs.Base_Struct: base struct of the game
-        """
-        return self.base_struct
-    
-    def get_bind_number(self) -> int:
-        """Return the number binded for the texture
+        Args:
+            flip (tuple, optional): if the x and y textures should flip. Defaults to (False, True).
 
         Returns:
-            int: number binded for the texture
+            Texture: texture decoding the images
         """
-        return self.number_binded
-    
-    def get_flip(self) -> tuple:
-        """Return a tuple of bool is the x and y texture should flip
+        baker = cls.__new__(cls)
+        baker.base_struct = None
+        baker.flip = flip
+        return baker
 
-        Returns:
-            tuple: _tuple of bool is the x and y texture should flip
-        """
-        return self.flip
-    
-    def get_texture(self) -> mgl.Texture:
-        """Return the moderngl texture
+    def create_texture(self, decoded: tuple) -> mgl.Texture:
+        """Create the moderngl texture from a decoded image, on the main thread
+
+        Args:
+            decoded (tuple): size and RGBA data of the image, returned by decode
 
         Returns:
             mgl.Texture: moderngl texture
         """
-        return self.texture
-    
-    def get_texture_path(self) -> str:
+        texture = self.get_base_struct().get_context().texture(size = decoded[0], components = 4, data = decoded[1])
+        texture.filter = (mgl.LINEAR_MIPMAP_LINEAR, mgl.LINEAR)
+        texture.build_mipmaps()
+        texture.anisotropy = 32.0
+        return texture
+
+    def decode(self, path: str, directory: str = None) -> tuple:
+        """Return the decoded image, memory-mapped from the texture cache, or decoded and written into the cache, without using OpenGL so it can run on any thread
+
+        Args:
+            path (str): path of the image
+            directory (str, optional): directory of the texture cache, or None for the one of the base struct. Defaults to None.
+
+        Returns:
+            tuple: size and RGBA data of the image
+        """
+        if directory is None: directory = self.get_base_struct().get_texture_cache_path()
+        if directory == "": return self.decode_image(path)
+
+        cache_path = self.get_cache_path(path, directory)
+        if os.path.exists(cache_path):
+            try:
+                return self.from_array(np.load(cache_path, mmap_mode = "r"))
+            except (OSError, ValueError):
+                print("Matix texture : Warning !! The texture cache \"" + cache_path + "\" can't be read, it will be rebuilt.")
+
+        decoded = self.decode_image(path)
+        try:
+            os.makedirs(directory, exist_ok = True)
+            temporary_path = cache_path + "." + str(threading.get_ident()) + ".tmp"
+            with open(temporary_path, "wb") as file:
+                np.save(file, self.to_array(decoded))
+            os.replace(temporary_path, cache_path) # Other threads never see a partial file
+        except OSError:
+            print("Matix texture : Warning !! The texture cache \"" + cache_path + "\" can't be written.")
+        return decoded
+
+    def decode_content(self, path: str) -> tuple:
+        """Return the decoded image with the hash of its content, without using OpenGL so it can run on any thread
+
+        Args:
+            path (str): path of the image
+
+        Returns:
+            tuple: size and RGBA data of the image, hash of the content and size in bytes of the data
+        """
+        decoded = self.decode(path)
+        size = decoded[0][0] * decoded[0][1] * 4
+        return (decoded[0], decoded[1], bs.Asset_Registry.get_content_hash(decoded[0], decoded[1]), size)
+
+    def decode_image(self, path: str) -> tuple:
+        """Decode and flip an image, without using OpenGL so it can run on any thread
+
+        Args:
+            path (str): path of the image
+
+        Returns:
+            tuple: size and RGBA data of the image
+        """
+        surface = pg.transform.flip(pg.image.load(io.BytesIO(bs.read_file(path)), path), self.get_flip()[0], self.get_flip()[1])
+        return (surface.get_size(), pg.image.tostring(surface, "RGBA"))
+
+    def destroy(self) -> None:
+        """Release the moderngl texture, destroyed when no other texture share it (a placeholder is owned by the texture loader)
+        """
+        self.destroyed = True
+        if self.is_loaded():
+            self.get_base_struct().get_texture_residency_manager().remove(self)
+            if self.get_base_struct().get_asset_registry().release(self.get_texture(), self.requested_size):
+                self.get_base_struct().get_texture_unit_manager().release(self.get_texture())
+
+    def evict(self) -> None:
+        """Release the moderngl texture to free GPU memory and show the placeholder, the texture is loaded again the next time it is used (called by the texture residency manager)
+        """
+        if not self.is_loaded(): return
+        if self.get_base_struct().get_asset_registry().release(self.get_texture(), self.requested_size):
+            self.get_base_struct().get_texture_unit_manager().release(self.get_texture())
+        self.evicted = True
+        self.loaded = False
+        self.texture = self.get_placeholder()
+
+    def get_base_struct(self) -> bs.Base_Struct:
+        """Return the base struct of the game
+
+        Returns:
+            bs.Base_Struct: base struct of the game
+        """
+        return self.base_struct
+    
+    def from_array(self, array: np.ndarray) -> tuple:
+        """Return the decoded image stored into an array of shape (height, width, 4)
+
+        Args:
+            array (np.ndarray): array of the image
+
+        Returns:
+            tuple: size and RGBA data of the image
+        """
+        return ((array.shape[1], array.shape[0]), array)
+
+    def get_bind_number(self) -> int:
+        """Return the unit where the texture was bound the last time it was used
+
+        Returns:
+            int: unit where the texture was bound the last time
+        """
+        return self.number_binded
+    
+    def get_cache_path(self, path: str, directory: str) -> str:
+        """Return the path of the decoded image into a texture cache
+
+        Args:
+            path (str): path of the image
+            directory (str): directory of the texture cache
+
+        Returns:
+            str: path of the decoded image into the cache
+        """
+        return os.path.join(directory, self.get_cache_key(path) + ".npy")
+
+    def get_cache_key(self, path: str) -> str:
+        """Return the name of the decoded image into the texture cache, made from the content of the images and the flip, so it is the same from the disk or an asset pack
+
+        Args:
+            path (str): path of the image
+
+        Returns:
+            str: name of the decoded image into the texture cache
+        """
+        hash = hashlib.sha1(repr((type(self).__name__, tuple(self.get_flip()))).encode())
+        for p in self.get_source_paths(path):
+            hash.update(hashlib.sha1(bs.map_file(p)).digest())
+        return hash.hexdigest()
+
+    def get_flip(self) -> tuple:
+        """Return a tuple of bool is the x and y texture should flip
+
+        Returns:
+            tuple: _tuple of bool is the x and y texture should flip
+        """
+        return self.flip
+    
+    def get_layer(self, layer: int) -> int:
+        """Return the layer of the moderngl texture holding a layer of the images
+
+        Args:
+            layer (int): layer of the images
+
+        Returns:
+            int: layer of the moderngl texture
+        """
+        return layer
+
+    def get_layers_version(self) -> int:
+        """Return a number incremented each time the layers returned by get_layer change
+
+        Returns:
+            int: version of the layers of the texture
+        """
+        return self.layers_version
+
+    def get_placeholder(self) -> mgl.Texture:
+        """Return the texture shown while this texture is loading, shared by every texture
+
+        Returns:
+            mgl.Texture: texture shown while this texture is loading
+        """
+        placeholders = self.get_base_struct().get_texture_loader().get_placeholders()
+        if list(placeholders.keys()).count("texture") <= 0:
+            placeholders["texture"] = self.create_texture(self.get_placeholder_image())
+        return placeholders["texture"]
+
+    def get_placeholder_image(self) -> tuple:
+        """Return the decoded image of the placeholders
+
+        Returns:
+            tuple: size and RGBA data of the image of the placeholders
+        """
+        if Texture.placeholder_image == None:
+            Texture.placeholder_image = Texture.decode_image(self, Texture.PLACEHOLDER_PATH)
+        return Texture.placeholder_image
+
+    def get_source_paths(self, path: str) -> list:
+        """Return the paths of the images decoded for the texture
+
+        Args:
+            path (str): path of the texture
+
+        Returns:
+            list: paths of the images decoded for the texture
+        """
+        return [path]
+
+    def get_texture(self) -> mgl.Texture:
+        """Return the moderngl texture
+
+        Returns:
+            mgl.Texture: moderngl texture
+        """
+        return self.texture
+    
+    def get_texture_path(self) -> str:
         """Return the path of the texture
 
         Returns:
@@ -450,29 +1171,252 @@ class Texture:
         """
         return self.texture_path
 
+    def is_asynchronous(self) -> bool:
+        """Return if the texture is decoded on the texture loader of the base struct
+
+        Returns:
+            bool: if the texture is decoded on the texture loader
+        """
+        return self.asynchronous
+
+    def is_evicted(self) -> bool:
+        """Return if the texture was evicted by the texture residency manager and is not loaded again yet
+
+        Returns:
+            bool: if the texture was evicted
+        """
+        return self.evicted
+
+    def is_loaded(self) -> bool:
+        """Return if the real texture is uploaded, and not the placeholder
+
+        Returns:
+            bool: if the real texture is uploaded
+        """
+        return self.loaded
+
+    def load(self) -> None:
+        """Decode the texture (from the texture cache if it exists) and upload it, on the texture loader if the texture is asynchronous
+        """
+        if self.is_asynchronous():
+            self.texture = self.get_placeholder()
+            self.get_base_struct().get_texture_loader().submit(self.get_texture_path(), self.decode_content, self.upload, self.get_texture_path())
+        else:
+            self.upload(self.decode_content(self.get_texture_path()))
+
     def load_texture(self, path: str) -> mgl.Texture:
         """Load a texture
 
         Returns:
-            pg.Surface: texture loaded
+            mgl.Texture: texture loaded
+        """
+        return self.create_texture(self.decode(path))
+
+    def to_array(self, decoded: tuple) -> np.ndarray:
+        """Return a decoded image as an array of shape (height, width, 4)
+
+        Args:
+            decoded (tuple): size and RGBA data of the image
+
+        Returns:
+            np.ndarray: array of the image
+        """
+        return np.frombuffer(decoded[1], dtype="u1").reshape(decoded[0][1], decoded[0][0], 4)
+
+    def upload(self, decoded: tuple) -> None:
+        """Replace the placeholder by the decoded image, shared with the textures with the same content, on the main thread
+
+        Args:
+            decoded (tuple): decoded image, returned by decode_content
+        """
+        if self.destroyed: return
+        self.requested_size = decoded[3]
+        self.texture = self.get_base_struct().get_asset_registry().acquire("texture", decoded[2], int(np.prod(decoded[0])) * 4, lambda: self.create_texture(decoded), decoded[3])
+        self.evicted = False
+        self.loaded = True
+        self.get_base_struct().get_texture_residency_manager().add(self)
+
+    def use(self) -> int:
+        """Bind the texture to a unit of the pool if needed and return the unit, to write into a sampler uniform (an evicted texture is loaded again, showing the placeholder meanwhile if it is asynchronous)
+
+        Returns:
+            int: unit holding the texture
         """
-        texture = pg.image.load(path).convert_alpha()
-        texture = pg.transform.flip(texture, self.get_flip()[0], self.get_flip()[1])
-        texture = self.get_base_struct().get_context().texture(size = texture.get_size(), components = 4, data = pg.image.tostring(texture, "RGBA"))
+        if self.is_evicted():
+            self.evicted = False
+            self.load()
+        if self.is_loaded(): self.get_base_struct().get_texture_residency_manager().use(self)
+        self.number_binded = self.get_base_struct().get_texture_unit_manager().bind(self.get_texture())
+        return self.number_binded
+
+class Texture_Array(Texture):
+    """Class representating an array of same-sized textures (the face textures of a directory) sampled as one sampler2DArray, heritating from Texture
+    """
+
+    def __init__(self, base_struct: bs.Base_Struct, texture_path: str, flip: tuple = (False, True), asynchronous: bool = False) -> None:
+        """Create a texture array object
+
+        Args:
+            base_struct (bs.Base_Struct): base struct in the game
+            texture_path (str): directory of the textures (one layer per file, in the order of bs.get_all_files), or path of one image
+            flip (tuple, optional): if the x and y textures should flip. Defaults to (False, True).
+            asynchronous (bool, optional): decode the images on the texture loader of the base struct, showing a placeholder until they are uploaded. Defaults to False.
+        """
+        self.layer_count = len(self.get_layer_paths(texture_path)) # Known before decoding, the faces of the cubes depend on it
+        self.layers = list(range(self.layer_count))
+        super().__init__(base_struct, texture_path, flip, asynchronous)
+
+    def create_texture(self, decoded: tuple) -> mgl.TextureArray:
+        """Create the moderngl texture array from decoded images, on the main thread
+
+        Args:
+            decoded (tuple): size (with the layer count) and RGBA data of the layers, returned by decode
+
+        Returns:
+            mgl.TextureArray: moderngl texture array
+        """
+        texture = self.get_base_struct().get_context().texture_array(size = decoded[0], components = 4, data = decoded[1])
         texture.filter = (mgl.LINEAR_MIPMAP_LINEAR, mgl.LINEAR)
         texture.build_mipmaps()
         texture.anisotropy = 32.0
-
-        self.number_binded = self.get_base_struct().get_texture_count()
-        self.get_base_struct().set_texture_count(self.get_base_struct().get_texture_count() + 1)
-        texture.use(self.get_bind_number())
         return texture
 
+    def decode_image(self, path: str) -> tuple:
+        """Decode and flip every image of the directory (images with another size are scaled to the biggest one), without using OpenGL so it can run on any thread
+
+        Args:
+            path (str): directory of the images, or path of one image
+
+        Returns:
+            tuple: size (with the layer count) and RGBA data of the layers
+        """
+        surfaces = []
+        for p in self.get_layer_paths(path):
+            surfaces.append(pg.transform.flip(pg.image.load(io.BytesIO(bs.read_file(p)), p), self.get_flip()[0], self.get_flip()[1]))
+        size = (max([surface.get_width() for surface in surfaces]), max([surface.get_height() for surface in surfaces]))
+        data = b""
+        for surface in surfaces:
+            if surface.get_size() != size: surface = pg.transform.smoothscale(surface, size)
+            data += pg.image.tostring(surface, "RGBA")
+        return ((size[0], size[1], len(surfaces)), data)
+
+    def decode_content(self, path: str) -> tuple:
+        """Return the decoded layers without the duplicated ones, with the hash of their content, without using OpenGL so it can run on any thread
+
+        Args:
+            path (str): directory of the images, or path of one image
+
+        Returns:
+            tuple: size (with the unique layer count) and RGBA data of the unique layers, hash of the content, size in bytes of every layer and layer holding each image
+        """
+        decoded = self.decode(path)
+        array = self.to_array(decoded)
+        unique_layers = {}
+        layers = []
+        for l in range(len(array)):
+            layer_hash = bs.Asset_Registry.get_content_hash(array[l])
+            if list(unique_layers.keys()).count(layer_hash) <= 0: unique_layers[layer_hash] = len(unique_layers)
+            layers.append(unique_layers[layer_hash])
+        if len(unique_layers) < len(array):
+            first_layers = [layers.index(l) for l in range(len(unique_layers))]
+            decoded = self.from_array(np.ascontiguousarray(array[first_layers]))
+        return (decoded[0], decoded[1], bs.Asset_Registry.get_content_hash(decoded[0], decoded[1]), array.nbytes, layers)
+
+    def from_array(self, array: np.ndarray) -> tuple:
+        """Return the decoded layers stored into an array of shape (layers, height, width, 4)
+
+        Args:
+            array (np.ndarray): array of the layers
+
+        Returns:
+            tuple: size (with the layer count) and RGBA data of the layers
+        """
+        return ((array.shape[2], array.shape[1], array.shape[0]), array)
+
+    def get_layer_count(self) -> int:
+        """Return the number of layers into the array
+
+        Returns:
+            int: number of layers into the array
+        """
+        return self.layer_count
+
+    def get_layer(self, layer: int) -> int:
+        """Return the layer of the moderngl texture array holding a layer of the images (identical images share a layer)
+
+        Args:
+            layer (int): layer of the images
+
+        Returns:
+            int: layer of the moderngl texture array
+        """
+        if layer < 0 or layer >= len(self.layers): return layer
+        return self.layers[layer]
+
+    def get_layer_paths(self, path: str) -> list:
+        """Return the path of the image of each layer
+
+        Args:
+            path (str): directory of the images, or path of one image
+
+        Returns:
+            list: path of the image of each layer
+        """
+        if bs.is_directory(path):
+            return [file[0] for file in bs.get_all_files(path)]
+        return [path]
+
+    def get_placeholder(self) -> mgl.TextureArray:
+        """Return the texture array shown while this texture array is loading, shared by every texture array with the same layer count
+
+        Returns:
+            mgl.TextureArray: texture array shown while this texture array is loading
+        """
+        placeholders = self.get_base_struct().get_texture_loader().get_placeholders()
+        key = ("array", self.get_layer_count())
+        if list(placeholders.keys()).count(key) <= 0:
+            decoded = self.get_placeholder_image()
+            placeholders[key] = self.create_texture(((decoded[0][0], decoded[0][1], self.get_layer_count()), decoded[1] * self.get_layer_count()))
+        return placeholders[key]
+
+    def get_source_paths(self, path: str) -> list:
+        """Return the paths of the images decoded for the texture array
+
+        Args:
+            path (str): directory of the images, or path of one image
+
+        Returns:
+            list: paths of the images decoded for the texture array
+        """
+        return self.get_layer_paths(path)
+
+    def to_array(self, decoded: tuple) -> np.ndarray:
+        """Return decoded layers as an array of shape (layers, height, width, 4)
+
+        Args:
+            decoded (tuple): size (with the layer count) and RGBA data of the layers
+
+        Returns:
+            np.ndarray: array of the layers
+        """
+        return np.frombuffer(decoded[1], dtype="u1").reshape(decoded[0][2], decoded[0][1], decoded[0][0], 4)
+
+    def upload(self, decoded: tuple) -> None:
+        """Replace the placeholder by the decoded layers, shared with the texture arrays with the same content, on the main thread
+
+        Args:
+            decoded (tuple): decoded layers, returned by decode_content
+        """
+        if self.destroyed: return
+        super().upload(decoded)
+        self.layers = decoded[4]
+        self.layers_version += 1
+
 class Graphic_Object:
     """Class representating a graphic object
     """
 
-    def __init__(self, base_struct: bs.Base_Struct, texture: Texture, transform: bs.Transform_Object, vbo: VBO, shader_path: str = "shaders/triangle", texture_count_size: tuple = (1, 1), type: str = "graphic", do_on_init = True) -> None:
+    def __init__(self, base_struct: bs.Base_Struct, texture: Texture, transform: bs.Transform_Object, vbo: VBO, shader_path: str = "shaders/triangle", texture_count_size: tuple = (1, 1), type: str = "graphic", do_on_init = True, vao: VAO = None) -> None:
         """Create a graphic object
 
         Args:
@@ -480,22 +1424,32 @@ class Graphic_Object:
             position (tuple, optional): position of the plan. Defaults to (0, 0, 0).
             rotation (tuple, optional): rotation of the plan. Defaults to (0, 0, 0).
             type (str, optional): type of the object. Defaults to "graphic".
+            vao (VAO, optional): shared VAO loaded by the advanced struct, or None to create its own VAO. Defaults to None.
         """
         self.base_struct = base_struct
+        self.instance_version = 0
         self.texture_count_size = [texture_count_size]
         self.transform = transform
         self.type = type
+        self.lod_chain = None
+        self.lod_level = 0
+        self.lod_vaos = []
+        self.world_bounds = None
+        self.world_bounds_version = -1
 
         self.texture = [texture]
-        self.vao = VAO(vbo, self.get_base_struct(), shader_path)
+        self.shared_vao = vao != None
+        self.vao = vao
+        if not self.has_shared_vao():
+            self.vao = VAO(vbo, self.get_base_struct(), shader_path)
         self.vbo = vbo
 
         if do_on_init: self.on_init()
 
     def destroy(self) -> None:
-        """Destroy the graphic object
+        """Destroy the graphic object (a shared VAO is released by the advanced struct)
         """
-        self.vao.destroy()
+        if not self.has_shared_vao(): self.vao.destroy()
 
     def get_base_struct(self) -> bs.Base_Struct:
         """Return the base struct of the game
@@ -505,6 +1459,30 @@ class Graphic_Object:
         """
         return self.base_struct
     
+    def get_lod_chain(self) -> LOD_Chain:
+        """Return the level of detail chain of the object, or None
+
+        Returns:
+            LOD_Chain: level of detail chain of the object, or None
+        """
+        return self.lod_chain
+    
+    def get_lod_level(self) -> int:
+        """Return the level of detail used by the object
+
+        Returns:
+            int: level of detail used by the object
+        """
+        return self.lod_level
+    
+    def get_lod_vaos(self) -> list:
+        """Return the shared VAOs of each level of detail of the object
+
+        Returns:
+            list: shared VAOs of each level of detail
+        """
+        return self.lod_vaos
+
     def get_texture_count_size(self) -> list:
         """Return a list of number of texture
 
@@ -513,6 +1491,14 @@ class Graphic_Object:
         """
         return self.texture_count_size
     
+    def get_texture_layers(self) -> list:
+        """Return the layer of the texture used by each face
+
+        Returns:
+            list: layer of the texture used by each face
+        """
+        return [0]
+    
     def get_transform(self) -> bs.Transform_Object:
         """Return the transform object of this graphic object
 
@@ -529,6 +1515,35 @@ class Graphic_Object:
         """
         return self.type
     
+    def get_instance_data(self) -> np.ndarray:
+        """Return the per-instance data of the object : the model matrix, 8 texture count sizes then 8 texture layers
+
+        Returns:
+            np.ndarray: per-instance data of the object
+        """
+        texture_count_size = list(self.get_texture_count_size()[:8])
+        while len(texture_count_size) < 8: texture_count_size.append((1, 1))
+        texture_layers = [self.texture[0].get_layer(layer) for layer in self.get_texture_layers()[:8]]
+        while len(texture_layers) < 8: texture_layers.append(0)
+        model_matrix = np.frombuffer(self.get_transform().get_model_matrix().to_bytes(), dtype="f4")
+        return np.hstack([model_matrix, np.array(texture_count_size, dtype="f4").flatten(), np.array(texture_layers, dtype="f4")])
+    
+    def get_instance_key(self) -> tuple:
+        """Return the key of the instance group of the object (objects with the same VBO, program and textures can be drawn together)
+
+        Returns:
+            tuple: key of the instance group of the object
+        """
+        return (self.get_vbo(), self.get_vao().get_program().get_program_path(), tuple(self.texture))
+    
+    def get_instance_version(self) -> tuple:
+        """Return the versions of the transform, of the texture sizes and of the texture layers of the object, which change with its instance data
+
+        Returns:
+            tuple: versions of the instance data of the object
+        """
+        return (self.get_transform().get_world_version(), self.instance_version, self.texture[0].get_layers_version())
+    
     def get_vao(self) -> VAO:
         """Return the vao of the model
 
@@ -545,15 +1560,35 @@ class Graphic_Object:
         """
         return self.vbo
     
+    def get_world_bounds(self) -> tuple:
+        """Return the minimum and maximum corners of the axis aligned box containing the object in the world (recomputed only when the transform changes)
+
+        Returns:
+            tuple: minimum and maximum corners of the box, or an empty tuple if the object has no bounds
+        """
+        if self.world_bounds_version == self.get_transform().get_world_version(): return self.world_bounds
+
+        bounds = self.get_vbo().get_bounds()
+        self.world_bounds = ()
+        if len(bounds) > 0:
+            corners = np.array([(x, y, z, 1) for x in (bounds[0][0], bounds[1][0]) for y in (bounds[0][1], bounds[1][1]) for z in (bounds[0][2], bounds[1][2])], dtype="f4")
+            corners = corners @ np.frombuffer(self.get_transform().get_model_matrix().to_bytes(), dtype="f4").reshape(4, 4)
+            self.world_bounds = (corners[:, :3].min(axis = 0), corners[:, :3].max(axis = 0))
+        self.world_bounds_version = self.get_transform().get_world_version()
+        return self.world_bounds
+    
+    def has_shared_vao(self) -> bool:
+        """Return if the VAO of the object is shared with other objects
+
+        Returns:
+            bool: if the VAO of the object is shared with other objects
+        """
+        return self.shared_vao
+    
     def on_init(self) -> None:
-        """Init the uniform variables into the shader
+        """Init the uniform variables into the shader (the camera matrices are into the camera uniform buffer)
         """
-        self.get_vao().get_program().get_program()["m_model"].write(self.get_transform().get_model_matrix())
-        self.get_vao().get_program().get_program()["m_proj"].write(self.get_base_struct().get_camera_value().get_projection())
-        self.get_vao().get_program().get_program()["m_view"].write(self.get_base_struct().get_camera_value().get_view())
-        self.get_vao().get_program().get_program()["u_texture_0"] = self.texture[0].get_bind_number()
-        self.get_vao().get_program().get_program()["u_texture_count_size_0"].write(glm.vec2(self.get_texture_count_size()[0]))
-        self.get_base_struct().set_texture_count(self.get_base_struct().get_texture_count() + 1)
+        self.write_uniforms()
 
     def on_render(self) -> None:
         """Function called before the rendering of the object
@@ -564,10 +1599,31 @@ class Graphic_Object:
         """Render the model
         """
         self.on_render()
-        self.vao.get_program().get_program()["m_model"].write(self.get_transform().get_model_matrix())
-        self.vao.get_program().get_program()["m_view"].write(self.get_base_struct().get_camera_value().get_view())
+        self.write_uniforms()
         self.get_vao().render()
 
+    def set_lod(self, lod_chain: LOD_Chain, lod_vaos: list) -> None:
+        """Change the level of detail chain of the object, starting from its most detailed level
+
+        Args:
+            lod_chain (LOD_Chain): level of detail chain of the object
+            lod_vaos (list): shared VAOs of each level of detail, loaded by the advanced struct
+        """
+        self.lod_chain = lod_chain
+        self.lod_vaos = lod_vaos
+        self.set_lod_level(0)
+
+    def set_lod_level(self, level: int) -> None:
+        """Change the level of detail used by the object
+
+        Args:
+            level (int): level of detail used by the object
+        """
+        self.lod_level = level
+        self.vao = self.get_lod_vaos()[level]
+        self.vbo = self.get_lod_chain().get_vbos()[level]
+        self.world_bounds_version = -1
+
     def set_scale(self, scale: tuple, scale_texture: bool = False):
         """Change the scale of the object
 
@@ -576,39 +1632,68 @@ class Graphic_Object:
         """
         self.scale = scale
 
-        if scale_texture:
+        if scale_texture and self.texture_count_size[0] != scale:
             self.texture_count_size[0] = scale
+            self.instance_version += 1
 
     def update(self) -> None:
         """Update the graphic object
         """
         self.set_scale(self.get_transform().get_scale())
 
+    def update_lod(self, camera_position: tuple) -> bool:
+        """Use the level of detail matching the distance between the object and the camera, and return if it changed
+
+        Args:
+            camera_position (tuple): position of the camera into the world
+
+        Returns:
+            bool: if the level of detail changed
+        """
+        if self.get_lod_chain() == None: return False
+        position = self.get_transform().get_model_matrix()[3]
+        distance = math.sqrt((position[0] - camera_position[0]) ** 2 + (position[1] - camera_position[1]) ** 2 + (position[2] - camera_position[2]) ** 2)
+        level = self.get_lod_chain().get_level(distance, self.get_lod_level())
+        if level == self.get_lod_level(): return False
+        self.set_lod_level(level)
+        return True
+
+    def write_uniforms(self) -> None:
+        """Write the uniform variables of this object into the shader (the program may be shared by other objects)
+        """
+        self.get_vao().get_program().get_program()["m_model"].write(self.get_transform().get_model_matrix())
+        self.get_vao().get_program().get_program()["u_texture_0"] = self.texture[0].use()
+        self.get_vao().get_program().get_program()["u_texture_count_size_0"].write(glm.vec2(self.get_texture_count_size()[0]))
+
 class Cube_Object(Graphic_Object):
     """Class representating a graphic cube, heritating from Graphics_Object
     """
 
-    def __init__(self, base_struct: bs.Base_Struct, texture: list, transform: bs.Transform_Object, vbo: VBO, one_texture: bool = False, scale_texture: bool = True, shader_path: str = "shaders/cube", texture_count_size: list = ((1, 1), (1, 1), (1, 1), (1, 1), (1, 1), (1, 1)), type: str = "cube") -> None:
+    def __init__(self, base_struct: bs.Base_Struct, texture: Texture_Array, transform: bs.Transform_Object, vbo: VBO, one_texture: bool = False, scale_texture: bool = True, shader_path: str = "shaders/cube", texture_count_size: list = ((1, 1), (1, 1), (1, 1), (1, 1), (1, 1), (1, 1)), type: str = "cube", vao: VAO = None, texture_layers: list = None) -> None:
         """Create a graphics cube
 
         Args:
             base_struct (bs.Base_Struct): base struct in the game
             vao (VAO): vertex array object for the cube
-            texture (list): list of textures into the cube
+            texture (Texture_Array): texture array with one layer per texture of the cube
             position (tuple, optional): position of the cube. Defaults to (0, 0, 0).
             rotation (tuple, optional): rotation of the cube. Defaults to (0, 0, 0).
             scale (tuple, optional): scale of the cube. Defaults to (0, 0, 0).
             type (str, optional): tpe fo the cube. Defaults to "cube".
+            vao (VAO, optional): shared VAO loaded by the advanced struct. Defaults to None.
+            texture_layers (list, optional): layer used by each face, or None to deduce it from the faces of the VBO. Defaults to None.
         """
         self.one_texture = one_texture
         self.scale_texture = scale_texture
+        self.texture_layers = [0]
         self.texture_scale = (1, 1, 1)
-        super().__init__(base_struct, texture[0], transform, vbo, shader_path, texture_count_size[0], type, False)
+        super().__init__(base_struct, texture, transform, vbo, shader_path, texture_count_size[0], type, False, vao)
 
         if not self.has_one_texture():
             for i in self.get_vbo().get_face_content()[1:]:
-                self.texture.append(texture[i])
+                self.texture_layers.append(min(i, texture.get_layer_count() - 1))
                 self.texture_count_size.append(texture_count_size[i])
+        if texture_layers != None: self.texture_layers = list(texture_layers)
         if self.scale_texture: self.set_scale(self.get_transform().get_scale())
         self.on_init()
 
@@ -620,6 +1705,14 @@ class Cube_Object(Graphic_Object):
         """
         return self.scale_texture
 
+    def get_texture_layers(self) -> list:
+        """Return the layer of the texture array used by each face
+
+        Returns:
+            list: layer of the texture array used by each face
+        """
+        return self.texture_layers
+
     def get_texture_scale(self) -> tuple:
         """Return how the texture is scaled
 
@@ -636,16 +1729,6 @@ class Cube_Object(Graphic_Object):
         """
         return self.one_texture
 
-    def on_init(self) -> None:
-        """Init the uniform variables into the shader
-        """
-        self.get_vao().get_program().get_program()["m_model"].write(self.get_transform().get_model_matrix())
-        self.get_vao().get_program().get_program()["m_proj"].write(self.get_base_struct().get_camera_value().get_projection())
-        self.get_vao().get_program().get_program()["m_view"].write(self.get_base_struct().get_camera_value().get_view())
-        for t in range(len(self.texture)):
-            self.get_vao().get_program().get_program()["u_texture_" + str(t)] = self.texture[t].get_bind_number()
-            self.get_vao().get_program().get_program()["u_texture_count_size_" + str(t)].write(glm.vec2(self.get_texture_count_size()[t]))
-
     def set_scale(self, scale: tuple):
         """Change the scale of the object
 
@@ -668,10 +1751,230 @@ class Cube_Object(Graphic_Object):
                 self.texture_count_size[self.get_vbo().get_face_order()[3]] = (scale[2], self.get_texture_count_size()[self.get_vbo().get_face_order()[3]][1])
                 self.texture_count_size[self.get_vbo().get_face_order()[4]] = (self.get_texture_count_size()[self.get_vbo().get_face_order()[4]][0], scale[2])
                 self.texture_count_size[self.get_vbo().get_face_order()[5]] = (self.get_texture_count_size()[self.get_vbo().get_face_order()[5]][0], scale[2])
+            if tuple(self.get_texture_scale()) != tuple(scale): self.instance_version += 1
             self.texture_scale = scale
         
         self.scale = scale
 
+    def write_uniforms(self) -> None:
+        """Write the uniform variables of this cube into the shader (the program may be shared by other objects)
+        """
+        data = self.get_instance_data()
+        self.get_vao().get_program().get_program()["m_model"].write(data[:16].tobytes())
+        self.get_vao().get_program().get_program()["u_texture_0"] = self.texture[0].use()
+        self.get_vao().get_program().get_program()["u_texture_count_sizes"].write(data[16:32].tobytes())
+        self.get_vao().get_program().get_program()["u_texture_layers"].write(data[32:40].tobytes())
+
+class Instance_Group:
+    """Class representating a group of graphic objects sharing a VBO and textures, rendered with one instanced draw call
+    """
+
+    INSTANCE_SIZE = 40
+
+    def __init__(self, base_struct: bs.Base_Struct, program: Shader_Program, vbo: VBO, texture: list, objects: list) -> None:
+        """Create an instance group
+
+        Args:
+            base_struct (bs.Base_Struct): base struct in the game
+            program (Shader_Program): shared program compiled with the "INSTANCED" define
+            vbo (VBO): VBO shared by every object of the group
+            texture (list): textures shared by every object of the group
+            objects (list): graphic objects into the group
+        """
+        self.base_struct = base_struct
+        self.instance_count = 0
+        self.objects = list(objects)
+        self.program = program
+        self.slots = dict([(self.objects[i], i) for i in range(len(self.objects))])
+        self.slot_versions = [None] * len(self.objects)
+        self.texture = texture
+        self.uploaded_instances = 0
+        self.visible = np.zeros(len(self.objects), dtype=bool)
+
+        # Each object keeps its slot (its instance) until it leaves the group
+        self.instance_data = np.zeros((len(self.objects), Instance_Group.INSTANCE_SIZE), dtype="f4")
+        self.capacity = max(1, len(self.objects))
+        self.instance_buffer = self.get_base_struct().get_context().buffer(reserve = self.capacity * self.instance_data.itemsize * Instance_Group.INSTANCE_SIZE)
+        self.vao = VAO(vbo, self.get_base_struct(), program.get_program_path(), program, (self.instance_buffer, *self.get_instance_format()))
+
+        self.update_instances(True)
+
+    def add_object(self, object: Graphic_Object) -> None:
+        """Add an object into the last slot of the group, without touching the slots of the other objects
+
+        Args:
+            object (Graphic_Object): object to add
+        """
+        if list(self.slots.keys()).count(object) > 0: return
+        self.slots[object] = len(self.objects)
+        self.objects.append(object)
+        self.slot_versions.append(None)
+        self.instance_data = np.vstack([self.instance_data, np.zeros((1, Instance_Group.INSTANCE_SIZE), dtype="f4")])
+        self.visible = np.append(self.visible, False)
+
+        # A full buffer is reallocated with twice its capacity, then every instance is uploaded again
+        if len(self.objects) > self.capacity:
+            self.capacity *= 2
+            self.instance_buffer.orphan(self.capacity * self.instance_data.itemsize * Instance_Group.INSTANCE_SIZE)
+            self.write_instances(0, len(self.objects))
+
+    def destroy(self) -> None:
+        """Destroy the instance group (the program is released by the advanced struct)
+        """
+        self.get_vao().destroy()
+        self.instance_buffer.release()
+
+    def get_base_struct(self) -> bs.Base_Struct:
+        """Return the base struct of the game
+
+        Returns:
+            bs.Base_Struct: base struct of the game
+        """
+        return self.base_struct
+    
+    def get_instance_count(self) -> int:
+        """Return the number of instances drawn, up to the last visible slot (the hidden slots before it draw nothing)
+
+        Returns:
+            int: number of instances drawn
+        """
+        return self.instance_count
+    
+    def get_instance_format(self) -> list:
+        """Return the format and the attributes of the instance buffer, with padding for the texture count sizes and layers unused by the program
+
+        Returns:
+            list: format then attributes of the instance buffer
+        """
+        format = "16f"
+        attributes = ["in_model"]
+        for name in ["in_texture_count_size_01", "in_texture_count_size_23", "in_texture_count_size_45", "in_texture_count_size_67", "in_texture_layers_0123", "in_texture_layers_4567"]:
+            if name in self.get_program().get_program():
+                format += " 4f"
+                attributes.append(name)
+            else:
+                format += " 16x"
+        return [format + "/i", *attributes]
+    
+    def get_objects(self) -> list:
+        """Return the objects into the group, in the order of their slots
+
+        Returns:
+            list: objects into the group
+        """
+        return self.objects
+    
+    def get_program(self) -> Shader_Program:
+        """Return the program of the group
+
+        Returns:
+            Shader_Program: program of the group
+        """
+        return self.program
+    
+    def get_uploaded_instances(self) -> int:
+        """Return the number of instances uploaded to the GPU during the last update
+
+        Returns:
+            int: number of instances uploaded during the last update
+        """
+        return self.uploaded_instances
+    
+    def get_vao(self) -> VAO:
+        """Return the VAO of the group
+
+        Returns:
+            VAO: VAO of the group
+        """
+        return self.vao
+
+    def remove_object(self, object: Graphic_Object) -> None:
+        """Remove an object from the group, the object of the last slot is moved into its slot
+
+        Args:
+            object (Graphic_Object): object to remove
+        """
+        if list(self.slots.keys()).count(object) <= 0: return
+        slot = self.slots.pop(object)
+        last = len(self.objects) - 1
+        if slot != last:
+            moved = self.objects[last]
+            self.objects[slot] = moved
+            self.slots[moved] = slot
+            self.instance_data[slot] = self.instance_data[last]
+            self.slot_versions[slot] = self.slot_versions[last]
+            self.visible[slot] = self.visible[last]
+            self.write_instances(slot, slot + 1)
+        self.objects.pop()
+        self.slot_versions.pop()
+        self.instance_data = self.instance_data[:last]
+        self.visible = self.visible[:last]
+        visible_slots = np.flatnonzero(self.visible)
+        self.instance_count = int(visible_slots[-1]) + 1 if len(visible_slots) > 0 else 0
+
+    def render(self, objects: list = None) -> None:
+        """Render objects of the group in one draw call
+
+        Args:
+            objects (list, optional): objects of the group to render (the visible ones), or None for every object. Defaults to None.
+        """
+        self.update_instances(objects = objects)
+        if self.get_instance_count() <= 0: return
+        for t in range(len(self.texture)):
+            self.get_program().get_program()["u_texture_" + str(t)] = self.texture[t].use()
+        self.get_vao().render(self.get_instance_count())
+
+    def update_instances(self, force: bool = False, objects: list = None) -> None:
+        """Upload the instance data of the objects whose transform, texture sizes or texture layers changed since the last update, and empty the slots of the hidden objects
+
+        Args:
+            force (bool, optional): upload every instance. Defaults to False.
+            objects (list, optional): visible objects of the group, or None for every object. Defaults to None.
+        """
+        if objects == None: objects = self.get_objects()
+        visible = np.zeros(len(self.get_objects()), dtype=bool)
+        dirty = []
+        for object in objects:
+            slot = self.slots[object]
+            visible[slot] = True
+            object.on_render()
+            version = object.get_instance_version()
+            if force or self.slot_versions[slot] != version: # Clean objects are skipped before building their data
+                self.instance_data[slot] = object.get_instance_data()
+                self.slot_versions[slot] = version
+                dirty.append(slot)
+
+        # A hidden object keeps its slot, with an empty model matrix drawing nothing
+        hidden = ~visible
+        if not force: hidden &= self.visible
+        for slot in np.flatnonzero(hidden):
+            self.instance_data[slot] = 0
+            self.slot_versions[slot] = None
+            dirty.append(int(slot))
+        self.visible = visible
+        visible_slots = np.flatnonzero(visible)
+        self.instance_count = int(visible_slots[-1]) + 1 if len(visible_slots) > 0 else 0
+
+        # Upload each range of consecutive changed slots
+        self.uploaded_instances = 0
+        dirty.sort()
+        start = 0
+        for i in range(1, len(dirty) + 1):
+            if i == len(dirty) or dirty[i] != dirty[i - 1] + 1:
+                self.write_instances(dirty[start], dirty[i - 1] + 1)
+                start = i
+
+    def write_instances(self, start: int, end: int) -> None:
+        """Upload the instance data of a range of slots to the GPU
+
+        Args:
+            start (int): first slot of the range
+            end (int): slot after the last slot of the range
+        """
+        if end <= start: return
+        self.instance_buffer.write(self.instance_data[start:end].tobytes(), offset = start * self.instance_data.itemsize * Instance_Group.INSTANCE_SIZE)
+        self.uploaded_instances += end - start
+
 class HUD(Graphic_Object):
     """Class representating the HUD screen, heritating from Graphics_Object
     """
@@ -695,15 +1998,13 @@ class HUD(Graphic_Object):
     def on_init(self) -> None:
         """Init the uniform variables into the shader
         """
-        self.get_vao().get_program().get_program()["u_texture_0"] = self.get_base_struct().get_texture_count()
-        self.texture[0].get_texture().use(self.get_base_struct().get_texture_count())
-        self.get_base_struct().set_texture_count(self.get_base_struct().get_texture_count() + 1)
 
     def render(self) -> None:
         """Render the HUD into the screen
         """
         self.on_render()
         self.vao.get_program().get_program()["m_model"].write(self.get_transform().get_model_matrix())
+        self.vao.get_program().get_program()["u_texture_0"] = self.texture[0].use()
         self.get_vao().render()
 
 class Part:
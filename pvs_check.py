@@ -0,0 +1,55 @@
+# pvs_check.py
+# File used to check that the potentially visible set never misses a wall seen through a narrow gap, against a densely sampled one
+
+# Import librairies
+import numpy as np
+import scene as sc
+import sys
+import time
+
+def get_gap_map(gap: int, wall_x: int, size: int = 16) -> sc.Scene_2D:
+    """Return a closed map split in two by a wall with a gap of one cell
+
+    Args:
+        gap (int): y of the gap into the wall
+        wall_x (int): x of the wall
+        size (int, optional): width and height of the map. Defaults to 16.
+
+    Returns:
+        sc.Scene_2D: 2d scene of the map
+    """
+    scene_2d = sc.Scene_2D((size, size))
+    scene_2d.fill("0")
+    for i in range(size):
+        if i != gap: scene_2d.map[wall_x][i] = "1"
+        scene_2d.map[0][i], scene_2d.map[size - 1][i], scene_2d.map[i][0], scene_2d.map[i][size - 1] = "1", "1", "1", "1"
+    return scene_2d
+
+def compare(name: str, scene_2d: sc.Scene_2D, chunk_size: int = 2) -> bool:
+    """Compare the potentially visible set of a map with a densely sampled one, without margin, and print the chunks it misses
+
+    Args:
+        name (str): name of the map
+        scene_2d (sc.Scene_2D): 2d scene of the map
+        chunk_size (int, optional): size of a chunk in cells. Defaults to 2.
+
+    Returns:
+        bool: if every chunk seen by the dense one is into the potentially visible set
+    """
+    start = time.perf_counter()
+    pvs = scene_2d.build_pvs(["1"], chunk_size)
+    duration = time.perf_counter() - start
+    reference = scene_2d.build_pvs(["1"], chunk_size, ray_count = 2000, sample_count = 4, margin = 0)
+    missed = [tuple(int(value) for value in index) for index in np.argwhere(reference & ~pvs)]
+    print(name + " : built in " + str(round(duration, 3)) + " s, " + str(round(float(pvs.mean()) * 100, 1)) + " % visible, " + str(len(missed)) + " chunks missed " + str(missed[:4]))
+    return len(missed) == 0
+
+if __name__ == "__main__":
+    # The wall at x = 15, y = 2 or 3 is only seen from the cell (2, 14) through the gap, at a grazing angle
+    narrow_gap = get_gap_map(13, 3)
+    conservative = narrow_gap.build_pvs(["1"], 2)[2, 14, 7, 1]
+    print("wall seen through the gap : " + ("visible" if conservative else "missed"))
+    conservative = compare("gap at y = 13 into the wall x = 3", narrow_gap) and conservative
+    for gap, wall_x in [(8, 5), (2, 8), (3, 12)]:
+        conservative = compare("gap at y = " + str(gap) + " into the wall x = " + str(wall_x), get_gap_map(gap, wall_x)) and conservative
+    if not conservative: sys.exit(1)
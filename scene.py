@@ -2,10 +2,12 @@
 import advanced_struct as ad
 import base_struct as bs
 import glm
+import hashlib
 import math
 import model
 import moderngl as mgl
 import numpy as np
+import os
 import physic as ps
 import player as pl
 import pygame as pg
@@ -15,16 +17,87 @@ class Scene_2D:
     """Class representing a 2d scene
     """
 
+    PVS_VERSION = 2
+
     def __init__(self, scene_size: tuple) -> None:
         """Create a 2d scene
         """
         self.map_path = ""
         self.objects = {}
         self.pos = (0, 0)
+        self.pvs = None
+        self.pvs_chunk_size = 4
         self.scene_size = scene_size
 
         self.fill(0)
 
+    def build_pvs(self, solid_parts: list, chunk_size: int = 4, ray_count: int = 720, sample_count: int = 3, margin: int = 1) -> np.ndarray:
+        """Compute the potentially visible set of the map by raycasting across the grid : for each cell, the chunks of chunk_size * chunk_size cells containing a visible wall
+
+        The rays only sample the view, so the chunks around each chunk hit are also visible : a wall seen between two rays or two sample points
+        (through a narrow gap or at a grazing angle) is close to a wall hit by a ray, and does not pop in when the player moves.
+
+        Args:
+            solid_parts (list): parts of the map which block the view
+            chunk_size (int, optional): size of a chunk in cells. Defaults to 4.
+            ray_count (int, optional): number of ray directions cast from each sample point. Defaults to 720.
+            sample_count (int, optional): number of sample points per side of a cell, from border to border. Defaults to 3.
+            margin (int, optional): number of chunks around each chunk hit also visible. Defaults to 1.
+
+        Returns:
+            np.ndarray: boolean array of shape (width, height, chunk width, chunk height), every chunk is visible from a solid cell
+        """
+        size = self.get_scene_size()
+        chunk_count = (math.ceil(size[0] / chunk_size), math.ceil(size[1] / chunk_size))
+        walls = np.array([[list(solid_parts).count(self.get_part_at(i, j)) > 0 for j in range(size[1])] for i in range(size[0])], dtype=bool)
+        floors = np.argwhere(~walls)
+        pvs = np.ones((size[0], size[1], chunk_count[0], chunk_count[1]), dtype=bool)
+        if len(floors) <= 0: return pvs
+
+        # One ray per floor cell, sample point and direction
+        samples = np.linspace(0.01, 0.99, sample_count) # Include the borders of the cell, where the view is the widest
+        samples = np.array([(x, y) for x in samples for y in samples])
+        angles = np.arange(ray_count) * (2 * math.pi / ray_count)
+        directions = np.stack([np.cos(angles), np.sin(angles)], axis = 1)
+        visible = np.zeros((len(floors), chunk_count[0], chunk_count[1]), dtype=bool)
+        batch_size = max(1, 65536 // (len(samples) * ray_count)) # Floor cells traced together, to bound the memory used
+        for first in range(0, len(floors), batch_size):
+            batch = floors[first:first + batch_size]
+            floor_index = np.repeat(np.arange(first, first + len(batch)), len(samples) * ray_count)
+            origin = np.repeat((batch[:, None, :] + samples[None, :, :]).reshape(-1, 2), ray_count, axis = 0)
+            direction = np.tile(directions, (len(batch) * len(samples), 1))
+
+            # Walk the grid cell by cell along every ray (Amanatides and Woo traversal) until a wall or the border is reached
+            cell = np.floor(origin).astype(int)
+            step = np.where(direction >= 0, 1, -1)
+            with np.errstate(divide = "ignore"):
+                delta = np.abs(1.0 / direction)
+                t_max = np.where(direction >= 0, cell + 1 - origin, origin - cell) * delta
+            for _ in range(size[0] + size[1] + 2):
+                axis = (t_max[:, 1] < t_max[:, 0]).astype(int)
+                rows = np.arange(len(cell))
+                cell[rows, axis] += step[rows, axis]
+                t_max[rows, axis] += delta[rows, axis]
+
+                inside = np.all((cell >= 0) & (cell < size), axis = 1)
+                hit = np.zeros(len(cell), dtype=bool)
+                hit[inside] = walls[cell[inside, 0], cell[inside, 1]]
+                visible[floor_index[hit], cell[hit, 0] // chunk_size, cell[hit, 1] // chunk_size] = True
+
+                active = inside & ~hit
+                if not np.any(active): break
+                cell, step, delta, t_max, floor_index = cell[active], step[active], delta[active], t_max[active], floor_index[active]
+
+        # Grow the chunks hit by the margin, so the PVS stays conservative between the rays
+        grown = visible.copy()
+        for dx in range(-margin, margin + 1):
+            for dy in range(-margin, margin + 1):
+                source = visible[:, max(0, -dx):chunk_count[0] - max(0, dx), max(0, -dy):chunk_count[1] - max(0, dy)]
+                grown[:, max(0, dx):chunk_count[0] - max(0, -dx), max(0, dy):chunk_count[1] - max(0, -dy)] |= source
+
+        pvs[floors[:, 0], floors[:, 1]] = grown
+        return pvs
+
     def fill(self, part: int) -> None:
         """Fill the map with a part
 
@@ -39,6 +112,64 @@ class Scene_2D:
                 line.append(part)
             self.map.append(line)
 
+    def get_boxes(self, parts: list, chunk_size: int = 0) -> list:
+        """Merge the adjacent cells of the same part into rectangles, greedily (the longest run along x first, then grown along y)
+
+        Args:
+            parts (list): parts to merge, the other cells are empty
+            chunk_size (int, optional): size in cells of the chunks a rectangle can not go out of, or 0 for no limit. Defaults to 0.
+
+        Returns:
+            list: part, first x, first y, width and depth in cells of each rectangle
+        """
+        size = self.get_scene_size()
+        used = np.zeros((size[0], size[1]), dtype=bool)
+
+        def mergeable(x: int, y: int, part, first: tuple) -> bool:
+            if x >= size[0] or y >= size[1] or used[x, y] or self.get_part_at(x, y) != part: return False
+            return chunk_size <= 0 or (x // chunk_size == first[0] // chunk_size and y // chunk_size == first[1] // chunk_size)
+
+        boxes = []
+        for y in range(size[1]):
+            for x in range(size[0]):
+                part = self.get_part_at(x, y)
+                if used[x, y] or parts.count(part) <= 0: continue
+                width = 1
+                while mergeable(x + width, y, part, (x, y)): width += 1
+                depth = 1
+                while all([mergeable(x + i, y + depth, part, (x, y)) for i in range(width)]): depth += 1
+                used[x:x + width, y:y + depth] = True
+                boxes.append((part, x, y, width, depth))
+        return boxes
+
+    def get_hidden_faces(self, x: int, y: int, parts: list, width: int = 1, depth: int = 1) -> list:
+        """Return the side faces of a rectangle of cells fully covered by neighbour cells of the parts, which can never be seen
+
+        Args:
+            x (int): first x of the rectangle
+            y (int): first y of the rectangle
+            parts (list): parts hiding the faces (the cube parts, the other parts do not fully cover a face)
+            width (int, optional): width in cells of the rectangle. Defaults to 1.
+            depth (int, optional): depth in cells of the rectangle. Defaults to 1.
+
+        Returns:
+            list: hidden faces of the cube drawn for the rectangle (0 : +z, 1 : +x, 2 : -z, 3 : -x, see model.Cube_VBO)
+        """
+        size = self.get_scene_size()
+
+        def solid(cells: list) -> bool:
+            for cell in cells:
+                if cell[0] < 0 or cell[1] < 0 or cell[0] >= size[0] or cell[1] >= size[1]: return False
+                if parts.count(self.get_part_at(cell[0], cell[1])) <= 0: return False
+            return True
+
+        hidden_faces = []
+        if solid([(x + i, y + depth) for i in range(width)]): hidden_faces.append(0)
+        if solid([(x + width, y + j) for j in range(depth)]): hidden_faces.append(1)
+        if solid([(x + i, y - 1) for i in range(width)]): hidden_faces.append(2)
+        if solid([(x - 1, y + j) for j in range(depth)]): hidden_faces.append(3)
+        return hidden_faces
+
     def get_map_path(self) -> str:
         """Return the path of the map
 
@@ -70,6 +201,37 @@ class Scene_2D:
             tuple: pos of the first part of the map
         """
         return self.pos
+    
+    def get_pvs(self) -> np.ndarray:
+        """Return the potentially visible set of the map, or None if it is not loaded
+
+        Returns:
+            np.ndarray: potentially visible set of the map, or None
+        """
+        return self.pvs
+    
+    def get_pvs_chunk_size(self) -> int:
+        """Return the size in cells of a chunk of the potentially visible set
+
+        Returns:
+            int: size in cells of a chunk of the potentially visible set
+        """
+        return self.pvs_chunk_size
+    
+    def get_pvs_key(self, solid_parts: list, chunk_size: int) -> str:
+        """Return a key identifying the potentially visible set of the map with these parameters
+
+        Args:
+            solid_parts (list): parts of the map which block the view
+            chunk_size (int): size of a chunk in cells
+
+        Returns:
+            str: key identifying the potentially visible set
+        """
+        hash = hashlib.sha1()
+        hash.update(str((Scene_2D.PVS_VERSION, sorted([str(part) for part in solid_parts]), chunk_size, self.get_scene_size())).encode())
+        hash.update("".join(["".join([str(part) for part in line]) for line in self.map]).encode())
+        return hash.hexdigest()
 
     def get_scene_size(self) -> tuple:
         """Return the size of the scene
@@ -79,15 +241,26 @@ class Scene_2D:
         """
         return self.scene_size
     
+    def get_visible_chunks(self, x: int, y: int) -> set:
+        """Return the chunks potentially visible from a cell, or None if everything must be drawn
+
+        Args:
+            x (int): x position of the cell
+            y (int): y position of the cell
+
+        Returns:
+            set: chunks potentially visible from the cell, or None
+        """
+        if self.get_pvs() is None or x < 0 or y < 0 or x >= self.get_scene_size()[0] or y >= self.get_scene_size()[1]: return None
+        return set([(int(chunk[0]), int(chunk[1])) for chunk in np.argwhere(self.get_pvs()[x, y])])
+    
     def load_map(self, path: str) -> None:
         """Load a map from a file
 
         Args:
             path (str): path through the map
         """
-        lines = []
-        with open(path) as file:
-            lines = file.readlines()
+        lines = bs.read_file(path).decode("utf-8").replace("\r\n", "\n").splitlines(True)
         self.map_path = path
         pos_and_size = lines[0] # Load the first line (pos of the first part and size of the map)
         self.pos = (float(pos_and_size.split(" ")[0]), float(pos_and_size.split(" ")[1]))
@@ -99,6 +272,38 @@ class Scene_2D:
                     for i in range(len(line)):
                         if line[i] != "\n":
                             self.map[i][j - 1] = str(line[i])
+        self.pvs = None
+
+    def load_pvs(self, solid_parts: list, chunk_size: int = 4) -> np.ndarray:
+        """Load the potentially visible set of the map from the cache next to the map file, or build and cache it if the map changed
+
+        Args:
+            solid_parts (list): parts of the map which block the view
+            chunk_size (int, optional): size of a chunk in cells. Defaults to 4.
+
+        Returns:
+            np.ndarray: potentially visible set of the map
+        """
+        key = self.get_pvs_key(solid_parts, chunk_size)
+        path = self.get_map_path() + ".pvs"
+        self.pvs = None
+        self.pvs_chunk_size = chunk_size
+        if self.get_map_path() != "" and os.path.exists(path):
+            try:
+                with np.load(path) as cache:
+                    if str(cache["key"]) == key: self.pvs = cache["pvs"]
+            except (OSError, ValueError, KeyError):
+                print("Matix scene : Warning !! The PVS cache \"" + path + "\" can't be read, it will be rebuilt.")
+
+        if self.pvs is None:
+            self.pvs = self.build_pvs(solid_parts, chunk_size)
+            if self.get_map_path() != "":
+                try:
+                    with open(path, "wb") as file:
+                        np.savez_compressed(file, key = np.array(key), pvs = self.pvs)
+                except OSError:
+                    print("Matix scene : Warning !! The PVS cache \"" + path + "\" can't be written.")
+        return self.pvs
 
 class Physic_Scene:
     """Class representating a graphic scene (collection of physic object)
@@ -367,13 +572,29 @@ class Graphic_Scene(bs.Transform_Object):
     """Class representing a graphic scene (collection of graphic object)
     """
 
-    def __init__(self, advanced_struct: ad.Advanced_Struct, name: str) -> None:
+    def __init__(self, advanced_struct: ad.Advanced_Struct, name: str, instanced: bool = False) -> None:
         """Create a scene
+
+        Args:
+            advanced_struct (ad.Advanced_Struct): advanced structure of the game
+            name (str): name of the scene
+            instanced (bool, optional): render objects sharing a VBO and textures with one instanced draw call. Defaults to False.
         """
         super().__init__(advanced_struct.get_base_struct(), parent = None, position = (0, 0, 0), rotation = (0, 0, 0), scale = (1, 1, 1))
         self.advanced_struct = advanced_struct
+        self.culled_count = 0
+        self.culling = True
+        self.drawn_count = 0
+        self.instance_groups = {}
+        self.instance_groups_dirty = True
+        self.instanced = instanced
+        self.object_instance_groups = {}
         self.objects = {}
         self.name = name
+        self.pvs_chunks = {}
+        self.static_chunk_size = 16
+        self.static_vbos = []
+        self.visible_chunks = None
 
     def add_object(self, name: str, object: bs.Transform_Object):
         """Add an object to the scene
@@ -384,12 +605,111 @@ class Graphic_Scene(bs.Transform_Object):
         """
         if list(self.objects.keys()).count(name) == 0 and list(self.objects.values()).count(object) == 0:
             self.objects[name] = object
+            self.instance_groups_dirty = True
+
+    def bake_static_objects(self, names: list, chunks: dict = None) -> list:
+        """Bake objects which never move into a few world space VBOs, one per texture set and spatial chunk, and return the names of the batches
+
+        Args:
+            names (list): names of the objects to bake
+            chunks (dict, optional): potentially visible set chunk of each object, used instead of the spatial chunks. Defaults to None.
+
+        Returns:
+            list: names of the batches created
+        """
+        batches = {}
+        vertex_datas = {}
+        for name in names:
+            if list(self.objects.keys()).count(name) <= 0: continue
+            object = self.objects[name]
+            vbo = object.get_vbo()
+            offsets = vbo.get_format_offsets()
+            if list(offsets.keys()).count("in_position") <= 0 or list(offsets.keys()).count("in_texcoord_0") <= 0: continue
+            if list(vertex_datas.keys()).count(vbo) <= 0:
+                vertex_datas[vbo] = vbo.get_indexed_data()
+
+            # Move the unique vertices into the world and scale the texture coordinates for each face
+            data = vertex_datas[vbo][0].copy()
+            model_matrix = np.frombuffer(object.get_transform().get_model_matrix().to_bytes(), dtype="f4").reshape(4, 4)
+            position = offsets["in_position"]
+            data[:, position:position + 3] = data[:, position:position + 3] @ model_matrix[:3, :3] + model_matrix[3, :3]
+            texture_count_size = np.array(object.get_texture_count_size(), dtype="f4")
+            face = np.zeros(len(data), dtype=int)
+            if list(offsets.keys()).count("in_face") > 0:
+                face = np.clip(data[:, offsets["in_face"]].astype(int), 0, len(texture_count_size) - 1)
+            texcoord = offsets["in_texcoord_0"]
+            data[:, texcoord:texcoord + 2] *= texture_count_size[face]
+
+            chunk = ("world", math.floor(model_matrix[3, 0] / self.static_chunk_size), math.floor(model_matrix[3, 2] / self.static_chunk_size))
+            if chunks != None and list(chunks.keys()).count(name) > 0: chunk = ("pvs", chunks[name])
+            key = (chunk, vbo.get_format(), tuple(vbo.get_attributes()), object.get_vao().get_program().get_program_path(), object.texture[0], tuple(object.get_texture_layers()), isinstance(object, model.Cube_Object))
+            if list(batches.keys()).count(key) <= 0:
+                batches[key] = ([], [], [0])
+            batches[key][0].append(data)
+            batches[key][1].append(vertex_datas[vbo][1].astype("u4") + batches[key][2][0])
+            batches[key][2][0] += len(data)
+
+            # Remove the graphic object, the transform is kept for physic
+            self.release_object(object)
+            self.objects.pop(name)
+
+        created = []
+        for key in batches:
+            texture_layers = list(key[5])
+            vbo = model.Baked_VBO(self.get_base_struct(), np.vstack(batches[key][0]), list(key[2]), key[1], list(range(len(texture_layers))), np.concatenate(batches[key][1]))
+            self.static_vbos.append(vbo)
+            name = "static_batch_" + str(len(self.static_vbos) - 1)
+            transform = bs.Transform_Object(self.get_base_struct())
+            vao = self.get_advanced_struct().load_vao(vbo, key[3])
+            if key[6]:
+                object = model.Cube_Object(self.get_base_struct(), key[4], transform, vbo, scale_texture = False, shader_path = key[3], texture_count_size = [(1, 1)] * len(texture_layers), type = "static", vao = vao, texture_layers = texture_layers)
+            else:
+                object = model.Graphic_Object(self.get_base_struct(), key[4], transform, vbo, key[3], type = "static", vao = vao)
+            self.add_object(name, object)
+            if key[0][0] == "pvs": self.pvs_chunks[name] = key[0][1]
+            created.append(name)
+        self.instance_groups_dirty = True
+        return created
+
+    def build_instance_groups(self) -> None:
+        """Group the objects sharing a VBO, a program and textures into instance groups
+        """
+        self.destroy_instance_groups()
+        groups = {}
+        for object in self.objects.values():
+            key = object.get_instance_key()
+            if list(groups.keys()).count(key) <= 0:
+                groups[key] = []
+            groups[key].append(object)
+
+        for key in groups:
+            program = self.get_advanced_struct().load_program(key[1], {"INSTANCED": 1})
+            self.instance_groups[key] = model.Instance_Group(self.get_base_struct(), program, key[0], list(key[2]), groups[key])
+            for object in groups[key]:
+                self.object_instance_groups[object] = self.instance_groups[key]
+        self.instance_groups_dirty = False
 
     def destroy(self) -> None:
         """Destroy the scene
         """
+        self.destroy_instance_groups()
         for object in self.objects.items():
-            object[1].destroy()
+            self.release_object(object[1])
+        self.objects.clear()
+        for vbo in self.static_vbos:
+            vbo.destroy()
+        self.static_vbos.clear()
+        self.pvs_chunks.clear()
+
+    def destroy_instance_groups(self) -> None:
+        """Destroy the instance groups of the scene
+        """
+        for group in self.instance_groups.values():
+            group.destroy()
+            self.get_advanced_struct().release_program(group.get_program())
+        self.instance_groups.clear()
+        self.object_instance_groups.clear()
+        self.instance_groups_dirty = True
 
     def get_advanced_struct(self) -> ad.Advanced_Struct:
         """Return the advanced struct of the game
@@ -399,6 +719,30 @@ class Graphic_Scene(bs.Transform_Object):
         """
         return self.advanced_struct
     
+    def get_culled_count(self) -> int:
+        """Return the number of objects culled during the last render
+
+        Returns:
+            int: number of objects culled during the last render
+        """
+        return self.culled_count
+    
+    def get_drawn_count(self) -> int:
+        """Return the number of objects drawn during the last render
+
+        Returns:
+            int: number of objects drawn during the last render
+        """
+        return self.drawn_count
+    
+    def get_instance_groups(self) -> list:
+        """Return the instance groups of the scene
+
+        Returns:
+            list: instance groups of the scene
+        """
+        return list(self.instance_groups.values())
+    
     def get_name(self) -> str:
         """Return the name of the scene
 
@@ -406,7 +750,83 @@ class Graphic_Scene(bs.Transform_Object):
             str: name of the scene
         """
         return self.name
+    
+    def get_static_chunk_size(self) -> float:
+        """Return the size of a chunk of baked static objects, in world units
+
+        Returns:
+            float: size of a chunk of baked static objects
+        """
+        return self.static_chunk_size
+    
+    def get_visible_chunks(self) -> set:
+        """Return the potentially visible set chunks drawn, or None if every chunk is drawn
+
+        Returns:
+            set: potentially visible set chunks drawn, or None
+        """
+        return self.visible_chunks
+
+    def get_visible_objects(self) -> list:
+        """Return the objects whose box is into the view frustum of the camera and whose chunk is potentially visible, and count the culled and drawn objects
+
+        Returns:
+            list: objects into the view frustum of the camera
+        """
+        objects = list(self.objects.values())
+        if self.get_visible_chunks() != None:
+            objects = [self.objects[name] for name in self.objects if not name in self.pvs_chunks or self.pvs_chunks[name] in self.get_visible_chunks()]
+        if not self.use_culling() or len(objects) <= 0:
+            self.culled_count = len(self.objects) - len(objects)
+            self.drawn_count = len(objects)
+            return objects
+
+        # Test every box against the 6 planes at once
+        centers = np.zeros((len(objects), 3), dtype="f4")
+        extents = np.full((len(objects), 3), 1e30, dtype="f4")
+        for o in range(len(objects)):
+            bounds = objects[o].get_world_bounds()
+            if len(bounds) > 0:
+                centers[o] = (bounds[0] + bounds[1]) / 2.0
+                extents[o] = (bounds[1] - bounds[0]) / 2.0
+        planes = np.array([tuple(plane) for plane in self.get_base_struct().get_camera_value().get_frustum_planes()], dtype="f4")
+        distances = centers @ planes[:, :3].T + extents @ np.abs(planes[:, :3]).T + planes[:, 3]
+        visible = np.all(distances >= 0, axis = 1)
+
+        visible_objects = []
+        for o in range(len(objects)):
+            if visible[o]: visible_objects.append(objects[o])
+        self.culled_count = len(self.objects) - len(visible_objects)
+        self.drawn_count = len(visible_objects)
+        return visible_objects
+    
+    def is_instanced(self) -> bool:
+        """Return if the scene is rendered with instanced draw calls
+
+        Returns:
+            bool: if the scene is rendered with instanced draw calls
+        """
+        return self.instanced
       
+    def move_instance_object(self, object: model.Graphic_Object) -> None:
+        """Move an object from its instance group to the group of its current key (after a level of detail switch), without touching the other groups
+
+        Args:
+            object (model.Graphic_Object): object to move
+        """
+        key = object.get_instance_key()
+        if list(self.object_instance_groups.keys()).count(object) > 0:
+            if self.object_instance_groups[object] is self.instance_groups.get(key): return
+            self.object_instance_groups[object].remove_object(object)
+
+        # The group of a level is kept while empty, the objects often switch back
+        if list(self.instance_groups.keys()).count(key) <= 0:
+            program = self.get_advanced_struct().load_program(key[1], {"INSTANCED": 1})
+            self.instance_groups[key] = model.Instance_Group(self.get_base_struct(), program, key[0], list(key[2]), [object])
+        else:
+            self.instance_groups[key].add_object(object)
+        self.object_instance_groups[object] = self.instance_groups[key]
+
     def new_object(self, name: str, transform: bs.Transform_Object, type: str, scale_texture: bool = True, texture_path: str = "") -> bs.Transform_Object:
         """Create a new object into the scene and return it
 
@@ -426,42 +846,105 @@ class Graphic_Scene(bs.Transform_Object):
             else:
                 texture_path = "textures/unknow.png"
 
-        # Get/load textures
+        # Get/load textures (cubes use one texture array with a layer per face texture), decoded on the texture loader
         splitted = texture_path.split(".")
         texture = ""
         textures = self.get_advanced_struct().get_all_textures()
-        if splitted[-1] == "png" or splitted[-1] == "jpg":
+        if self.get_advanced_struct().get_graphic()[type] == "cube":
+            if list(textures.keys()).count((texture_path, "array")) <= 0:
+                textures[(texture_path, "array")] = model.Texture_Array(self.get_advanced_struct().get_base_struct(), texture_path, asynchronous = True)
+            texture = textures[(texture_path, "array")]
+        elif splitted[-1] == "png" or splitted[-1] == "jpg":
             if list(textures.keys()).count(texture_path) <= 0:
-                texture = [model.Texture(self.get_advanced_struct().get_base_struct(), texture_path)]
+                texture = [model.Texture(self.get_advanced_struct().get_base_struct(), texture_path, asynchronous = True)]
                 textures[texture_path] = texture[0]
             else:
-                texture = textures[texture]
+                texture = [textures[texture_path]]
         else:
             all_files = bs.get_all_files(texture_path)
             texture = []
             for file in all_files:
                 if list(textures.keys()).count(file) <= 0:
-                    tex = model.Texture(self.get_advanced_struct().get_base_struct(), file[0])
+                    tex = model.Texture(self.get_advanced_struct().get_base_struct(), file[0], asynchronous = True)
                     texture.append(tex)
                     textures[file] = tex
                 else:
                     texture.append(textures[file])
 
-        # Add the object into the scene
+        # Add the object into the scene, with a VAO shared between every object of this type
+        shader_path = "shaders/" + self.get_advanced_struct().get_graphic()[type]
+        vao = self.get_advanced_struct().load_vao(vbo, shader_path)
         if self.get_advanced_struct().get_graphic()[type] == "cube":
-            object = model.Cube_Object(self.get_advanced_struct().get_base_struct(), scale_texture = scale_texture, texture = texture, transform = transform, vbo = vbo, type = type)
-            self.add_object(name, object)
-            return object
+            object = model.Cube_Object(self.get_advanced_struct().get_base_struct(), scale_texture = scale_texture, shader_path = shader_path, texture = texture, transform = transform, vbo = vbo, type = type, vao = vao)
         else:
-            object = model.Graphic_Object(self.get_advanced_struct().get_base_struct(), texture = texture[0], transform = transform, vbo = vbo, type = type)
-            self.add_object(name, object)
-            return object
+            object = model.Graphic_Object(self.get_advanced_struct().get_base_struct(), shader_path = shader_path, texture = texture[0], transform = transform, vbo = vbo, type = type, vao = vao)
+
+        # Objects of a type with levels of detail share a VAO per level
+        if list(self.get_advanced_struct().get_all_lods().keys()).count(type) > 0:
+            lod_chain = self.get_advanced_struct().get_all_lods()[type]
+            lod_vaos = [vao]
+            for lod_vbo in lod_chain.get_vbos()[1:]:
+                lod_vaos.append(self.get_advanced_struct().load_vao(lod_vbo, shader_path))
+            object.set_lod(lod_chain, lod_vaos)
+        self.add_object(name, object)
+        return object
+
+    def release_object(self, object: model.Graphic_Object) -> None:
+        """Destroy a graphic object and release the shared VAOs it uses
+
+        Args:
+            object (model.Graphic_Object): object to release
+        """
+        object.destroy()
+        if object.has_shared_vao():
+            vaos = [object.get_vao()]
+            if object.get_lod_chain() != None: vaos = object.get_lod_vaos()
+            for vao in vaos:
+                self.get_advanced_struct().release_vao(vao)
 
     def render(self) -> None:
         """Render the scene
         """
-        for object in self.objects.items():
-            object[1].render()
+        self.get_base_struct().update_camera_buffer()
+        visible_objects = self.get_visible_objects()
+        camera_position = self.get_base_struct().get_camera_value().get_position()
+        for object in visible_objects: # Only the objects switching level of detail change of instance group
+            if object.update_lod(camera_position) and self.is_instanced() and not self.instance_groups_dirty: self.move_instance_object(object)
+        if self.is_instanced():
+            if self.instance_groups_dirty: self.build_instance_groups()
+            visible_objects = set(visible_objects)
+            for group in self.get_instance_groups():
+                group.render([object for object in group.get_objects() if object in visible_objects])
+            return
+        
+        for object in visible_objects:
+            object.render()
+
+    def set_instanced(self, instanced: bool) -> None:
+        """Change if the scene is rendered with instanced draw calls
+
+        Args:
+            instanced (bool): if the scene is rendered with instanced draw calls
+        """
+        if self.instanced != instanced:
+            self.instanced = instanced
+            self.destroy_instance_groups()
+
+    def set_culling(self, culling: bool) -> None:
+        """Change if the objects out of the view frustum are culled
+
+        Args:
+            culling (bool): if the objects out of the view frustum are culled
+        """
+        self.culling = culling
+
+    def set_visible_chunks(self, visible_chunks: set) -> None:
+        """Change the potentially visible set chunks drawn
+
+        Args:
+            visible_chunks (set): potentially visible set chunks drawn, or None to draw every chunk
+        """
+        self.visible_chunks = visible_chunks
 
     def update(self) -> None:
         """Update the scene
@@ -469,11 +952,19 @@ class Graphic_Scene(bs.Transform_Object):
         for object in self.objects.items():
             object[1].update()
 
+    def use_culling(self) -> bool:
+        """Return if the objects out of the view frustum are culled
+
+        Returns:
+            bool: if the objects out of the view frustum are culled
+        """
+        return self.culling
+
 class Scene(bs.Transform_Object):
     """Class representating a scene
     """
 
-    def __init__(self, advanced_struct: ad.Advanced_Struct, name: str, graphic: bool = True, physic: bool = True, scene_size: tuple = (25, 25)) -> None:
+    def __init__(self, advanced_struct: ad.Advanced_Struct, name: str, graphic: bool = True, physic: bool = True, scene_size: tuple = (25, 25), instanced: bool = False) -> None:
         """Create a scene
         """
         self.advanced_struct = advanced_struct
@@ -481,13 +972,14 @@ class Scene(bs.Transform_Object):
         self.player = None
         self.name = name
         self.objects = {}
+        self.scene_2d = None
         self.scene_size = scene_size
 
         # Create physic and graphic scene if necessary
         self.graphic = graphic
         self.physic = physic
         if self.use_graphic():
-            self.graphic_scene = Graphic_Scene(advanced_struct, name)
+            self.graphic_scene = Graphic_Scene(advanced_struct, name, instanced)
         if self.use_physic():
             self.physic_scene = Physic_Scene(advanced_struct, name, self.get_scene_size())
 
@@ -563,6 +1055,14 @@ class Scene(bs.Transform_Object):
         """
         return self.player
     
+    def get_scene_2d(self) -> Scene_2D:
+        """Return the 2d scene used to load the map, or None
+
+        Returns:
+            Scene_2D: 2d scene used to load the map, or None
+        """
+        return self.scene_2d
+    
     def get_scene_size(self) -> tuple:
         """Return the size of the scene
 
@@ -571,15 +1071,28 @@ class Scene(bs.Transform_Object):
         """
         return self.scene_size
       
-    def load_from_2d_scene(self, scene: Scene_2D, parts: dict) -> None:
+    def load_from_2d_scene(self, scene: Scene_2D, parts: dict, static_batch: bool = True, pvs: bool = True, greedy: bool = True, hidden_faces: bool = True) -> None:
         """Load the map from a 2d scene
 
         Args:
             scene (Scene_2D): 2d scene used to load the map
             parts (dict): parts used to make the scene
+            static_batch (bool, optional): bake the graphics of the parts into a few static VBOs. Defaults to True.
+            pvs (bool, optional): bake the parts by potentially visible set chunk and only draw the chunks visible from the cell of the player. Defaults to True.
+            greedy (bool, optional): draw the adjacent cells of the same cube part as one box (the other parts and the physic stay by cell). Defaults to True.
+            hidden_faces (bool, optional): do not draw the side faces of the cubes covered by neighbour cells. Defaults to True.
         """
+        self.scene_2d = scene
         self.set_position((scene.get_pos()[0], 0, scene.get_pos()[1]))
         if self.use_physic(): self.get_physic_scene().set_scene_size(scene.get_scene_size())
+        solid_parts = [part for part in parts if parts[part] != ""]
+        cube_parts = [part for part in solid_parts if parts[part].get_type() == "cube"] # Only the cubes can be stretched into boxes and hide the faces of their neighbours
+        chunk_size = 0
+        if self.use_graphic() and static_batch and pvs:
+            scene.load_pvs(solid_parts)
+            chunk_size = scene.get_pvs_chunk_size()
+
+        cells = {}
         for j in range(scene.get_scene_size()[1]): # Load each part of the map
             for i in range(scene.get_scene_size()[0]):
                 part = scene.get_part_at(i, j)
@@ -587,9 +1100,29 @@ class Scene(bs.Transform_Object):
                     if parts[part] != "":
                         name = str(i) + ";" + str(j)
                         type = parts[part].get_type()
-                        self.new_object(name, collision_type = "cube", parent = None, position = (1 * i, 3, 1 * j), scale = (1, 5, 1), texture_path = parts[part].get_texture_path(), type = type)
+                        merged = greedy and type == "cube"
+                        if hidden_faces and type == "cube" and not greedy: type = self.get_advanced_struct().load_cube_vbo(scene.get_hidden_faces(i, j, cube_parts))
+                        self.new_object(name, collision_type = "cube", graphic = not merged, parent = None, position = (1 * i, 3, 1 * j), scale = (1, 5, 1), texture_path = parts[part].get_texture_path(), type = type)
+                        if not merged: cells[name] = (i, j)
                 else: # If the part does not exist
                     print("Matix scene : Warning !! The part \"" + part + "\" into the map \"" + scene.get_map_path() + " \" for loading into the scene \"" + self.get_name() + "\" does not exist.")
+        if greedy and self.use_graphic(): # Merge the cells into boxes, not going out of the PVS chunks
+            # The boxes are static children of one node, out of the objects updated each frame
+            boxes = bs.Transform_Object(self.get_base_struct(), self)
+            for part, i, j, width, depth in scene.get_boxes(cube_parts, chunk_size):
+                name = "box;" + str(i) + ";" + str(j)
+                type = parts[part].get_type()
+                if hidden_faces and type == "cube": type = self.get_advanced_struct().load_cube_vbo(scene.get_hidden_faces(i, j, cube_parts, width, depth))
+                transform = bs.Transform_Object(self.get_base_struct(), boxes, (i + (width - 1) / 2, 3, j + (depth - 1) / 2), (0, 0, 0), (width, 5, depth))
+                self.get_graphic_scene().new_object(name, transform, type, texture_path = parts[part].get_texture_path())
+                cells[name] = (i, j)
+        if self.use_graphic() and static_batch:
+            chunks = None
+            if pvs:
+                chunks = {}
+                for name in cells:
+                    chunks[name] = (cells[name][0] // chunk_size, cells[name][1] // chunk_size)
+            self.get_graphic_scene().bake_static_objects(list(cells.keys()), chunks)
     
     def new_object(self, name: str, collision_type: str = "", collision_width: float = 0.3, graphic: bool = True, parent: bs.Transform_Object = None, physic: bool = True, position = (0, 0, 0), rotation = (0, 0, 0), scale = (1, 1, 1), scale_texture: bool = True, static: bool = True, texture_path: str = "", type: str = "cube") -> bs.Transform_Object:
         """Create a new object into the scene and return it
@@ -636,19 +1169,43 @@ class Scene(bs.Transform_Object):
     def update(self) -> None:
         """Update the scene
         """
+        profiler = self.get_base_struct().get_profiler()
+        profiler.begin("scene_update")
         self.get_player().handle_player_move()
         self.get_player().handle_player_rotation()
         for object in self.get_objects().values():
             object.update()
         if self.use_physic():
+            profiler.begin("physic_scene_update")
             self.get_physic_scene().update()
+            profiler.end("physic_scene_update")
+        self.update_world()
         if self.use_graphic():
+            self.update_visible_chunks()
+            profiler.begin("graphic_scene_update")
             self.get_graphic_scene().update()
+            profiler.end("graphic_scene_update")
+            profiler.begin("graphic_scene_render", True)
             self.get_graphic_scene().render()
+            profiler.end("graphic_scene_render")
         for object in self.get_objects().values():
             object.soft_reset()
+        profiler.begin("player_update", True)
         self.get_player().update()
+        profiler.end("player_update")
         self.get_player().soft_reset()
+        profiler.end("scene_update")
+
+    def update_visible_chunks(self) -> None:
+        """Draw only the chunks of the map potentially visible from the cell of the player
+        """
+        visible_chunks = None
+        if self.get_scene_2d() != None and self.get_player() != None:
+            position = self.get_player().get_absolute_position()
+            origin = self.get_absolute_position()
+            cell = (math.floor(position[0] - origin[0] + 0.5), math.floor(position[2] - origin[2] + 0.5))
+            visible_chunks = self.get_scene_2d().get_visible_chunks(cell[0], cell[1])
+        self.get_graphic_scene().set_visible_chunks(visible_chunks)
         
     def use_graphic(self) -> bool:
         """Return if the scene use graphic or not
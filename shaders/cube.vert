@@ -4,15 +4,42 @@ layout (location = 0) in vec2 in_texcoord_0;
 layout (location = 1) in vec3 in_position;
 layout (location = 2) in float in_face;
 
-out float face_0;
+#ifdef INSTANCED
+in mat4 in_model;
+in vec4 in_texture_count_size_01;
+in vec4 in_texture_count_size_23;
+in vec4 in_texture_count_size_45;
+in vec4 in_texture_count_size_67;
+in vec4 in_texture_layers_0123;
+in vec4 in_texture_layers_4567;
+#else
+uniform mat4 m_model;
+uniform vec2 u_texture_count_sizes[8];
+uniform float u_texture_layers[8];
+#endif
+
+flat out float layer_0;
 out vec2 uv_0;
 
-uniform mat4 m_model;
-uniform mat4 m_proj;
-uniform mat4 m_view;
+layout (std140) uniform Camera {
+    mat4 m_proj;
+    mat4 m_view;
+};
 
 void main() {
-    face_0 = in_face;
-    uv_0 = in_texcoord_0;
-    gl_Position = m_proj * m_view * m_model * vec4(in_position, 1.0);
+    int face = clamp(int(in_face), 0, 7);
+#ifdef INSTANCED
+    mat4 model = in_model;
+    vec2 texture_count_sizes[8] = vec2[8](in_texture_count_size_01.xy, in_texture_count_size_01.zw, in_texture_count_size_23.xy, in_texture_count_size_23.zw,
+                                          in_texture_count_size_45.xy, in_texture_count_size_45.zw, in_texture_count_size_67.xy, in_texture_count_size_67.zw);
+    float texture_layers[8] = float[8](in_texture_layers_0123.x, in_texture_layers_0123.y, in_texture_layers_0123.z, in_texture_layers_0123.w,
+                                       in_texture_layers_4567.x, in_texture_layers_4567.y, in_texture_layers_4567.z, in_texture_layers_4567.w);
+    layer_0 = texture_layers[face];
+    uv_0 = in_texcoord_0 * texture_count_sizes[face];
+#else
+    mat4 model = m_model;
+    layer_0 = u_texture_layers[face];
+    uv_0 = in_texcoord_0 * u_texture_count_sizes[face];
+#endif
+    gl_Position = m_proj * m_view * model * vec4(in_position, 1.0);
 }
\ No newline at end of file
@@ -3,13 +3,29 @@
 layout (location = 0) in vec2 in_texcoord_0;
 layout (location = 1) in vec3 in_position;
 
+#ifdef INSTANCED
+in mat4 in_model;
+in vec4 in_texture_count_size_01;
+#else
+uniform mat4 m_model;
+uniform vec2 u_texture_count_size_0;
+#endif
+
 out vec2 uv_0;
 
-uniform mat4 m_model;
-uniform mat4 m_proj;
-uniform mat4 m_view;
+layout (std140) uniform Camera {
+    mat4 m_proj;
+    mat4 m_view;
+};
 
 void main() {
-    uv_0 = in_texcoord_0;
-    gl_Position = m_proj * m_view * m_model * vec4(in_position, 1.0);
+#ifdef INSTANCED
+    mat4 model = in_model;
+    vec2 texture_count_size = in_texture_count_size_01.xy;
+#else
+    mat4 model = m_model;
+    vec2 texture_count_size = u_texture_count_size_0;
+#endif
+    uv_0 = in_texcoord_0 * texture_count_size;
+    gl_Position = m_proj * m_view * model * vec4(in_position, 1.0);
 }
\ No newline at end of file
@@ -0,0 +1,110 @@
+# vbo_benchmark.py
+# File used to compare the parser of the vbo text files with the previous one, written with Python loops
+
+# Import librairies
+import model
+import numpy as np
+import sys
+import time
+
+def generate_lines(triangle_count: int, seed: int = 0) -> list:
+    """Return the lines of a random vbo file
+
+    Args:
+        triangle_count (int): number of triangles into the file
+        seed (int, optional): seed of the random generator. Defaults to 0.
+
+    Returns:
+        list: lines of the vbo file
+    """
+    generator = np.random.default_rng(seed)
+    vertex_count = max(3, triangle_count // 2)
+    vertices = generator.uniform(-1, 1, vertex_count * 3)
+    indices = generator.integers(0, vertex_count, triangle_count * 3)
+    vertices_texture = generator.uniform(0, 1, vertex_count * 2)
+    faces = generator.integers(0, 6, triangle_count * 3)
+    return ["in_texcoord_0 in_position in_face", "2f 3f f", " ".join([str(v) for v in vertices.tolist()]), " ".join([str(i) for i in indices.tolist()]), " ".join([str(v) for v in vertices_texture.tolist()]), " ".join([str(i) for i in indices.tolist()]), " ".join([str(f) for f in faces.tolist()])]
+
+def parse_lines_loops(lines: list) -> tuple:
+    """Return the vertex data and the faces of the lines of a vbo file, with the parser using Python loops
+
+    Args:
+        lines (list): lines of the vbo file, without the line breaks
+
+    Returns:
+        tuple: vertex data (np.ndarray) and faces (list) of the file
+    """
+    face_content = []
+    indices = []
+    vertices = []
+    indices_temp = lines[3].split(" ")
+    vertices_temp = lines[2].split(" ")
+    for v in range(int(len(vertices_temp))):
+        vertices_temp[v] = float(vertices_temp[v])
+    for v in range(int(len(vertices_temp) / 3)):
+        vertices.append((vertices_temp[v * 3], vertices_temp[v * 3 + 1], vertices_temp[v * 3 + 2]))
+
+    for i in range(int(len(indices_temp))):
+        indices_temp[i] = int(indices_temp[i])
+    for v in range(int(len(indices_temp) / 3)):
+        indices.append((indices_temp[v * 3], indices_temp[v * 3 + 1], indices_temp[v * 3 + 2]))
+    vertex_data = model.VBO.get_data(vertices, indices)
+
+    indices_coord = []
+    vertices_coord = []
+    indices_coord_temp = lines[5].split(" ")
+    vertices_coord_temp = lines[4].split(" ")
+    for v in range(len(vertices_coord_temp)):
+        vertices_coord_temp[v] = float(vertices_coord_temp[v])
+    for v in range(int(len(vertices_coord_temp) / 2)):
+        vertices_coord.append((vertices_coord_temp[v * 2], vertices_coord_temp[v * 2 + 1]))
+
+    for i in range(len(indices_coord_temp)):
+        indices_coord_temp[i] = int(indices_coord_temp[i])
+    for i in range(int(len(indices_coord_temp) / 3)):
+        indices_coord.append((indices_coord_temp[i * 3], indices_coord_temp[i * 3 + 1], indices_coord_temp[i * 3 + 2]))
+    coord_data = model.VBO.get_data(vertices_coord, indices_coord)
+
+    if len(lines) > 6:
+        face = lines[6].split(" ")
+        for f in range(len(face)):
+            if face_content.count(int(face[f])) <= 0: face_content.append(int(face[f]))
+            face[f] = (int(face[f]),)
+        face = np.array(face, dtype="f4")
+
+        vertex_data = np.hstack([vertex_data, face])
+    vertex_data = np.hstack([coord_data, vertex_data])
+    return (vertex_data, face_content)
+
+def compare(name: str, lines: list, repeat: int = 1) -> bool:
+    """Print the time taken by both parsers on the lines of a vbo file, and return if they give the same bytes
+
+    Args:
+        name (str): name of the file, for the print
+        lines (list): lines of the vbo file
+        repeat (int, optional): number of parsing done by each parser (the best time is kept). Defaults to 1.
+
+    Returns:
+        bool: if both parsers give the same vertex data and faces
+    """
+    times = []
+    results = []
+    for parser in [parse_lines_loops, model.Loaded_VBO.parse_lines]:
+        best = -1
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = parser(lines)
+            duration = time.perf_counter() - start
+            if best < 0 or duration < best: best = duration
+        times.append(best)
+        results.append(result)
+    identical = results[0][0].dtype == results[1][0].dtype and results[0][0].shape == results[1][0].shape and results[0][0].tobytes() == results[1][0].tobytes() and results[0][1] == results[1][1]
+    print(name + " : loops " + str(round(times[0] * 1000, 3)) + " ms, numpy " + str(round(times[1] * 1000, 3)) + " ms, x" + str(round(times[0] / times[1], 1)) + ", identical " + str(identical))
+    return identical
+
+if __name__ == "__main__":
+    triangle_count = 1000000
+    if len(sys.argv) > 1: triangle_count = int(sys.argv[1])
+    identical = compare("vbos/polygon100.vbo", model.Loaded_VBO.read_lines("vbos/polygon100.vbo"), 20)
+    identical = compare("random mesh of " + str(triangle_count) + " triangles", generate_lines(triangle_count)) and identical
+    if not identical: sys.exit(1)
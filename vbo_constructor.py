@@ -2,7 +2,58 @@
 # File used to build complex VBO
 
 # Import librairies
+import base_struct as bs
 import math
+import model
+import numpy as np
+import os
+
+def cube(face: list = [0, 1, 2, 3, 4, 5], indices_start: int = 0, indices_texture_start: int = 0, position: tuple = (0, 0, 0), scale: tuple = (1, 1, 1), hidden_faces: list = None) -> str:
+    """Return the data for a cube
+
+    Args:
+        hidden_faces (list, optional): faces not emitted (0 : +z, 1 : +x, 2 : -z, 3 : -x, 4 : +y, 5 : -y), or None for none. Defaults to None.
+
+    Returns:
+        list: data for a cube
+    """
+    return get_form_text(cube_form(face, position, scale, hidden_faces), indices_start, indices_texture_start)
+
+def cube_form(face: list = [0, 1, 2, 3, 4, 5], position: tuple = (0, 0, 0), scale: tuple = (1, 1, 1), hidden_faces: list = None) -> tuple:
+    """Return the arrays of a cube, with indices starting from 0
+
+    Args:
+        face (list, optional): face of each side of the cube. Defaults to [0, 1, 2, 3, 4, 5].
+        position (tuple, optional): position of the center of the cube. Defaults to (0, 0, 0).
+        scale (tuple, optional): half size of the cube. Defaults to (1, 1, 1).
+        hidden_faces (list, optional): faces not emitted (0 : +z, 1 : +x, 2 : -z, 3 : -x, 4 : +y, 5 : -y), or None for none. Defaults to None.
+
+    Returns:
+        tuple: vertices, indices, texture vertices, texture indices and faces of the cube (see VBO_Constructor.add_form)
+    """
+    vertices = np.array([(-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
+                         (-1, 1, -1), (-1, -1, -1), (1, -1, -1), (1, 1, -1)], dtype="f8")
+    indices = np.array([(0, 2, 3), (0, 1, 2),
+                        (1, 7, 2), (1, 6, 7),
+                        (6, 5, 4), (4, 7, 6),
+                        (3, 4, 5), (3, 5, 0),
+                        (3, 7, 4), (3, 2, 7),
+                        (0, 6, 1), (0, 5, 6)], dtype="i8")
+    vertices_texture = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype="f8")
+    indices_texture = np.array([(0, 2, 3), (0, 1, 2),
+                                (0, 2, 3), (0, 1, 2),
+                                (0, 1, 2), (2, 3, 0),
+                                (2, 3, 0), (2, 0, 1),
+                                (0, 2, 3), (0, 1, 2),
+                                (3, 1, 2), (3, 0, 1)], dtype="i8")
+    vertices = vertices * np.array(scale, dtype="f8") + np.array(position, dtype="f8")
+
+    # Remove the two triangles of each hidden face
+    if hidden_faces is None: hidden_faces = []
+    shown = np.array([hidden_faces.count(f) <= 0 for f in range(6)])
+    faces = np.repeat(np.array(face, dtype="i8")[shown], 6)
+    shown = np.repeat(shown, 2)
+    return (vertices, indices[shown], vertices_texture, indices_texture[shown], faces)
 
 def get_data(vertices: list, indices: list) -> list:
     """Return a list of vertices ordered by indices
@@ -20,60 +71,31 @@ def get_data(vertices: list, indices: list) -> list:
             data.append(vertices[indice])
     return data
 
-def cube(face: list = [0, 1, 2, 3, 4, 5], indices_start: int = 0, indices_texture_start: int = 0, position: tuple = (0, 0, 0), scale: tuple = (1, 1, 1)) -> str:
-    """Return the data for a cube
+def get_form_text(form: tuple, indices_start: int = 0, indices_texture_start: int = 0) -> str:
+    """Return the lines of the vbo file format for the arrays of a form
+
+    Args:
+        form (tuple): vertices, indices, texture vertices, texture indices and faces (or None) of the form
+        indices_start (int, optional): value added to the indices. Defaults to 0.
+        indices_texture_start (int, optional): value added to the texture indices. Defaults to 0.
 
     Returns:
-        list: data for a cube
+        str: lines of the form, separated by line breaks
     """
-    to_return = ""
-    vertices = [(-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
-                (-1, 1, -1), (-1, -1, -1), (1, -1, -1), (1, 1, -1)]
-    indices = [(0, 2, 3), (0, 1, 2),
-                (1, 7, 2), (1, 6, 7),
-                (6, 5, 4), (4, 7, 6),
-                (3, 4, 5), (3, 5, 0),
-                (3, 7, 4), (3, 2, 7),
-                (0, 6, 1), (0, 5, 6)]
-    for i in range(len(indices)): indices[i] = (indices[i][0] + indices_start, indices[i][1] + indices_start, indices[i][2] + indices_start)
-    
-    vertices_texture = [(0, 0), (1, 0), (1, 1), (0, 1)]
-    indices_texture = [(0, 2, 3), (0, 1, 2),
-                       (0, 2, 3), (0, 1, 2),
-                       (0, 1, 2), (2, 3, 0),
-                       (2, 3, 0), (2, 0, 1),
-                       (0, 2, 3), (0, 1, 2),
-                       (3, 1, 2), (3, 0, 1)]
-    for i in range(len(indices_texture)): indices_texture[i] = (indices_texture[i][0] + indices_texture_start, indices_texture[i][1] + indices_texture_start, indices_texture[i][2] + indices_texture_start)
-    
-    for v in range(len(vertices)):
-        vertices[v] = (vertices[v][0] * scale[0] + position[0], vertices[v][1] * scale[1] + position[1], vertices[v][2] * scale[2] + position[2])
-    
-    faces = []
-    for i in face:
-        for _ in range(6):
-            faces.append((i,))
-
-    for v in vertices:
-        for g in v:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-    for i in indices:
-        for g in i:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-    for v in vertices_texture:
-        for g in v:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-    for i in indices_texture:
-        for g in i:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-    for i in faces:
-        for g in i:
-            to_return += str(g) + " "
-    return to_return[:-1]
+    lines = [get_numbers_text(form[0]), get_numbers_text(np.asarray(form[1]) + indices_start), get_numbers_text(form[2]), get_numbers_text(np.asarray(form[3]) + indices_texture_start)]
+    if form[4] is not None: lines.append(get_numbers_text(form[4]))
+    return "\n".join(lines)
+
+def get_numbers_text(numbers: np.ndarray) -> str:
+    """Return the numbers of an array separated by spaces
+
+    Args:
+        numbers (np.ndarray): numbers to write
+
+    Returns:
+        str: numbers separated by spaces
+    """
+    return " ".join([str(number) for number in np.asarray(numbers).reshape(-1).tolist()])
 
 def points_polygon(diagonal: float, edge: int = 4, position: tuple = (0, 0, 0)) -> list:
     """Return a list of the point into a polygon
@@ -95,7 +117,19 @@ def polygon(diagonal: float, edge: int = 4, position: tuple = (0, 0, 0)) -> str:
     Returns:
         list: data for a polygon
     """
-    to_return = ""
+    return get_form_text(polygon_form(diagonal, edge, position))
+
+def polygon_form(diagonal: float, edge: int = 4, position: tuple = (0, 0, 0)) -> tuple:
+    """Return the arrays of a polygon, with indices starting from 0
+
+    Args:
+        diagonal (float): distance between the center and the points of the polygon
+        edge (int, optional): number of edges of the polygon. Defaults to 4.
+        position (tuple, optional): position of the center of the polygon. Defaults to (0, 0, 0).
+
+    Returns:
+        tuple: vertices, indices, texture vertices, texture indices and faces (None) of the polygon (see VBO_Constructor.add_form)
+    """
     vertices = points_polygon(diagonal, edge, position)
 
     indices = []
@@ -113,24 +147,7 @@ def polygon(diagonal: float, edge: int = 4, position: tuple = (0, 0, 0)) -> str:
         indices_texture.append((0, i + 1, i + 2))
     indices_texture.append((0, len(vertices_texture) - 1, 1))
 
-    for v in vertices:
-        for g in v:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-    for i in indices:
-        for g in i:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-    for v in vertices_texture:
-        for g in v:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-    for i in indices_texture:
-        for g in i:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-
-    return to_return[:-1]
+    return (np.array(vertices, dtype="f8"), np.array(indices, dtype="i8"), np.array(vertices_texture, dtype="f8"), np.array(indices_texture, dtype="i8"), None)
 
 def polygon_3d(diagonal: float, edge: int = 4, inversed: bool = False, scale: tuple = (1, 1, 1)) -> str:
     """Return the data for a 3d polygon
@@ -138,9 +155,20 @@ def polygon_3d(diagonal: float, edge: int = 4, inversed: bool = False, scale: tu
     Returns:
         list: data for a 3d polygon
     """
+    return get_form_text(polygon_3d_form(diagonal, edge))
+
+def polygon_3d_form(diagonal: float, edge: int = 4) -> tuple:
+    """Return the arrays of a 3d polygon (a prism between z = -1 and z = 1), with indices starting from 0
+
+    Args:
+        diagonal (float): distance between the center and the points of the faces
+        edge (int, optional): number of edges of the faces. Defaults to 4.
+
+    Returns:
+        tuple: vertices, indices, texture vertices, texture indices and faces of the 3d polygon (see VBO_Constructor.add_form)
+    """
     use_mid = True
 
-    to_return = ""
     vertices = points_polygon(diagonal, edge, position = (0, 0, 1.0)) # Get vertices of the first face of the polygon
     indices = []
     for i in range(edge - 1): # Get the indices of every points in the first face
@@ -211,98 +239,93 @@ def polygon_3d(diagonal: float, edge: int = 4, inversed: bool = False, scale: tu
     for i in range(len(indices_2) * 3):
         faces_2.append((1,))
 
-    for v in vertices:
-        for g in v:
-            to_return += str(g) + " "
-    for v in vertices_2:
-        for g in v:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-    for i in indices:
-        for g in i:
-            to_return += str(g) + " "
-    for i in indices_2:
-        for g in i:
-            to_return += str(g) + " "
-    if use_mid:
-        for i in indices_mid:
-            for g in i:
-                to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-
-    for v in vertices_texture:
-        for g in v:
-            to_return += str(g) + " "
-    for v in vertices_texture_2:
-        for g in v:
-            to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-    for i in indices_texture:
-        for g in i:
-            to_return += str(g) + " "
-    for i in indices_texture_2:
-        for g in i:
-            to_return += str(g) + " "
-    if use_mid:
-        for i in indices_texture_mid:
-            for g in i:
-                to_return += str(g) + " "
-    to_return = to_return[:-1] + "\n"
-
-    for f in faces:
-        to_return += str(f[0]) + " "
-    for f in faces_2:
-        to_return += str(f[0]) + " "
+    vertices = np.array(vertices + vertices_2, dtype="f8")
+    vertices_texture = np.array(vertices_texture + vertices_texture_2, dtype="f8")
+    indices = indices + indices_2
+    indices_texture = indices_texture + indices_texture_2
+    faces = faces + faces_2
     if use_mid:
-        for f in faces_mid:
-            to_return += str(f[0]) + " "
-
-    return to_return[:-1]
+        indices = indices + indices_mid
+        indices_texture = indices_texture + indices_texture_mid
+        faces = faces + faces_mid
+    return (vertices, np.array(indices, dtype="i8"), vertices_texture, np.array(indices_texture, dtype="i8"), np.array(faces, dtype="i8").reshape(-1))
 
 class VBO_Constructor:
-    """Class representating a easy VBO constructor
+    """Class representating a easy VBO constructor, storing the forms into arrays
     """
 
     def __init__(self, attributes: str, format: str) -> None:
         """Create an easy VBO constructor
         """
         self.attributes = attributes
+        self.faces = []
         self.format = format
-        self.vertices = ""
-        self.indices = ""
-        self.vertices_texture = ""
-        self.indices_texture = ""
-        self.faces = ""
-
-    def add_form(self, parts: list) -> None:
+        self.indices = []
+        self.indices_texture = []
+        self.vertex_count = 0
+        self.vertex_texture_count = 0
+        self.vertices = []
+        self.vertices_texture = []
+
+    def add_form(self, parts) -> None:
         """Add a form to the constructor
 
         Args:
-            parts (list): form to add
+            parts (tuple | list): arrays of the form returned by a form function (vertices, indices, texture vertices, texture indices and faces or None), whose indices start from 0 and are moved after the previous forms,
+            or lines of the form returned by a text function (cube, polygon, polygon_3d), whose indices are already moved
+        """
+        indices_start, indices_texture_start = self.vertex_count, self.vertex_texture_count
+        if not isinstance(parts, tuple): # Lines of the vbo file format
+            faces = None
+            if len(parts) > 4: faces = np.fromstring(parts[4], dtype="i8", sep=" ")
+            parts = (model.Loaded_VBO.parse_numbers(parts[0], "f8", 3), model.Loaded_VBO.parse_numbers(parts[1], "i8", 3), model.Loaded_VBO.parse_numbers(parts[2], "f8", 2), model.Loaded_VBO.parse_numbers(parts[3], "i8", 3), faces)
+            indices_start, indices_texture_start = 0, 0
+
+        self.vertices.append(np.asarray(parts[0], dtype="f8").reshape(-1, 3))
+        self.indices.append(np.asarray(parts[1], dtype="i8").reshape(-1, 3) + indices_start)
+        self.vertices_texture.append(np.asarray(parts[2], dtype="f8").reshape(-1, 2))
+        self.indices_texture.append(np.asarray(parts[3], dtype="i8").reshape(-1, 3) + indices_texture_start)
+        if parts[4] is not None: self.faces.append(np.asarray(parts[4], dtype="i8").reshape(-1))
+        self.vertex_count += len(self.vertices[-1])
+        self.vertex_texture_count += len(self.vertices_texture[-1])
+
+    def get_arrays(self) -> tuple:
+        """Return the arrays of every form of the constructor
+
+        Returns:
+            tuple: vertices, indices, texture vertices, texture indices and faces (or None if no form has faces)
         """
-        if self.vertices == "":
-            self.vertices += parts[0]
-        else:
-            self.vertices += " " + parts[0]
-        if self.indices == "":
-            self.indices += parts[1]
-        else:
-            self.indices += " " + parts[1]
-        
-        if self.vertices_texture == "":
-            self.vertices_texture += parts[2]
-        else:
-            self.vertices_texture += " " + parts[2]
-        if self.indices_texture == "":
-            self.indices_texture += parts[3]
-        else:
-            self.indices_texture += " " + parts[3]
-
-        if len(parts) > 4:
-            if self.faces == "":
-                self.faces += parts[4]
-            else:
-                self.faces += " " + parts[4]
+        faces = None
+        if len(self.faces) > 0: faces = np.concatenate(self.faces)
+        return (np.concatenate(self.vertices + [np.zeros((0, 3))]), np.concatenate(self.indices + [np.zeros((0, 3), dtype="i8")]), np.concatenate(self.vertices_texture + [np.zeros((0, 2))]), np.concatenate(self.indices_texture + [np.zeros((0, 3), dtype="i8")]), faces)
+
+    def get_content(self) -> tuple:
+        """Return the content of the VBO, as read by model.Loaded_VBO
+
+        Returns:
+            tuple: attributes (list), format (str), vertex data (np.ndarray) and faces (list) of the VBO
+        """
+        vertex_data, face_content = model.Loaded_VBO.expand(*self.get_arrays())
+        return (self.attributes.split(" "), self.format, vertex_data, face_content)
+
+    def get_lines(self) -> list:
+        """Return the lines of the vbo file, as read by model.Loaded_VBO
+
+        Returns:
+            list: lines of the vbo file
+        """
+        return (self.attributes + "\n" + self.format + "\n" + self.join()).splitlines()
+
+    def get_vbo(self, base_struct) -> model.Loaded_VBO:
+        """Return a VBO of the constructor, uploaded without writing or parsing any file
+
+        Args:
+            base_struct (bs.Base_Struct): base struct of the game
+
+        Returns:
+            model.Loaded_VBO: VBO of the constructor
+        """
+        return model.Loaded_VBO(base_struct, "", content = self.get_content())
 
     def join(self) -> str:
         """Return the vbo content
@@ -310,10 +333,7 @@ class VBO_Constructor:
         Returns:
             str: vbo content
         """
-        to_return = self.vertices + "\n" + self.indices + "\n" + self.vertices_texture + "\n" + self.indices_texture
-        if self.faces != []:
-            to_return += "\n" + self.faces
-        return to_return
+        return get_form_text(self.get_arrays())
     
     def save(self, path: str) -> None:
         """Save the vbo into a file
@@ -326,42 +346,104 @@ class VBO_Constructor:
         file.write(self.join())
         file.close()
 
+def convert_vbos(directory: str = "vbos") -> list:
+    """Convert every vbo text file of a directory into a binary mesh file (see model.Binary_VBO), loaded instead of the text file
+
+    Args:
+        directory (str, optional): directory of the vbo files. Defaults to "vbos".
+
+    Returns:
+        list: paths of the binary mesh files
+    """
+    binary_paths = []
+    for file in sorted(os.listdir(directory)):
+        if os.path.splitext(file)[1] == ".vbo":
+            binary_paths.append(model.Binary_VBO.convert(directory + "/" + file))
+    return binary_paths
+
+def build_pack(path: str = "assets.pack", sources: list = ["maps", "shaders", "textures", "vbos"]) -> int:
+    """Pack the assets of the game into one file (see base_struct.Asset_Pack), read before the disk when the game starts
+
+    Args:
+        path (str, optional): path of the pack. Defaults to "assets.pack".
+        sources (list, optional): files and directories to pack. Defaults to ["maps", "shaders", "textures", "vbos"].
+
+    Returns:
+        int: number of packed files
+    """
+    return bs.Asset_Pack.build(path, sources, excluded_extensions = (".pvs",))
+
+def chair_constructor() -> VBO_Constructor:
+    """Return a constructor containing a simple chair
+
+    Returns:
+        VBO_Constructor: constructor containing the chair
+    """
+    constructor = VBO_Constructor("in_texcoord_0 in_position in_face", "2f 3f f")
+    constructor.add_form(cube_form(face = [2, 2, 2, 2, 0, 0], position = (0, 0.1, 0), scale = (0.7, 0.1, 0.7)))
+    constructor.add_form(cube_form(face = [1, 1, 1, 1, 3, 3], position = (-0.5, -0.5, -0.5), scale = (0.1, 0.5, 0.1)))
+    constructor.add_form(cube_form(face = [1, 1, 1, 1, 3, 3], position = (-0.5, -0.5, 0.5), scale = (0.1, 0.5, 0.1)))
+    constructor.add_form(cube_form(face = [1, 1, 1, 1, 3, 3], position = (0.5, -0.5, -0.5), scale = (0.1, 0.5, 0.1)))
+    constructor.add_form(cube_form(face = [1, 1, 1, 1, 3, 3], position = (0.5, -0.5, 0.5), scale = (0.1, 0.5, 0.1)))
+    constructor.add_form(cube_form(face = [4, 1, 1, 1, 3, 3], position = (0.0, 0.6, -0.6), scale = (0.7, 0.4, 0.1)))
+    return constructor
+
 def construct_chair() -> None:
     """Construct a simple chair
     """
-    constructor = VBO_Constructor("in_texcoord_0 in_position", "2f 3f")
-    constructor.add_form(cube(face = [2, 2, 2, 2, 0, 0], position = (0, 0.1, 0), scale = (0.7, 0.1, 0.7)).split("\n"))
-    constructor.add_form(cube(face = [1, 1, 1, 1, 3, 3], indices_start = 8, position = (-0.5, -0.5, -0.5), scale = (0.1, 0.5, 0.1)).split("\n"))
-    constructor.add_form(cube(face = [1, 1, 1, 1, 3, 3], indices_start = 16, position = (-0.5, -0.5, 0.5), scale = (0.1, 0.5, 0.1)).split("\n"))
-    constructor.add_form(cube(face = [1, 1, 1, 1, 3, 3], indices_start = 24, position = (0.5, -0.5, -0.5), scale = (0.1, 0.5, 0.1)).split("\n"))
-    constructor.add_form(cube(face = [1, 1, 1, 1, 3, 3], indices_start = 32, position = (0.5, -0.5, 0.5), scale = (0.1, 0.5, 0.1)).split("\n"))
-    constructor.add_form(cube(face = [4, 1, 1, 1, 3, 3], indices_start = 40, position = (0.0, 0.6, -0.6), scale = (0.7, 0.4, 0.1)).split("\n"))
-    constructor.save("vbos/chair.vbo")
+    chair_constructor().save("vbos/chair.vbo")
 
 def construct_polygon(diagonal: float, edge: int = 4) -> None:
     """Construct a simple polygon
     """
-    constructor = VBO_Constructor("in_texcoord_0 in_position", "2f 3f")
-    constructor.add_form(polygon(diagonal, edge).split("\n"))
-    constructor.save("vbos/polygon" + str(edge) + ".vbo")
+    polygon_constructor(diagonal, edge).save("vbos/polygon" + str(edge) + ".vbo")
 
 def construct_polygon_3d(diagonal: float, edge: int = 4) -> None:
     """Construct a simple polygon
     """
-    constructor = VBO_Constructor("in_texcoord_0 in_position in_face", "2f 3f f")
-    constructor.add_form(polygon_3d(diagonal, edge).split("\n"))
-    constructor.save("vbos/polygon_3d" + str(edge) + ".vbo")
+    polygon_3d_constructor(diagonal, edge).save("vbos/polygon_3d" + str(edge) + ".vbo")
 
 def construct_table() -> None:
     """Construct a simple table
     """
+    table_constructor().save("vbos/table.vbo")
+
+def polygon_constructor(diagonal: float, edge: int = 4) -> VBO_Constructor:
+    """Return a constructor containing a simple polygon
+
+    Returns:
+        VBO_Constructor: constructor containing the polygon
+    """
+    constructor = VBO_Constructor("in_texcoord_0 in_position", "2f 3f")
+    constructor.add_form(polygon_form(diagonal, edge))
+    return constructor
+
+def polygon_3d_constructor(diagonal: float, edge: int = 4) -> VBO_Constructor:
+    """Return a constructor containing a simple 3d polygon
+
+    Returns:
+        VBO_Constructor: constructor containing the 3d polygon
+    """
+    constructor = VBO_Constructor("in_texcoord_0 in_position in_face", "2f 3f f")
+    constructor.add_form(polygon_3d_form(diagonal, edge))
+    return constructor
+
+def table_constructor() -> VBO_Constructor:
+    """Return a constructor containing a simple table
+
+    Returns:
+        VBO_Constructor: constructor containing the table
+    """
     constructor = VBO_Constructor("in_texcoord_0 in_position in_face", "2f 3f f")
-    constructor.add_form(cube(face = [2, 2, 2, 2, 0, 0], position = (0, 0.9, 0), scale = (1, 0.1, 1)).split("\n"))
-    constructor.add_form(cube(face = [1, 1, 1, 1, 3, 3], indices_start = 8, position = (-0.9, -0.1, -0.9), scale = (0.1, 0.9, 0.1)).split("\n"))
-    constructor.add_form(cube(face = [1, 1, 1, 1, 3, 3], indices_start = 16, position = (-0.9, -0.1, 0.9), scale = (0.1, 0.9, 0.1)).split("\n"))
-    constructor.add_form(cube(face = [1, 1, 1, 1, 3, 3], indices_start = 24, position = (0.9, -0.1, -0.9), scale = (0.1, 0.9, 0.1)).split("\n"))
-    constructor.add_form(cube(face = [1, 1, 1, 1, 3, 3], indices_start = 32, position = (0.9, -0.1, 0.9), scale = (0.1, 0.9, 0.1)).split("\n"))
-    constructor.save("vbos/table.vbo")
-
-construct_polygon(1, 20)
-construct_polygon_3d(1, 20)
\ No newline at end of file
+    constructor.add_form(cube_form(face = [2, 2, 2, 2, 0, 0], position = (0, 0.9, 0), scale = (1, 0.1, 1)))
+    constructor.add_form(cube_form(face = [1, 1, 1, 1, 3, 3], position = (-0.9, -0.1, -0.9), scale = (0.1, 0.9, 0.1)))
+    constructor.add_form(cube_form(face = [1, 1, 1, 1, 3, 3], position = (-0.9, -0.1, 0.9), scale = (0.1, 0.9, 0.1)))
+    constructor.add_form(cube_form(face = [1, 1, 1, 1, 3, 3], position = (0.9, -0.1, -0.9), scale = (0.1, 0.9, 0.1)))
+    constructor.add_form(cube_form(face = [1, 1, 1, 1, 3, 3], position = (0.9, -0.1, 0.9), scale = (0.1, 0.9, 0.1)))
+    return constructor
+
+if __name__ == "__main__":
+    construct_polygon(1, 20)
+    construct_polygon_3d(1, 20)
+    convert_vbos()
+    build_pack()
\ No newline at end of file